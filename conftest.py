@@ -1,5 +1,6 @@
+# step 모듈은 pytest-bdd가 스텝을 모듈 네임스페이스의 fixture로 등록하므로 plugin으로 로드해야 수집됨
+# (pytest_bdd 자체는 pytest11 entry point로 자동 로드되므로 목록에서 제외)
 pytest_plugins = [
-    "pytest_bdd",
     "steps.home_steps",
     "steps.login_steps",
     "steps.srp_lp_steps",
@@ -13,15 +14,20 @@ pytest_plugins = [
 ]
 
 
-import shutil
 import re
+import functools
+import weakref
+import mimetypes
+import queue
+import threading
+import traceback
+from collections import deque
+from contextlib import contextmanager
 # from src.gtas_python_core_v2.gtas_python_core_vault_v2 import Vault
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page
+from playwright.sync_api import sync_playwright, BrowserContext
 import os
 import sys
 import pytest
-import requests
-from datetime import datetime
 from pathlib import Path
 import json
 import time
@@ -30,15 +36,18 @@ from typing import Any, Dict, FrozenSet, Iterable, Optional
 from dotenv import load_dotenv  # type: ignore
 
 # .env 파일 로드 (프로젝트 루트 기준)
+# 이미 로드된 환경(xdist 워커는 마스터 환경 상속)이면 다시 파싱하지 않음
 project_root = Path(__file__).parent
 env_path = project_root / '.env'
-load_dotenv(dotenv_path=env_path)
+if not os.getenv("DOTENV_LOADED"):
+    load_dotenv(dotenv_path=env_path, override=False)
+    os.environ["DOTENV_LOADED"] = "1"
 
 
 
-# 로깅 설정
+# 로깅 설정 (기본 INFO, 상세 디버깅 시 LOG_LEVEL=DEBUG)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
@@ -97,7 +106,14 @@ class BrowserSession:
         Args:
             page: fixture에서 생성한 기본 page (seed 역할)
         """
-        self._page_stack = [page]  # page stack으로 전환 이력 관리
+        self._page_stack = deque([page])  # page stack으로 전환 이력 관리
+        # close 이벤트로 갱신되는 닫힌 페이지 집합 (매번 page.is_closed() 호출 대신 로컬 조회)
+        self._closed_pages = weakref.WeakSet()
+        self._watch_close(page)
+    
+    def _watch_close(self, page):
+        """page 종료 시 _closed_pages에 기록되도록 close 이벤트 등록"""
+        page.on("close", self._closed_pages.add)
     
     @property
     def page(self):
@@ -120,23 +136,29 @@ class BrowserSession:
             logger.warning("BrowserSession: None 페이지로 전환 시도 실패")
             return False
         
+        # 이미 감시 중인 페이지는 로컬 집합만 확인, 처음 보는 페이지만 is_closed() 조회
+        watched = any(p is page for p in self._page_stack)
         try:
-            if page.is_closed():
-                logger.warning("BrowserSession: 이미 닫힌 페이지로 전환 시도 실패")
-                return False
-            
-            # 페이지 유효성 검증
+            closed = page in self._closed_pages or (not watched and page.is_closed())
+        except Exception as e:
+            logger.error(f"BrowserSession: 페이지 전환 중 오류 발생: {e}")
+            return False
+        if closed:
+            logger.warning("BrowserSession: 이미 닫힌 페이지로 전환 시도 실패")
+            return False
+        
+        self._page_stack.append(page)
+        if not watched:
+            self._watch_close(page)
+        
+        # URL은 로그 출력 시에만 조회
+        if logger.isEnabledFor(logging.INFO):
             current_url = page.url
             if not current_url or current_url == "about:blank":
-                logger.warning(f"BrowserSession: 유효하지 않은 URL의 페이지: {current_url}")
                 # about:blank는 잠시 후 로드될 수 있으므로 경고만
-            
-            self._page_stack.append(page)
+                logger.warning(f"BrowserSession: 유효하지 않은 URL의 페이지: {current_url}")
             logger.info(f"BrowserSession: 새 페이지로 전환 - URL: {current_url} (stack depth: {len(self._page_stack)})")
-            return True
-        except Exception as e:
-            logger.error(f"BrowserSession: 페이지 전환 중 오류 발생: {e}")
-            return False
+        return True
     
     def restore(self):
         """
@@ -147,16 +169,34 @@ class BrowserSession:
         """
         if len(self._page_stack) > 1:
             # 현재 페이지를 pop하여 이전 페이지로 복귀
-            self._page_stack.pop()
-            logger.info(f"BrowserSession: 이전 페이지로 복귀 - 현재 URL: {self.page.url} (stack depth: {len(self._page_stack)})")
+            popped = self._page_stack.pop()
+            # 더 이상 사용하지 않는 탭은 즉시 닫아 렌더러/JS 힙 해제 (스택에 같은 page가 남아 있으면 유지)
+            if not any(p is popped for p in self._page_stack):
+                self._close_page(popped)
+            del popped
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"BrowserSession: 이전 페이지로 복귀 - 현재 URL: {self.page.url} (stack depth: {len(self._page_stack)})")
             return True
         else:
             logger.warning("BrowserSession: 복귀할 이전 페이지가 없음")
             return False
     
+    def _close_page(self, page):
+        if page in self._closed_pages:
+            return
+        try:
+            page.close()
+        except Exception as e:
+            logger.warning(f"BrowserSession: 페이지 닫기 실패 (무시됨): {e}")
+    
+    def close(self):
+        """page stack을 비우고 남은 페이지를 모두 닫음 (시나리오 종료 시 호출)"""
+        while self._page_stack:
+            self._close_page(self._page_stack.pop())
+    
     def get_page_stack(self):
         """
-        디버깅용: 현재 page stack의 URL 리스트 반환
+        디버깅용: 현재 page stack의 URL 리스트 반환 (호출 시점에만 URL 조회)
         
         Returns:
             list: page stack의 URL 리스트
@@ -175,27 +215,33 @@ def pw():
 # ------------------------
 # :둘: 브라우저 fixture
 # ------------------------
+def _browser_launch_options():
+    """
+    브라우저 실행 옵션
+    HEADED=1/0 으로 명시하면 그대로 따르고, 미지정 시 CI 환경(CI 변수 존재)에서만 headless로 실행
+    """
+    headed_env = os.getenv("HEADED")
+    headless = (headed_env != "1") if headed_env is not None else bool(os.getenv("CI"))
+    args = ["--disable-dev-shm-usage", "--disable-gpu"] if headless else []
+    return dict(channel="chrome", headless=headless, args=args)
+
+
 @pytest.fixture(scope="session")
 def browser(pw):
     """세션 단위 브라우저"""
-    browser = pw.chromium.launch(channel="chrome", headless=False)
+    browser = pw.chromium.launch(**_browser_launch_options())
     yield browser
     browser.close()
 # ------------------------
-# :셋: Context fixture (각 시나리오마다 독립적으로 생성) — 모바일 환경
+# :셋: Context fixture (세션 단위 공유 + 시나리오 단위 정리) — 모바일 환경
 # ------------------------
 # 뷰포트·UA는 config.json의 mobile_profile로 선택 (_get_mobile_emulation, app_config 로드 이후 정의)
 
 
-@pytest.fixture(scope="function")
-def context(browser, ensure_login_state):
-    """
-    브라우저 컨텍스트 fixture (모바일 뷰포트)
-    각 시나리오마다 독립적으로 생성되고 종료 시 정리됩니다.
-    """
+def _mobile_context_options():
+    """모바일 뷰포트 컨텍스트 공통 옵션 (new_context / launch_persistent_context 공용)"""
     viewport, user_agent = _get_mobile_emulation()
-    ctx = browser.new_context(
-        storage_state=ensure_login_state,
+    return dict(
         viewport=viewport,
         screen=viewport,              # 추가
         user_agent=user_agent,
@@ -205,51 +251,281 @@ def context(browser, ensure_login_state):
         locale="ko-KR",
         timezone_id="Asia/Seoul",
     )
+
+
+# DISABLE_ANIMATIONS=0 이 아니면 애니메이션/트랜지션/스무스 스크롤을 사실상 즉시 완료되도록 단축
+# 0s로 두면 transitionend/animationend 이벤트가 발생하지 않아 캐러셀 등이 멈출 수 있으므로 0.001s 사용
+DISABLE_ANIMATIONS = os.getenv("DISABLE_ANIMATIONS", "1") != "0"
+_DISABLE_ANIMATIONS_SCRIPT = """(() => {
+    const css = '*, *::before, *::after { animation-duration: 0.001s !important; animation-delay: 0s !important;'
+        + ' transition-duration: 0.001s !important; transition-delay: 0s !important; scroll-behavior: auto !important; }';
+    const inject = () => {
+        const style = document.createElement('style');
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    };
+    if (document.documentElement) inject();
+    else document.addEventListener('DOMContentLoaded', inject, { once: true });
+})();"""
+
+
+def _prepare_scenario_context(ctx):
+    """시나리오 컨텍스트 공통 설정 (리소스 차단, 애니메이션 단축)"""
+    _apply_resource_blocking(ctx)
+    if DISABLE_ANIMATIONS:
+        ctx.add_init_script(_DISABLE_ANIMATIONS_SCRIPT)
+
+
+def _new_mobile_context(browser, storage_state):
+    """로그인 state를 적용한 모바일 뷰포트 컨텍스트 생성"""
+    ctx = browser.new_context(storage_state=storage_state, **_mobile_context_options())
+    _prepare_scenario_context(ctx)
+    return ctx
+
+
+# USE_PERSISTENT_PROFILE=1 이면 storage_state 대신 디스크 프로필(쿠키·localStorage·HTTP 캐시)을 재사용
+USE_PERSISTENT_PROFILE = os.getenv("USE_PERSISTENT_PROFILE") == "1"
+# pytest-xdist 워커 ID (gw0, gw1, ...) — 단독 실행 시 None
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+# Chrome 프로필은 여러 프로세스가 동시에 열 수 없으므로 xdist 워커별로 분리
+PERSISTENT_PROFILE_DIR = project_root / (f".pw_profile_{XDIST_WORKER}" if XDIST_WORKER else ".pw_profile")
+
+
+@pytest.fixture(scope="session")
+def persistent_context(pw):
+    """
+    디스크 프로필 기반 세션 컨텍스트 (USE_PERSISTENT_PROFILE=1 전용)
+    프로필에 유효한 로그인 쿠키가 있으면 로그인을 생략하고, 없을 때만 이 컨텍스트에서 로그인합니다.
+    """
+    ctx = pw.chromium.launch_persistent_context(
+        user_data_dir=str(PERSISTENT_PROFILE_DIR),
+        **_browser_launch_options(),
+        **_mobile_context_options(),
+    )
+    _prepare_scenario_context(ctx)
+    if _cookies_valid(ctx.cookies()):
+        print("[INFO] 프로필 로그인 상태 재사용 → 로그인 생략")
+    else:
+        print("[INFO] 프로필 로그인 상태 없음 → 프로필 컨텍스트에서 로그인 수행")
+        page = ctx.new_page()
+        page.route("**/*", _route_login_resources)
+        _login_on_page(page)
+        page.close()
     yield ctx
     ctx.close()
+
+
+@pytest.fixture(scope="session")
+def _base_context(request):
+    """
+    세션 단위 공유 컨텍스트
+    storage_state 파싱/컨텍스트 구성을 세션당 한 번만 수행합니다.
+    USE_PERSISTENT_PROFILE=1 이면 persistent_context를 그대로 사용합니다.
+    """
+    if USE_PERSISTENT_PROFILE:
+        yield request.getfixturevalue("persistent_context")
+        return
+    browser = request.getfixturevalue("browser")
+    ctx = _new_mobile_context(browser, request.getfixturevalue("ensure_login_state"))
+    yield ctx
+    ctx.close()
+
+
+@pytest.fixture(scope="session")
+def _base_state(request, _base_context) -> Dict[str, Any]:
+    """
+    공유 컨텍스트를 시나리오마다 되돌릴 기준 state (로그인 직후 쿠키·localStorage)
+    USE_PERSISTENT_PROFILE=1 이면 첫 시나리오 전에 프로필 컨텍스트의 state를 스냅샷합니다.
+    """
+    if USE_PERSISTENT_PROFILE:
+        return _base_context.storage_state()
+    with open(request.getfixturevalue("ensure_login_state"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+_RESTORE_LOCAL_STORAGE_JS = """items => {
+    localStorage.clear();
+    for (const { name, value } of items) localStorage.setItem(name, value);
+}"""
+
+
+def _local_storage_by_origin(state: Dict[str, Any]) -> Dict[str, list]:
+    return {o["origin"]: o.get("localStorage", []) for o in state.get("origins", [])}
+
+
+def _reset_context_state(ctx, base_state: Dict[str, Any]) -> None:
+    """
+    공유 컨텍스트의 쿠키·localStorage를 기준 state로 되돌림 (시나리오 간 장바구니/RVH 등 상태 누수 방지)
+    sessionStorage는 탭 단위라 시나리오마다 새 page를 여는 것으로 초기화됩니다.
+    """
+    ctx.clear_cookies()
+    if base_state.get("cookies"):
+        ctx.add_cookies(base_state["cookies"])
+
+    base_storage = _local_storage_by_origin(base_state)
+    sort_key = lambda item: item["name"]
+    dirty = [
+        origin
+        for origin, items in _local_storage_by_origin(ctx.storage_state()).items()
+        if sorted(items, key=sort_key) != sorted(base_storage.get(origin, []), key=sort_key)
+    ]
+    if not dirty:
+        return
+    # origin 문서는 빈 HTML로 대체해 네트워크 없이 해당 origin의 localStorage에만 접근
+    page = ctx.new_page()
+    try:
+        page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+        for origin in dirty:
+            page.goto(origin)
+            page.evaluate(_RESTORE_LOCAL_STORAGE_JS, base_storage.get(origin, []))
+    finally:
+        page.close()
+
+
+@pytest.fixture(scope="function")
+def context(request, _base_context, _base_state):
+    """
+    브라우저 컨텍스트 fixture (모바일 뷰포트)
+    기본적으로 세션 공유 컨텍스트를 반환하고, 시나리오 격리는 page 단위로 보장합니다.
+    시나리오 종료 시 해당 시나리오에서 열린 페이지(새 탭 포함)를 모두 닫고,
+    쿠키·localStorage를 로그인 직후 state로 되돌려 다음 시나리오에 상태가 넘어가지 않게 합니다.
+
+    쿠키/스토리지까지 분리가 필요한 시나리오는 feature에 @isolated 태그를 달면
+    독립 컨텍스트를 생성하고 종료 시 정리합니다.
+    """
+    if request.node.get_closest_marker("isolated"):
+        ctx = _new_mobile_context(
+            request.getfixturevalue("browser"), request.getfixturevalue("ensure_login_state")
+        )
+        yield ctx
+        ctx.close()
+        return
+
+    yield _base_context
+    for p in list(_base_context.pages):
+        try:
+            p.close()
+        except Exception as e:
+            logger.warning(f"시나리오 종료 시 페이지 정리 실패: {e}")
+    try:
+        _reset_context_state(_base_context, _base_state)
+    except Exception as e:
+        logger.warning(f"시나리오 종료 시 쿠키/스토리지 초기화 실패: {e}")
 # ------------------------
 # :셋: 로그인 상태 검증
 # ------------------------
+# 만료 직전 쿠키로 시나리오 중간에 로그아웃되지 않도록 두는 여유 시간(초)
+STATE_EXPIRY_MARGIN_SEC = 600
+
+
+def _login_cookie_names() -> FrozenSet[str]:
+    """config.json의 login_cookie_names (없으면 빈 집합 → 저장된 로그인 상태를 재사용하지 않음)"""
+    names = app_config.get("login_cookie_names") or []
+    if isinstance(names, str):
+        names = [names]
+    return frozenset(str(n) for n in names)
+
+
+def _max_cookie_expiry(cookies, auth_names: FrozenSet[str]) -> float:
+    """인증 쿠키 중 가장 늦은 만료 시각 (세션 쿠키/만료 없음은 0으로 간주)"""
+    return max(
+        (c.get("expires") or 0 for c in cookies if c.get("name") in auth_names),
+        default=0,
+    )
+
+
+def _cookies_valid(cookies) -> bool:
+    """
+    인증 쿠키 중 하나라도 STATE_EXPIRY_MARGIN_SEC 이후까지 유효하면 True
+    login_cookie_names가 없으면 분석/트래킹 쿠키로 로그아웃 상태를 유효로 오판하지 않도록 항상 False
+    """
+    auth_names = _login_cookie_names()
+    if not auth_names:
+        return False
+    return _max_cookie_expiry(cookies, auth_names) > time.time() + STATE_EXPIRY_MARGIN_SEC
+
+
+@functools.lru_cache(maxsize=4)
+def _state_max_cookie_expiry(state_path: str, mtime_ns: int, auth_names: FrozenSet[str]) -> float:
+    """state.json 파싱 결과 캐시 — 파일이 바뀌면(mtime_ns) 다시 읽음"""
+    with open(state_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return _max_cookie_expiry(data.get("cookies", []), auth_names)
+
+
 def is_state_valid(state_path: str) -> bool:
-    """state.json이 유효한지 확인 (쿠키 기반)"""
-    if not os.path.exists(state_path):
+    """
+    state.json이 유효한지 확인 (쿠키 기반)
+    config.json의 login_cookie_names 인증 쿠키 중 하나라도 STATE_EXPIRY_MARGIN_SEC 이후까지 유효하면 True
+    login_cookie_names가 없으면 인증 여부를 판단할 수 없으므로 False (매 세션 새로 로그인)
+    """
+    auth_names = _login_cookie_names()
+    if not auth_names:
+        print("[INFO] config.json에 login_cookie_names 미설정 → state.json 재사용 안 함")
         return False
     try:
-        with open(state_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        cookies = data.get("cookies", [])
-        now = time.time()
-        # 쿠키 하나라도 만료되지 않았으면 로그인 유지 가능
-        if any("expires" in c and c["expires"] and c["expires"] > now for c in cookies):
-            return True
+        mtime_ns = os.stat(state_path).st_mtime_ns
+    except FileNotFoundError:
         return False
+    try:
+        max_expiry = _state_max_cookie_expiry(state_path, mtime_ns, auth_names)
+        # 인증 쿠키 하나라도 만료되지 않았으면 로그인 유지 가능
+        return max_expiry > time.time() + STATE_EXPIRY_MARGIN_SEC
     except Exception as e:
         print(f"[WARN] state.json 검증 오류: {e}")
         return False
 # ------------------------
 # :넷: 로그인 수행 + state.json 저장
 # ------------------------
-def create_login_state(pw):
-    """로그인 수행 후 state.json 저장 (모바일 환경)"""
+# 로그인 플로우 전용 차단 대상 (시나리오 컨텍스트는 BLOCK_RESOURCES=1일 때만 별도 목록으로 차단 — 트래킹 요청 수집 대상)
+# stylesheet는 팝업/로그인 버튼 노출에 영향을 줄 수 있어 차단하지 않음
+LOGIN_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+LOGIN_BLOCKED_URL_PATTERN = re.compile(
+    r"aplus\.gmarket\.co(\.kr|m)|montelena-rcv\.gmarket|google-analytics\.com|googletagmanager\.com|doubleclick\.net|facebook\.(net|com)"
+)
+
+
+def _route_login_resources(route):
+    request = route.request
+    if request.resource_type in LOGIN_BLOCKED_RESOURCE_TYPES or LOGIN_BLOCKED_URL_PATTERN.search(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
+# BLOCK_RESOURCES=1 이면 시나리오 컨텍스트에서도 이미지/폰트/미디어와 서드파티 분석 요청을 차단
+# aplus/montelena 트래킹 요청은 검증 대상이므로 절대 차단하지 않음 (광고태그 등 DOM 검증에는 영향 없음)
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES") == "1"
+SCENARIO_BLOCKED_RESOURCE_TYPES = LOGIN_BLOCKED_RESOURCE_TYPES
+SCENARIO_BLOCKED_URL_PATTERN = re.compile(
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net|facebook\.(net|com)"
+)
+
+
+def _route_scenario_resources(route):
+    request = route.request
+    if request.resource_type in SCENARIO_BLOCKED_RESOURCE_TYPES or SCENARIO_BLOCKED_URL_PATTERN.search(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _apply_resource_blocking(ctx):
+    """BLOCK_RESOURCES=1 일 때 시나리오 컨텍스트에 리소스 차단 라우트 등록"""
+    if BLOCK_RESOURCES:
+        ctx.route("**/*", _route_scenario_resources)
+
+
+def _login_on_page(page):
+    """주어진 page에서 일반회원 로그인 플로우 수행 (로그인 완료까지 대기)"""
     from utils.urls import base_url
     from utils.credentials import get_credentials, MemberType
-    
-    print("[INFO] 로그인 절차 시작 (모바일)")
+
     # 계정 정보 가져오기 (일반회원 사용)
     credentials = get_credentials(MemberType.NORMAL)
     username = credentials["username"]
     password = credentials["password"]
-    
-    browser = pw.chromium.launch(headless=False)  # 화면 확인용
-    viewport, user_agent = _get_mobile_emulation()
-    context = browser.new_context(
-        viewport=viewport,
-        user_agent=user_agent,
-        is_mobile=True,
-        has_touch=True,
-        device_scale_factor=1,
-    )
-    page = context.new_page()
+
     page.goto(base_url())
     #팝업 닫기 (최대 3초 대기)
     try:
@@ -263,45 +539,138 @@ def create_login_state(pw):
     page.fill("#typeMemberInputPassword", password)
     page.click("#btn_memberLogin")
     # 로그인 완료 대기
-    page.wait_for_selector("text=로그아웃", timeout=15000)
-    # 로그인 상태 저장
-    context.storage_state(path=STATE_PATH)
-    import json
-    with open(STATE_PATH, 'r', encoding='utf-8') as f:
-        state = json.load(f)
-        cookies_count = len(state.get('cookies', []))
-        origins_count = len(state.get('origins', []))
-        logger.debug(f"저장된 쿠키 수: {cookies_count}")
-        logger.debug(f"저장된 origins 수: {origins_count}")
-        
-        if origins_count > 0:
+    _wait_for_login_complete(page)
+
+
+def _wait_for_login_complete(page, timeout_ms: int = 15000):
+    """
+    로그인 완료 대기
+    login_cookie_names가 설정되어 있으면 인증 쿠키가 생길 때까지,
+    없으면 로그인 상태에서만 보이는 '로그아웃' 텍스트가 나타날 때까지 대기
+    (쿠키 변화만으로는 트래킹 쿠키 갱신과 구분되지 않아 미인증 state가 저장될 수 있음)
+    """
+    auth_names = _login_cookie_names()
+    if not auth_names:
+        page.wait_for_selector("text=로그아웃", timeout=timeout_ms)
+        return
+    deadline = time.monotonic() + timeout_ms / 1000
+    while time.monotonic() < deadline:
+        if any(c.get("name") in auth_names for c in page.context.cookies()):
+            return
+        page.wait_for_timeout(100)
+    raise RuntimeError(f"로그인 완료 대기 시간 초과: 인증 쿠키 {sorted(auth_names)} 미발급 ({timeout_ms}ms)")
+
+
+def create_login_state(browser):
+    """로그인 수행 후 state.json 저장 (모바일 환경) — 세션 browser를 재사용하고 전용 컨텍스트만 생성"""
+    print("[INFO] 로그인 절차 시작 (모바일)")
+    viewport, user_agent = _get_mobile_emulation()
+    context = browser.new_context(
+        viewport=viewport,
+        user_agent=user_agent,
+        is_mobile=True,
+        has_touch=True,
+        device_scale_factor=1,
+    )
+    # 이미지/폰트/미디어/트래커는 로그인 폼 제출에 불필요하므로 차단
+    context.route("**/*", _route_login_resources)
+    page = context.new_page()
+    _login_on_page(page)
+    # 로그인 상태 저장 (파일 저장과 동시에 dict로 반환되므로 다시 읽지 않음)
+    state = context.storage_state(path=STATE_PATH)
+    cookies_count = len(state.get('cookies', []))
+    origins_count = len(state.get('origins', []))
+    logger.debug("저장된 쿠키 수: %s", cookies_count)
+    logger.debug("저장된 origins 수: %s", origins_count)
+    
+    if origins_count > 0:
+        if logger.isEnabledFor(logging.DEBUG):
             for origin in state.get('origins', []):
-                origin_url = origin.get('origin', 'N/A')
-                localStorage_count = len(origin.get('localStorage', []))
-                sessionStorage_count = len(origin.get('sessionStorage', []))
-                logger.debug(f"Origin: {origin_url}")
-                print(f"  - localStorage: {localStorage_count}개 항목")
-                print(f"  - sessionStorage: {sessionStorage_count}개 항목")
-        else:
-            print("[WARNING] origins가 저장되지 않았습니다. localStorage/sessionStorage가 복원되지 않을 수 있습니다.")
+                logger.debug(
+                    "Origin: %s - localStorage: %s개 항목, sessionStorage: %s개 항목",
+                    origin.get('origin', 'N/A'),
+                    len(origin.get('localStorage', [])),
+                    len(origin.get('sessionStorage', [])),
+                )
+    else:
+        print("[WARNING] origins가 저장되지 않았습니다. localStorage/sessionStorage가 복원되지 않을 수 있습니다.")
     
-    browser.close()
+    context.close()
     print("[INFO] 로그인 완료 및 state.json 저장됨")
 # ------------------------
 # :다섯: 로그인 상태 fixture
 # ------------------------
-@pytest.fixture(scope="session")
-def ensure_login_state(pw):
+@contextmanager
+def _login_lock(lock_path: str, timeout_sec: float = 180):
     """
-    매 세션마다 로그인 수행하여 새로운 state.json 생성
-    기존 state.json이 있어도 무시하고 새로 로그인
+    xdist 워커 간 로그인 직렬화용 파일 락 (O_EXCL 생성 기반, 추가 의존성 없음)
+    timeout_sec보다 오래된 락 파일은 비정상 종료 잔재로 보고 제거
     """
+    deadline = time.monotonic() + timeout_sec
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(lock_path).st_mtime > timeout_sec:
+                    os.remove(lock_path)
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"로그인 락 대기 시간 초과: {lock_path}")
+            time.sleep(0.5)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(lock_path)
+
+
+def _state_written_this_run(run_uid: str) -> bool:
+    """현재 xdist 실행(testrun uid)에서 다른 워커가 이미 state.json을 갱신했는지 확인"""
+    try:
+        with open(STATE_PATH + ".run", "r", encoding="utf-8") as f:
+            return f.read().strip() == run_uid
+    except FileNotFoundError:
+        return False
+
+
+def _ensure_login_state(browser):
+    run_uid = os.getenv("PYTEST_XDIST_TESTRUNUID")
+    # FORCE_LOGIN이어도 같은 실행에서 다른 워커가 막 로그인했다면 재사용
+    force = os.getenv("FORCE_LOGIN") == "1" and not (run_uid and _state_written_this_run(run_uid))
+    if not force and is_state_valid(STATE_PATH):
+        print("[INFO] 유효한 state.json 재사용 → 로그인 생략")
+        return STATE_PATH
     print("[INFO] 세션 시작 → 새로 로그인 수행")
-    create_login_state(pw)
+    create_login_state(browser)
+    if run_uid:
+        with open(STATE_PATH + ".run", "w", encoding="utf-8") as f:
+            f.write(run_uid)
     return STATE_PATH
+
+
+@pytest.fixture(scope="session")
+def ensure_login_state(browser):
+    """
+    유효한 state.json이 있으면 재사용하고, 없거나 만료된 경우에만 로그인하여 새로 생성
+    FORCE_LOGIN=1 이면 기존 state.json을 무시하고 새로 로그인
+    pytest-xdist 실행 시에는 파일 락으로 한 워커만 로그인하고 나머지는 결과를 재사용
+    """
+    if not XDIST_WORKER:
+        return _ensure_login_state(browser)
+    with _login_lock(STATE_PATH + ".lock"):
+        return _ensure_login_state(browser)
 # ------------------------
 # :넷: page fixture (각 시나리오마다 독립적으로 생성)
 # ------------------------
+# page 기본 타임아웃(ms) — 느린 환경에서는 환경 변수로 조정
+PAGE_ACTION_TIMEOUT_MS = int(os.getenv("PAGE_ACTION_TIMEOUT_MS", "3000"))
+PAGE_NAVIGATION_TIMEOUT_MS = int(os.getenv("PAGE_NAVIGATION_TIMEOUT_MS", "10000"))
+
+
 @pytest.fixture(scope="function")
 def page(context: BrowserContext):
     """
@@ -309,7 +678,9 @@ def page(context: BrowserContext):
     각 시나리오마다 독립적으로 생성되고 종료 시 정리됩니다.
     """
     page = context.new_page()
-    page.set_default_timeout(10000)
+    # 액션/대기는 짧게(없는 요소 탐색 시 빠르게 실패), 네비게이션(goto/wait_for_url 등)만 넉넉하게
+    page.set_default_timeout(PAGE_ACTION_TIMEOUT_MS)
+    page.set_default_navigation_timeout(PAGE_NAVIGATION_TIMEOUT_MS)
     yield page
     page.close()
 
@@ -321,9 +692,11 @@ def page(context: BrowserContext):
 def browser_session(page):
     """
     BrowserSession fixture - 현재 active page 참조 관리
-    각 시나리오마다 독립적으로 생성됩니다.
+    각 시나리오마다 독립적으로 생성되고 종료 시 전환된 페이지를 모두 닫습니다.
     """
-    return BrowserSession(page)
+    session = BrowserSession(page)
+    yield session
+    session.close()
 
 
 # ------------------------
@@ -338,35 +711,20 @@ def bdd_context():
     
     하위 호환성: 딕셔너리처럼 사용 가능 (bdd_context['key']) + store 속성 사용 가능 (bdd_context.store['key'])
     """
-    class Context:
+    class Context(dict):
+        """dict 기반 컨텍스트 — 조회/설정/in/get 모두 내장 dict 연산 그대로 사용"""
         def __init__(self):
-            self.store = {}
-            self._dict = {}  # 하위 호환성을 위한 딕셔너리
-        
-        def __getitem__(self, key):
-            """딕셔너리처럼 접근 가능 (하위 호환성)"""
-            # store에 있으면 store에서, 없으면 _dict에서
-            if key in self.store:
-                return self.store[key]
-            return self._dict[key]
-        
-        def __setitem__(self, key, value):
-            """딕셔너리처럼 설정 가능 (하위 호환성)"""
-            # store와 _dict 모두에 저장 (양쪽에서 접근 가능)
-            self.store[key] = value
-            self._dict[key] = value
-        
-        def get(self, key, default=None):
-            """딕셔너리처럼 get 메서드 사용 가능 (하위 호환성)"""
-            if key in self.store:
-                return self.store[key]
-            return self._dict.get(key, default)
-        
-        def __contains__(self, key):
-            """in 연산자 지원"""
-            return key in self.store or key in self._dict
+            super().__init__()
+            self.store = self  # 하위 호환성: bdd_context.store['key']도 동일 dict
+            self._dict = self
     
-    return Context()
+    ctx = Context()
+    yield ctx
+    # 공유 컨텍스트에 리스너가 남지 않도록 중지되지 않은 트래커 정리
+    for key in ("tracker", "montelena_tracker"):
+        tracker = ctx.get(key)
+        if tracker is not None and getattr(tracker, "is_tracking", False):
+            tracker.stop()
 
 
 # ============================================
@@ -375,9 +733,13 @@ def bdd_context():
 # 각 시나리오가 독립적으로 실행되므로 feature 단위 상태 관리 hook은 제거됨
 
 
+# 리포트 출력에서 숨길 테스트 이름 패턴 (모듈 로드 시 한 번만 컴파일)
+_HIDDEN_REPORT_NODEID_RE = re.compile(r"wait_|fetch")
+
+
 def pytest_report_teststatus(report, config):
-    # 이름에 'wait_'가 들어간 테스트는 리포트 출력에서 숨김
-    if any(keyword in report.nodeid for keyword in ["wait_", "fetch"]):
+    # 이름에 'wait_' 또는 'fetch'가 들어간 테스트는 리포트 출력에서 숨김
+    if _HIDDEN_REPORT_NODEID_RE.search(report.nodeid):
         return report.outcome, None, ""
     return None
 
@@ -432,6 +794,18 @@ def _get_page_from_request(request, step_func_args=None):
     return page
 
 
+SCREENSHOT_DIR = "screenshots"
+_screenshot_dir_ready = False
+
+
+def _ensure_screenshot_dir():
+    """스크린샷 폴더는 세션 중 최초 캡처 시 한 번만 생성"""
+    global _screenshot_dir_ready
+    if not _screenshot_dir_ready:
+        os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+        _screenshot_dir_ready = True
+
+
 def _capture_screenshot(case_id_num, request=None, step_func_args=None):
     """
     스크린샷 캡처 및 저장
@@ -448,14 +822,11 @@ def _capture_screenshot(case_id_num, request=None, step_func_args=None):
         page = _get_page_from_request(request, step_func_args)
         
         if page and not page.is_closed():
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            # case_id_num이 숫자면 TestRail 케이스 ID, 아니면 일반 파일명
-            if isinstance(case_id_num, (int, str)) and str(case_id_num).isdigit():
-                screenshot_path = f"screenshots/{case_id_num}_{timestamp}.png"
-            else:
-                screenshot_path = f"screenshots/{case_id_num}_{timestamp}.png"
-            os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
-            page.screenshot(path=screenshot_path, timeout=PAGE_SCREENSHOT_TIMEOUT_MS)
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            # case_id_num: TestRail 케이스 ID 또는 일반 파일명 식별자
+            screenshot_path = f"{SCREENSHOT_DIR}/{case_id_num}_{timestamp}.{SCREENSHOT_EXT}"
+            _ensure_screenshot_dir()
+            page.screenshot(path=screenshot_path, timeout=PAGE_SCREENSHOT_TIMEOUT_MS, **SCREENSHOT_OPTIONS)
             print(f"[TestRail] 스크린샷 저장 완료: {screenshot_path}")
             return screenshot_path
     except Exception as e:
@@ -467,6 +838,8 @@ def _capture_screenshot(case_id_num, request=None, step_func_args=None):
 # 프론트 실패 처리 헬퍼 함수는 utils.frontend_helpers에서 import
 from utils.frontend_helpers import (
     PAGE_SCREENSHOT_TIMEOUT_MS,
+    SCREENSHOT_EXT,
+    SCREENSHOT_OPTIONS,
     capture_frontend_failure_screenshot,
 )
 
@@ -479,7 +852,8 @@ def _collect_step_logs():
         로그 문자열 또는 None
     """
     try:
-        logs = test_log_handler.get_logs()
+        # 반환과 동시에 초기화 (다음 스텝과 로그 섞임 방지)
+        logs = test_log_handler.pop_all()
         if logs and logs.strip():
             return logs
     except Exception as e:
@@ -500,16 +874,121 @@ def _attach_screenshot_to_testrail(result_id, screenshot_path):
         return
     
     try:
+        content_type = mimetypes.guess_type(screenshot_path)[0] or "application/octet-stream"
         with open(screenshot_path, "rb") as f:
             testrail_post(
                 f"add_attachment_to_result/{result_id}",
-                files={"attachment": f},
+                files={"attachment": (os.path.basename(screenshot_path), f, content_type)},
             )
         print(f"[TestRail] 스크린샷 첨부 완료: {screenshot_path}")
     except Exception as e:
         logger.warning(f"TestRail 스크린샷 업로드 실패: {e}")
 
 
+# TestRail 스텝 결과 배치 기록 — [(case_id 포함 result payload, 스크린샷 경로 또는 None)]
+TESTRAIL_RESULT_BATCH_SIZE = 20
+_testrail_result_buffer = []
+
+
+def _queue_testrail_result(case_id_num, payload, screenshot_path=None):
+    """스텝 결과를 버퍼에 추가하고, 배치 크기에 도달하면 즉시 기록"""
+    _testrail_result_buffer.append(({"case_id": case_id_num, **payload}, screenshot_path))
+    if len(_testrail_result_buffer) >= TESTRAIL_RESULT_BATCH_SIZE:
+        _flush_testrail_results()
+
+
+def _flush_testrail_results():
+    """버퍼에 쌓인 스텝 결과를 백그라운드 워커에 넘김 (스텝 훅은 네트워크 I/O를 기다리지 않음)"""
+    if not _testrail_result_buffer or not testrail_run_id:
+        return
+    batch = list(_testrail_result_buffer)
+    _testrail_result_buffer.clear()
+    _start_testrail_worker()
+    _testrail_queue.put((testrail_run_id, batch))
+
+
+_testrail_queue = queue.Queue()
+_testrail_worker = None
+
+
+def _start_testrail_worker():
+    """TestRail 전송 워커 스레드 시작 (최초 전송 시 한 번만)"""
+    global _testrail_worker
+    if _testrail_worker is None:
+        _testrail_worker = threading.Thread(
+            target=_testrail_worker_loop, name="testrail-writer", daemon=True
+        )
+        _testrail_worker.start()
+
+
+def _testrail_worker_loop():
+    while True:
+        run_id, batch = _testrail_queue.get()
+        try:
+            _send_testrail_results(run_id, batch)
+        except Exception as e:
+            logger.warning(f"TestRail 전송 워커 오류: {e}")
+        finally:
+            _testrail_queue.task_done()
+
+
+def _wait_testrail_writes():
+    """버퍼를 비우고 워커가 대기열을 모두 처리할 때까지 대기 (Run 종료/스크린샷 삭제 전 호출)"""
+    _flush_testrail_results()
+    _testrail_queue.join()
+
+
+def _send_testrail_results(run_id, batch):
+    """스텝 결과 배치를 add_results_for_cases 한 번으로 기록한 뒤 스크린샷 첨부 (워커 스레드에서 실행)"""
+    try:
+        logger.debug(f"TestRail API 호출: add_results_for_cases/{run_id} ({len(batch)}건)")
+        results = testrail_post(
+            f"add_results_for_cases/{run_id}",
+            {"results": [result for result, _ in batch]},
+        )
+        print(f"[TestRail] 스텝 결과 {len(batch)}건 일괄 기록 완료")
+    except Exception as e:
+        # Run에 없는 케이스 하나로 배치 전체가 거부될 수 있으므로 건별 기록으로 폴백
+        logger.warning(f"스텝 TestRail 일괄 기록 실패 ({len(batch)}건), 건별 기록으로 재시도: {e}")
+        results = []
+        for result, _ in batch:
+            case_id_num = result["case_id"]
+            payload = {k: v for k, v in result.items() if k != "case_id"}
+            try:
+                results.append(
+                    testrail_post(f"add_result_for_case/{run_id}/{case_id_num}", payload)
+                )
+            except Exception as e:
+                logger.warning(f"스텝 TestRail 기록 실패 (case_id: {case_id_num}): {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("TestRail 기록 실패 상세:\n%s", traceback.format_exc())
+                results.append({})
+    
+    # 응답은 요청과 같은 순서의 결과 목록 → 결과 ID로 스크린샷 첨부
+    for (_, screenshot_path), result_obj in zip(batch, results or []):
+        _attach_screenshot_to_testrail(result_obj.get("id"), screenshot_path)
+
+
+def pytest_bdd_after_scenario(request, feature, scenario):
+    """시나리오 종료 시 버퍼에 남은 TestRail 스텝 결과를 전송 워커에 전달"""
+    _flush_testrail_results()
+
+
+# 스텝 파라미터의 TestRail TC 번호 형식 (예: C1234567)
+_TC_RE = re.compile(r"\AC(\d+)\Z")
+
+
+def _bdd_getter(bdd_context):
+    """bdd_context에서 값을 읽는 조회 함수 반환 (dict 형태/.store 형태 모두 지원, 없으면 기본값 반환)"""
+    if bdd_context is None:
+        return lambda key, default=None: default
+    if hasattr(bdd_context, 'get'):
+        return bdd_context.get
+    if hasattr(bdd_context, 'store'):
+        return bdd_context.store.get
+    return lambda key, default=None: default
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_bdd_before_step(request, feature, scenario, step, step_func):
     """
@@ -529,123 +1008,110 @@ def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func
     """
     outcome = yield
     
+    # TestRail 미사용 + 예외 없는 스텝은 Soft Assertion 실패 표시가 없으면 할 일 없음
+    if not TESTRAIL_REPORT_ENABLED and outcome.excinfo is None:
+        bget = _bdd_getter(step_func_args.get('bdd_context') if step_func_args else None)
+        if not bget('validation_failed') and not bget('frontend_action_failed'):
+            return
+    
     # 훅 시작 로그 (예외 발생 전에도 출력되도록 try 밖에)
-    logger.debug(f"===== pytest_bdd_after_step 시작: 스텝='{step.name}' =====")
+    logger.debug("===== pytest_bdd_after_step 시작: 스텝='%s' =====", step.name)
     
     try:
+        # bdd_context 조회 함수는 스텝당 한 번만 결정
+        bdd_context = step_func_args.get('bdd_context') if step_func_args else None
+        bget = _bdd_getter(bdd_context)
+        # 검증 스텝 여부 (스텝 이름에 "정합성 검증" 포함)도 한 번만 판단
+        is_validation_step = "정합성 검증" in step.name
+        frontend_failed_flag = bget('frontend_action_failed', False)
+        
         # 디버깅: testrail_run_id 확인
-        logger.debug(f"pytest_bdd_after_step 실행: 스텝='{step.name}', testrail_run_id={testrail_run_id}")
+        logger.debug("pytest_bdd_after_step 실행: 스텝='%s', testrail_run_id=%s", step.name, testrail_run_id)
         
         # 스텝 실행 결과 확인
         if outcome.excinfo is not None:
             step_status = "failed"
             error_msg = str(outcome.excinfo[1]) if outcome.excinfo[1] else "Unknown error"
-            logger.debug(f"스텝 실행 중 예외 발생: {error_msg}")
+            logger.debug("스텝 실행 중 예외 발생: %s", error_msg)
         else:
             # Soft Assertion 지원: bdd_context에서 실패 여부 확인
             step_status = "passed"
             error_msg = None
             
-            if step_func_args:
-                bdd_context = step_func_args.get('bdd_context')
-                if bdd_context and hasattr(bdd_context, 'get'):
-                    # 검증 스텝인지 확인 (스텝 이름에 "정합성 검증" 포함)
-                    is_validation_step = "정합성 검증" in step.name
-                    
-                    if is_validation_step:
-                        # 검증 스텝: validation_failed만 확인 (프론트 실패 정보는 이미 error_message에 포함됨)
-                        validation_failed = bdd_context.get('validation_failed', False)
-                        if validation_failed:
-                            step_status = "failed"
-                            validation_error = bdd_context.get('validation_error_message', '검증 실패')
-                            # outcome.excinfo가 있으면 그것을 우선, 없으면 validation_error 사용
-                            if error_msg is None or not error_msg:
-                                error_msg = validation_error
-                            logger.debug(f"검증 스텝 실패 감지: validation_failed={validation_failed}, error_msg={error_msg}")
-                    else:
-                        # 프론트 동작 스텝: frontend_action_failed 확인
-                        if bdd_context.get('frontend_action_failed'):
-                            step_status = "failed"
-                            if error_msg is None:
-                                error_msg = bdd_context.get('frontend_error_message', '프론트 동작 실패')
+            if bdd_context:
+                if is_validation_step:
+                    # 검증 스텝: validation_failed만 확인 (프론트 실패 정보는 이미 error_message에 포함됨)
+                    validation_failed = bget('validation_failed', False)
+                    if validation_failed:
+                        step_status = "failed"
+                        validation_error = bget('validation_error_message', '검증 실패')
+                        # outcome.excinfo가 있으면 그것을 우선, 없으면 validation_error 사용
+                        if error_msg is None or not error_msg:
+                            error_msg = validation_error
+                        logger.debug("검증 스텝 실패 감지: validation_failed=%s, error_msg=%s", validation_failed, error_msg)
+                else:
+                    # 프론트 동작 스텝: frontend_action_failed 확인
+                    if frontend_failed_flag:
+                        step_status = "failed"
+                        if error_msg is None:
+                            error_msg = bget('frontend_error_message', '프론트 동작 실패')
+        
+        # 프론트 실패 시점에 찍어 둔 스크린샷 (실패 스텝에서만 사용)
+        frontend_fail_shot = bget('frontend_failure_screenshot') if step_status == "failed" else None
         
         # TC 번호 추출 시도
         step_case_id = None
         
-        # 디버깅: step_func_args 내용 확인
-        if step_func_args:
-            logger.debug(f"step_func_args 키: {list(step_func_args.keys())}")
+        # 디버깅: step_func_args 내용 확인 (DEBUG 레벨일 때만 순회)
+        if step_func_args and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("step_func_args 키: %s", list(step_func_args.keys()))
             # TC 번호 후보 값들 확인 (모든 값 출력)
             for arg_name, arg_value in step_func_args.items():
                 if arg_name != 'bdd_context':  # bdd_context는 너무 클 수 있으므로 제외
-                    logger.debug(f"step_func_args[{arg_name}] = {arg_value} (타입: {type(arg_value).__name__})")
+                    logger.debug("step_func_args[%s] = %s (타입: %s)", arg_name, arg_value, type(arg_value).__name__)
         
         # 1. step_func_args에서 TC 번호 파라미터 찾기 (tc_id, tc_module_exposure, tc_product_exposure 등)
         # 검증 스텝에서 tc_id(또는 tc_*)가 비어 있으면 이 스텝은 TestRail에 기록하지 않음 (폴백 사용 금지)
         validation_step_had_empty_tc = False
         if step_func_args:
-            for arg_name, arg_value in step_func_args.items():
-                if arg_name == 'bdd_context':
-                    continue
-                # TC 번호 형식 확인 (C로 시작하는 문자열)
-                if isinstance(arg_value, str):
-                    arg_value_stripped = arg_value.strip()
-                    # C로 시작하고 뒤에 숫자가 오는 경우
-                    if arg_value_stripped.startswith("C") and len(arg_value_stripped) > 1:
-                        try:
-                            if arg_value_stripped[1:].isdigit():
-                                step_case_id = arg_value_stripped
-                                logger.debug(f"step_func_args에서 TC 번호 발견: {arg_name}={step_case_id} (스텝: {step.name})")
-                                break
-                        except (ValueError, IndexError):
-                            pass
-                    # 검증 스텝이고 이 스텝의 TC 파라미터(tc_id, tc_*)가 비어있음 → 폴백 사용 안 함
-                    elif "정합성 검증" in step.name and (arg_name == "tc_id" or arg_name.startswith("tc_")):
+            # TC 번호 형식(C + 숫자)인 첫 번째 문자열 파라미터
+            step_case_id = next(
+                (
+                    arg_value.strip()
+                    for arg_name, arg_value in step_func_args.items()
+                    if arg_name != 'bdd_context'
+                    and isinstance(arg_value, str)
+                    and _TC_RE.match(arg_value.strip())
+                ),
+                None,
+            )
+            if step_case_id:
+                logger.debug("step_func_args에서 TC 번호 발견: %s (스텝: %s)", step_case_id, step.name)
+            elif is_validation_step:
+                # 검증 스텝이고 이 스텝의 TC 파라미터(tc_id, tc_*)가 비어있음 → 폴백 사용 안 함
+                for arg_name in (k for k in step_func_args if k.startswith("tc_")):
+                    arg_value = step_func_args[arg_name]
+                    if isinstance(arg_value, str):
                         validation_step_had_empty_tc = True
-                        logger.warning(f"검증 스텝 '{step.name}'에서 tc_id 파라미터 값이 TC 번호 형식이 아닙니다: '{arg_value_stripped}'")
+                        logger.warning("검증 스텝 '%s'에서 tc_id 파라미터 값이 TC 번호 형식이 아닙니다: '%s'", step.name, arg_value.strip())
         
         # 2. step_func_args에서 bdd_context를 통해 TC 번호 찾기 (검증 스텝에서 tc가 비어있으면 폴백 사용 안 함)
-        if step_case_id is None and step_func_args and not (validation_step_had_empty_tc):
-            bdd_context = step_func_args.get('bdd_context')
-            if bdd_context:
-                logger.debug(f"bdd_context 타입: {type(bdd_context).__name__}, hasattr('get'): {hasattr(bdd_context, 'get')}")
-                if hasattr(bdd_context, 'get'):
-                    step_case_id = bdd_context.get('testrail_tc_id')
-                    if step_case_id:
-                        logger.debug(f"bdd_context.get('testrail_tc_id')에서 TC 번호 발견: {step_case_id}")
-                elif hasattr(bdd_context, 'store'):
-                    step_case_id = bdd_context.store.get('testrail_tc_id')
-                    if step_case_id:
-                        logger.debug(f"bdd_context.store.get('testrail_tc_id')에서 TC 번호 발견: {step_case_id}")
-                
-                # 디버깅: bdd_context에 저장된 모든 testrail 관련 키 확인
-                if hasattr(bdd_context, 'get'):
-                    testrail_keys = [k for k in dir(bdd_context) if 'testrail' in k.lower() or 'tc' in k.lower()]
-                    if testrail_keys:
-                        logger.debug(f"bdd_context의 testrail 관련 키: {testrail_keys}")
-                        for key in ['testrail_tc_id', 'tc_id']:
-                            if hasattr(bdd_context, 'get'):
-                                value = bdd_context.get(key)
-                                if value:
-                                    logger.debug(f"bdd_context.get('{key}') = {value}")
+        if step_case_id is None and bdd_context and not (validation_step_had_empty_tc):
+            logger.debug("bdd_context 타입: %s", type(bdd_context).__name__)
+            step_case_id = bget('testrail_tc_id')
+            if step_case_id:
+                logger.debug("bdd_context의 testrail_tc_id에서 TC 번호 발견: %s", step_case_id)
         
-        logger.debug(f"추출된 TC 번호: {step_case_id}, testrail_run_id: {testrail_run_id}, step_status: {step_status}")
+        logger.debug("추출된 TC 번호: %s, testrail_run_id: %s, step_status: %s", step_case_id, testrail_run_id, step_status)
         
         # TestRail 기록 (testrail_run_id가 설정되어 있고 TC 번호가 있을 때만)
         if step_case_id and testrail_run_id:
-            logger.debug(f"TestRail 기록 시작: case_id={step_case_id}, status={step_status}")
+            logger.debug("TestRail 기록 시작: case_id=%s, status=%s", step_case_id, step_status)
             # Cxxxx → 숫자만 추출
             case_id_num = int(step_case_id[1:]) if step_case_id.startswith("C") else int(step_case_id)
             
             # skip_reason 확인
-            skip_reason = None
-            if step_func_args:
-                bdd_context = step_func_args.get('bdd_context')
-                if bdd_context:
-                    if hasattr(bdd_context, 'get'):
-                        skip_reason = bdd_context.get('skip_reason')
-                    elif hasattr(bdd_context, 'store'):
-                        skip_reason = bdd_context.store.get('skip_reason')
+            skip_reason = bget('skip_reason')
             
             # 상태 결정: skip_reason이 있으면 skip (4), 실패면 failed (5), 아니면 passed (1)
             if skip_reason:
@@ -656,72 +1122,48 @@ def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func
             else:
                 status_id = 1
             
-            comment = f"스텝: {step.name}\n"
+            # 코멘트는 조각을 모아 마지막에 한 번만 합침 (긴 실행 로그 반복 복사 방지)
+            comment_parts = [f"스텝: {step.name}\n"]
             if skip_reason:
-                comment += f"Skip: {skip_reason}\n"
+                comment_parts.append(f"Skip: {skip_reason}\n")
             if error_msg:
-                comment += f"오류: {error_msg}"
+                comment_parts.append(f"오류: {error_msg}")
             
             # 검증 스텝인 경우 통과한 필드 목록 추가
-            is_validation_step = "정합성 검증" in step.name
-            if step_func_args and is_validation_step:
-                bdd_context = step_func_args.get('bdd_context')
-                if bdd_context:
-                    passed_fields = None
-                    if hasattr(bdd_context, 'get'):
-                        passed_fields = bdd_context.get('validation_passed_fields')
-                    elif hasattr(bdd_context, 'store'):
-                        passed_fields = bdd_context.store.get('validation_passed_fields')
-                    
-                    if passed_fields and isinstance(passed_fields, dict) and len(passed_fields) > 0:
-                        comment += f"\n\n[통과한 필드]\n"
-                        for field, value in passed_fields.items():
-                            if isinstance(value, dict):
-                                expected = value.get("expected")
-                                actual = value.get("actual")
-                                comment += f"{field}: expected={expected}, actual={actual}\n"
-                            else:
-                                # 하위 호환: 과거 포맷(값만 저장된 경우)
-                                comment += f"{field}: {value}\n"
+            if is_validation_step:
+                passed_fields = bget('validation_passed_fields')
+                if passed_fields and isinstance(passed_fields, dict) and len(passed_fields) > 0:
+                    comment_parts.append("\n\n[통과한 필드]\n")
+                    for field, value in passed_fields.items():
+                        if isinstance(value, dict):
+                            expected = value.get("expected")
+                            actual = value.get("actual")
+                            comment_parts.append(f"{field}: expected={expected}, actual={actual}\n")
+                        else:
+                            # 하위 호환: 과거 포맷(값만 저장된 경우)
+                            comment_parts.append(f"{field}: {value}\n")
             
             # 로그 수집
             log_content = _collect_step_logs()
             if log_content:
-                comment += f"\n\n--- 실행 로그 ---\n{log_content}"
-            # 로그 수집 후 초기화 (다음 스텝과 로그 섞임 방지)
-            test_log_handler.clear()
+                comment_parts.append(f"\n\n--- 실행 로그 ---\n{log_content}")
+            comment = "".join(comment_parts)
             
             # 스크린샷 경로 확인 (프론트 실패 시점에 찍은 스크린샷 우선 사용)
             screenshot_path = None
             if step_status == "failed":
-                # 검증 스텝인지 확인
-                is_validation_step = "정합성 검증" in step.name
-                
                 if is_validation_step:
                     # 검증 스텝: 프론트 실패로 인한 로그 수집 실패인 경우 프론트 실패 스크린샷 사용
-                    if step_func_args:
-                        bdd_context = step_func_args.get('bdd_context')
-                        if bdd_context:
-                            # 프론트 실패가 있고 error_message에 "프론트 실패 사유"가 포함되어 있으면 스크린샷 사용
-                            if hasattr(bdd_context, 'get'):
-                                if bdd_context.get('frontend_action_failed') and error_msg and "[프론트 실패 사유]" in error_msg:
-                                    screenshot_path = bdd_context.get('frontend_failure_screenshot')
-                            elif hasattr(bdd_context, 'store'):
-                                if bdd_context.store.get('frontend_action_failed') and error_msg and "[프론트 실패 사유]" in error_msg:
-                                    screenshot_path = bdd_context.store.get('frontend_failure_screenshot')
+                    # 프론트 실패가 있고 error_message에 "프론트 실패 사유"가 포함되어 있으면 스크린샷 사용
+                    if frontend_failed_flag and error_msg and "[프론트 실패 사유]" in error_msg:
+                        screenshot_path = frontend_fail_shot
                     
                     # 스크린샷이 없으면 검증 실패 스크린샷 찍기
                     if not screenshot_path:
                         screenshot_path = _capture_screenshot(case_id_num, request, step_func_args)
                 else:
                     # 프론트 동작 스텝: 프론트 실패 스크린샷 확인
-                    if step_func_args:
-                        bdd_context = step_func_args.get('bdd_context')
-                        if bdd_context:
-                            if hasattr(bdd_context, 'get'):
-                                screenshot_path = bdd_context.get('frontend_failure_screenshot')
-                            elif hasattr(bdd_context, 'store'):
-                                screenshot_path = bdd_context.store.get('frontend_failure_screenshot')
+                    screenshot_path = frontend_fail_shot
                     
                     # 저장된 스크린샷이 없으면 새로 찍기
                     if not screenshot_path:
@@ -732,62 +1174,41 @@ def pytest_bdd_after_step(request, feature, scenario, step, step_func, step_func
                 "comment": comment,
             }
             
-            result_id = None
-            try:
-                logger.debug(f"TestRail API 호출: add_result_for_case/{testrail_run_id}/{case_id_num}")
-                result_obj = testrail_post(
-                    f"add_result_for_case/{testrail_run_id}/{case_id_num}", 
-                    payload
-                )
-                result_id = result_obj.get("id")
-                print(f"[TestRail] 스텝 '{step.name}' 결과 기록 완료 (case_id: {step_case_id}, status: {step_status}, result_id: {result_id})")
-            except Exception as e:
-                logger.warning(f"스텝 TestRail 기록 실패: {e}")
-                import traceback
-                logger.debug(f"TestRail 기록 실패 상세:\n{traceback.format_exc()}")
-            
-            # 스크린샷 첨부
-            _attach_screenshot_to_testrail(result_id, screenshot_path)
+            # 스텝마다 HTTP 왕복하지 않도록 버퍼에 쌓고 add_results_for_cases로 일괄 기록
+            _queue_testrail_result(case_id_num, payload, screenshot_path)
+            print(f"[TestRail] 스텝 '{step.name}' 결과 기록 대기 (case_id: {step_case_id}, status: {step_status})")
             
         elif step_case_id:
             # TC 번호는 있지만 testrail_run_id가 없는 경우 (TestRail 연동 미활성화)
-            logger.debug(f"TC 번호는 있지만 testrail_run_id가 None입니다. step_case_id={step_case_id}, testrail_run_id={testrail_run_id}")
+            logger.debug("TC 번호는 있지만 testrail_run_id가 None입니다. step_case_id=%s, testrail_run_id=%s", step_case_id, testrail_run_id)
             print(f"[TestRail] 스텝 '{step.name}' TC 번호 발견: {step_case_id} (TestRail 연동 미활성화)")
         elif not step_case_id:
             # TC 번호가 없는 경우 (검증 스텝에서 tc_id가 비어 있으면 의도적으로 기록하지 않음)
             if validation_step_had_empty_tc:
-                logger.debug(f"검증 스텝에서 tc_id가 비어 있어 TestRail 기록을 건너뜁니다. 스텝={step.name}")
+                logger.debug("검증 스텝에서 tc_id가 비어 있어 TestRail 기록을 건너뜁니다. 스텝=%s", step.name)
             else:
-                logger.debug(f"TC 번호를 찾을 수 없습니다. step_func_args={step_func_args is not None}, step_status={step_status}")
+                logger.debug("TC 번호를 찾을 수 없습니다. step_func_args=%s, step_status=%s", step_func_args is not None, step_status)
         
         # TC 번호가 없지만 실패한 프론트 동작 스텝인 경우 - 스크린샷만 저장 (참고용)
         if step_status == "failed" and not step_case_id:
             # 프론트 동작 실패인 경우 로그만 남기고 스크린샷 저장
             print(f"[TestRail] 스텝 '{step.name}' 실패 (TC 번호 없음): {error_msg}")
             # 프론트 실패 시점에 찍은 스크린샷 확인
-            screenshot_path = None
-            if step_func_args:
-                bdd_context = step_func_args.get('bdd_context')
-                if bdd_context:
-                    if hasattr(bdd_context, 'get'):
-                        screenshot_path = bdd_context.get('frontend_failure_screenshot')
-                    elif hasattr(bdd_context, 'store'):
-                        screenshot_path = bdd_context.store.get('frontend_failure_screenshot')
+            screenshot_path = frontend_fail_shot
             
-            # 저장된 스크린샷이 없으면 새로 찍기
-            if not screenshot_path:
+            # 저장된 스크린샷이 없으면 새로 찍기 (TestRail 미사용 시 세션 종료 때 삭제되므로 생략)
+            if not screenshot_path and TESTRAIL_REPORT_ENABLED:
                 screenshot_path = _capture_screenshot(f"frontend_fail_{step.name.replace(' ', '_')}", request, step_func_args)
             
             if screenshot_path:
                 logger.info(f"프론트 동작 실패 스크린샷 저장: {screenshot_path}")
         
-        logger.debug(f"===== pytest_bdd_after_step 종료 (정상) =====")
+        logger.debug("===== pytest_bdd_after_step 종료 (정상) =====")
     
     except Exception as e:
-        import traceback
-        logger.error(f"pytest_bdd_after_step 처리 중 예외 발생: {e}")
-        logger.error(f"예외 상세:\n{traceback.format_exc()}")
-        logger.debug(f"===== pytest_bdd_after_step 종료 (예외 발생) =====")
+        # logger.exception: 레코드의 exc_info로 트레이스백을 함께 기록
+        logger.exception(f"pytest_bdd_after_step 처리 중 예외 발생: {e}")
+        logger.debug("===== pytest_bdd_after_step 종료 (예외 발생) =====")
 
 
 # JSON 파일이 들어 있는 폴더 지정
@@ -805,6 +1226,7 @@ _TESTRAIL_NON_SUITE_TOP_KEYS = frozenset(
         "environment",
         "mobile_profile",
         "spreadsheet_id",
+        "login_cookie_names",
         "testrail_report",
         "testrail_run_name",
         "testrail_close_run_on_finish",
@@ -930,10 +1352,21 @@ def _build_effective_config(raw: Dict[str, Any], suite_key: Optional[str]) -> Di
     return out
 
 
+def _load_json_bytes(data: bytes) -> Any:
+    """JSON 바이트 디코딩 (orjson이 설치되어 있으면 사용, 없으면 표준 json)"""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    # orjson.JSONDecodeError는 json.JSONDecodeError 하위 클래스라 호출부 예외 처리 그대로 사용 가능
+    return orjson.loads(data)
+
+
 _raw_config: Dict[str, Any] = {}
 try:
-    with open("config.json", "r", encoding="utf-8") as config_file:
-        _raw_config = json.load(config_file)
+    # 모듈 로드 시 한 번만 읽고 이후에는 app_config/_raw_config 전역을 재사용
+    with open("config.json", "rb") as config_file:
+        _raw_config = _load_json_bytes(config_file.read())
 except FileNotFoundError:
     raise RuntimeError("config.json 파일을 찾을 수 없습니다.")
 except json.JSONDecodeError as e:
@@ -1069,9 +1502,60 @@ test_logs = {}  # {nodeid: 로그 문자열} - 테스트별 로그 저장
 current_test_nodeid = None  # 현재 실행 중인 테스트의 nodeid
 
 
+def testrail_get_all(endpoint, key, limit=250):
+    """
+    목록 API(get_cases/get_sections 등) 전체 페이지 조회
+    TestRail 6.7 이상은 {"offset", "limit", "size", "_links", key: [...]} 형태,
+    이전 버전은 리스트를 그대로 반환하므로 두 형태 모두 처리
+    """
+    items = []
+    offset = 0
+    previous = None
+    while True:
+        page = testrail_get(f"{endpoint}&limit={limit}&offset={offset}")
+        if isinstance(page, list):
+            batch = page
+            # limit/offset을 무시하는 구버전이 같은 목록을 반복 반환하는 경우 중단
+            if batch == previous:
+                return items
+            has_next = len(batch) == limit
+        else:
+            batch = page.get(key) or []
+            has_next = bool((page.get("_links") or {}).get("next"))
+        items.extend(batch)
+        if not batch or not has_next:
+            return items
+        previous = batch
+        offset += len(batch)
+
+
+@functools.lru_cache(maxsize=None)
+def _testrail_session():
+    """
+    TestRail API 공용 세션 (keep-alive 커넥션 재사용, 최초 호출 시 생성)
+    GET만 재시도 — POST(결과 기록)는 중복 기록 방지를 위해 재시도하지 않음
+    """
+    import atexit
+    import requests  # TestRail 연동 시에만 로드
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.auth = (TESTRAIL_USER, TESTRAIL_TOKEN)
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=TESTRAIL_SECTION_FETCH_WORKERS,  # 섹션별 병렬 조회 스레드 수만큼 연결 유지
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    atexit.register(session.close)
+    return session
+
+
 def testrail_get(endpoint):
     url = f"{TESTRAIL_BASE_URL}/index.php?/api/v2/{endpoint}"
-    r = requests.get(url, auth=(TESTRAIL_USER, TESTRAIL_TOKEN))
+    r = _testrail_session().get(url, timeout=(3, 10))
     r.raise_for_status()
     return r.json()
 
@@ -1079,54 +1563,66 @@ def testrail_get(endpoint):
 def testrail_post(endpoint, payload=None, files=None):
     url = f"{TESTRAIL_BASE_URL}/index.php?/api/v2/{endpoint}"
     if files:
-        r = requests.post(url, auth=(TESTRAIL_USER, TESTRAIL_TOKEN), files=files)
+        try:
+            from requests_toolbelt.multipart.encoder import MultipartEncoder
+        except ImportError:
+            # requests_toolbelt 미설치 시 requests 기본 방식 (multipart 본문을 메모리에 생성)
+            r = _testrail_session().post(url, files=files, timeout=(3, 30))
+        else:
+            # 파일을 메모리에 올리지 않고 multipart 본문을 스트리밍 전송
+            encoder = MultipartEncoder(fields=files)
+            r = _testrail_session().post(
+                url, data=encoder, headers={"Content-Type": encoder.content_type}, timeout=(3, 30)
+            )
     else:
-        r = requests.post(url, auth=(TESTRAIL_USER, TESTRAIL_TOKEN), json=payload)
+        r = _testrail_session().post(url, json=payload, timeout=(3, 30))
     r.raise_for_status()
     return r.json()
 
 
 from collections import defaultdict
 
+
+def _section_edges(all_sections):
+    """섹션 목록에서 (부모 ID, 자식 ID) 정수 쌍 생성 (ID 변환 실패/최상위 섹션은 제외)"""
+    for section in all_sections:
+        p_id = section.get("parent_id")
+        if p_id is None:
+            continue
+        try:
+            yield int(p_id), int(section["id"])
+        except (ValueError, TypeError, KeyError):
+            continue
+
+
 def get_all_subsection_ids(parent_section_id, all_sections):
     """
-    사전 인덱싱(Indexing)을 통해 성능을 비약적으로 향상시킨 버전
+    사전 인덱싱(부모→자식 맵) + 반복 BFS로 지정 섹션과 모든 하위 섹션 ID 수집
+    (재귀 호출 오버헤드와 재귀 깊이 제한 없음)
     """
-    # 1. 데이터를 정수형으로 미리 가공하고, 부모-자식 관계 맵을 생성 (O(N))
-    children_map = defaultdict(list)
-    
     # 입력 받은 parent_section_id도 미리 정수로 변환
     try:
         root_id = int(parent_section_id)
     except (ValueError, TypeError):
         return [parent_section_id]
 
-    for section in all_sections:
-        try:
-            s_id = int(section["id"])
-            p_id = section.get("parent_id")
-            # 부모가 있는 경우에만 맵에 추가
-            if p_id is not None:
-                p_id = int(p_id)
-                children_map[p_id].append(s_id)
-        except (ValueError, TypeError):
-            continue
+    # 1. 부모-자식 관계 맵 생성 (O(N))
+    children_map = defaultdict(list)
+    for p_id, s_id in _section_edges(all_sections):
+        children_map[p_id].append(s_id)
 
-    # 2. 재귀적으로 ID를 수집 (O(M), M은 하위 섹션의 개수)
+    # 2. 반복 BFS로 ID 수집 (O(M), M은 하위 섹션의 개수)
     result_ids = []
     visited = set()
-
-    def collect(current_id):
+    queue_ids = deque([root_id])
+    while queue_ids:
+        current_id = queue_ids.popleft()
         if current_id in visited:
-            return
+            continue
         visited.add(current_id)
         result_ids.append(current_id)
-        
-        # 맵에서 자식들을 바로 찾아 순회 (전체 리스트를 훑지 않음)
-        for child_id in children_map.get(current_id, []):
-            collect(child_id)
+        queue_ids.extend(children_map.get(current_id, ()))
 
-    collect(root_id)
     return result_ids
 
 
@@ -1143,6 +1639,14 @@ def pytest_sessionstart(session):
         print("[TestRail] testrail_report가 Y가 아님 - 기록 비활성화")
         return
     
+    # xdist 워커: 컨트롤러가 준비한 Run에 기록만 함 (워커마다 Run을 만들지 않음)
+    workerinput = getattr(session.config, "workerinput", None)
+    if workerinput is not None:
+        testrail_run_id = workerinput.get("testrail_run_id")
+        testrail_run_created_by_session = False
+        logger.debug(f"xdist 워커 {XDIST_WORKER}: 컨트롤러 Run(ID={testrail_run_id}) 사용")
+        return
+    
     logger.debug(f"pytest_sessionstart 실행 시작")
     logger.debug(f"현재 testrail_run_id 값: {testrail_run_id}")
     
@@ -1186,8 +1690,8 @@ def pytest_sessionstart(session):
     
     # 1. 모든 섹션 가져오기
     print(f"[TestRail] 모든 섹션 가져오기 중...")
-    all_sections = testrail_get(
-        f"get_sections/{TESTRAIL_PROJECT_ID}&suite_id={TESTRAIL_SUITE_ID}"
+    all_sections = testrail_get_all(
+        f"get_sections/{TESTRAIL_PROJECT_ID}&suite_id={TESTRAIL_SUITE_ID}", "sections"
     )
     
     # 디버깅: 섹션 구조 확인
@@ -1209,29 +1713,19 @@ def pytest_sessionstart(session):
     print(f"[TestRail] 섹션 ID {section_id_int}와 하위 섹션 {len(all_section_ids) - 1}개 발견 (중복 제거됨): {all_section_ids}")
     
     # 3. 스위트 전체 케이스 한 번에 가져오기 (페이지네이션) 후 로컬 필터링
-    all_case_ids = []
-    limit = 250
-    offset = 0
-    base_cases_url = f"get_cases/{TESTRAIL_PROJECT_ID}&suite_id={TESTRAIL_SUITE_ID}&limit={limit}&offset="
-    while True:
-        try:
-            cases = testrail_get(base_cases_url + str(offset))
-        except Exception as e:
-            logger.warning(f"스위트 전체 케이스 가져오기 실패 (offset={offset}): {e}")
-            break
-        if not cases:
-            break
-        for c in cases:
-            sid = c.get("section_id")
-            if sid is not None and sid in subtree_section_ids:
-                case_id = c["id"]
-                all_case_ids.append(case_id)
-                case_id_map.setdefault(sid, []).append(case_id)
-        if len(cases) < limit:
-            break
-        offset += limit
-    # 중복 제거 (같은 케이스가 여러 번 나올 수 있음)
-    all_case_ids = list(dict.fromkeys(all_case_ids))
+    all_case_ids = {}  # 순서 유지 집합 (중복 케이스는 한 번만)
+    try:
+        cases = testrail_get_all(f"get_cases/{TESTRAIL_PROJECT_ID}&suite_id={TESTRAIL_SUITE_ID}", "cases")
+    except Exception as e:
+        logger.warning(f"스위트 전체 케이스 가져오기 실패, 섹션별 조회로 재시도: {e}")
+        cases = _testrail_get_cases_by_section(all_section_ids)
+    for c in cases:
+        sid = c.get("section_id")
+        if sid is not None and sid in subtree_section_ids:
+            case_id = c["id"]
+            all_case_ids[case_id] = None
+            case_id_map.setdefault(sid, []).append(case_id)
+    all_case_ids = list(all_case_ids)
     
     if not all_case_ids:
         raise RuntimeError(f"[TestRail] section_id '{section_id_int}'와 하위 섹션에 케이스가 없습니다.")
@@ -1239,6 +1733,7 @@ def pytest_sessionstart(session):
     print(f"[TestRail] 총 {len(all_case_ids)}개 케이스 수집 완료")
     
     # 4. Run 생성 (이름은 config.json의 testrail_run_name)
+    from datetime import datetime
     _dt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     run_name = TESTRAIL_RUN_NAME.replace("{datetime}", _dt)
     payload = {
@@ -1257,31 +1752,73 @@ def pytest_sessionstart(session):
         logger.debug(f"pytest_sessionstart 완료: testrail_run_id={testrail_run_id}")
     except Exception as e:
         logger.error(f"TestRail Run 생성 실패: {e}")
-        import traceback
-        logger.debug(f"Run 생성 실패 상세:\n{traceback.format_exc()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Run 생성 실패 상세:\n%s", traceback.format_exc())
         raise
 
 
+TESTRAIL_SECTION_FETCH_WORKERS = 8
+
+
+def _testrail_get_cases_by_section(section_ids):
+    """섹션별 get_cases를 병렬 호출해 케이스 목록 반환 (스위트 전체 조회가 안 될 때의 폴백)"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch(sid):
+        try:
+            return testrail_get_all(
+                f"get_cases/{TESTRAIL_PROJECT_ID}&suite_id={TESTRAIL_SUITE_ID}&section_id={sid}", "cases"
+            )
+        except Exception as e:
+            logger.warning(f"섹션 {sid} 케이스 가져오기 실패: {e}")
+            return []
+
+    cases = []
+    # map은 입력 순서대로 결과를 돌려주므로 Run 케이스 순서가 실행마다 동일
+    with ThreadPoolExecutor(max_workers=TESTRAIL_SECTION_FETCH_WORKERS) as executor:
+        for section_cases in executor.map(fetch, section_ids):
+            cases.extend(section_cases)
+    return cases
+
+
 # 커스텀 로그 핸들러 - 테스트 실행 중 로그를 수집
+# 스텝/테스트당 보관할 최대 로그 줄 수 (초과 시 오래된 로그부터 버림)
+TEST_LOG_MAX_LINES = 2000
+
+
 class TestLogHandler(logging.Handler):
     """테스트 실행 중 로그를 수집하는 커스텀 핸들러"""
     def __init__(self):
         super().__init__()
-        self.logs = []
+        self.logs = deque(maxlen=TEST_LOG_MAX_LINES)
+        self._nbytes = 0  # 수집된 로그 길이 합계 (줄바꿈 포함) — 0이면 합칠 필요 없음
     
     def emit(self, record):
         """로그 레코드를 수집"""
         if record.levelno >= logging.INFO:  # INFO 이상만 수집
             log_message = self.format(record)
+            if len(self.logs) == self.logs.maxlen:
+                # 가장 오래된 줄이 밀려나므로 길이 합계에서도 제외
+                self._nbytes -= len(self.logs[0]) + 1
             self.logs.append(log_message)
+            self._nbytes += len(log_message) + 1
     
     def clear(self):
         """로그 초기화"""
-        self.logs = []
+        self.logs.clear()
+        self._nbytes = 0
     
     def get_logs(self):
         """수집된 로그 반환"""
         return "\n".join(self.logs)
+    
+    def pop_all(self):
+        """수집된 로그를 반환하고 초기화 (로그가 없으면 None)"""
+        if not self._nbytes:
+            return None
+        logs = "\n".join(self.logs)
+        self.clear()
+        return logs
 
 # 전역 로그 핸들러
 test_log_handler = TestLogHandler()
@@ -1327,29 +1864,59 @@ def pytest_runtest_logreport(report):
             # 수집된 로그 가져오기 (이 시점에 현재 테스트의 로그만 있어야 함)
             # pytest_runtest_setup과 pytest_bdd_before_scenario에서 이미 초기화했으므로
             # 현재 테스트의 로그만 있어야 함
-            logs = test_log_handler.get_logs()
+            # 가져오면서 즉시 초기화 (다음 테스트와 로그 섞임 방지)
+            logs = test_log_handler.pop_all()
             if logs and logs.strip():
                 # nodeid를 키로 사용하여 저장 (성공/실패 모두 저장)
                 test_logs[nodeid] = logs
                 # 로그 라인 수 확인
                 log_lines = logs.split(chr(10))
                 logger.debug(f"테스트 {nodeid} 로그 수집 완료: {len(log_lines)}줄 (outcome: {report.outcome})")
-                # 로그를 test_logs에 저장했으므로 즉시 초기화 (다음 테스트와 로그 섞임 방지)
                 # pytest_runtest_makereport에서 사용할 때까지는 test_logs에 보관됨
-                test_log_handler.clear()
             else:
                 logger.debug(f"테스트 {nodeid} 로그 없음 (빈 로그 또는 수집 실패, outcome: {report.outcome})")
-                # 로그가 없어도 초기화 (이전 로그 제거)
-                test_log_handler.clear()
 
 
 
+def _remove_screenshots_dir_async():
+    """스크린샷 폴더를 이름 변경 후 백그라운드 스레드에서 삭제 (pytest 종료를 막지 않음)"""
+    if not os.path.exists(SCREENSHOT_DIR):
+        return
+    import shutil
+    # 이름을 먼저 바꿔 두면 삭제 도중에도 다음 실행이 새 폴더를 바로 만들 수 있음
+    trash_dir = f"{SCREENSHOT_DIR}.trash.{os.getpid()}"
+    try:
+        os.rename(SCREENSHOT_DIR, trash_dir)
+    except OSError as e:
+        logger.warning(f"스크린샷 폴더 이름 변경 실패, 원래 경로를 삭제합니다: {e}")
+        trash_dir = SCREENSHOT_DIR
+
+    def remove():
+        shutil.rmtree(trash_dir, ignore_errors=True)  # 폴더 통째로 삭제
+        print(f"[CLEANUP] '{SCREENSHOT_DIR}' 폴더 삭제 완료")
+
+    # daemon이 아니므로 인터프리터 종료 전에 삭제가 끝남
+    threading.Thread(target=remove, name="screenshots-cleanup").start()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist 컨트롤러: sessionstart에서 준비한 TestRail Run ID를 각 워커에 전달"""
+    node.workerinput["testrail_run_id"] = testrail_run_id
+
+
 @pytest.hookimpl(trylast=True)
 def pytest_sessionfinish(session, exitstatus):
     """
     전체 테스트 종료 후 Run 닫기
     """
     global testrail_run_id, testrail_run_created_by_session
+    # Run 종료/스크린샷 삭제 전에 남은 스텝 결과 기록 완료 대기
+    _wait_testrail_writes()
+    # 첨부까지 끝났으므로 스크린샷 폴더 삭제는 Run 종료 API 호출과 겹쳐서 진행
+    # (xdist 워커는 폴더를 공유하므로 모든 워커가 끝난 뒤 컨트롤러만 삭제)
+    if XDIST_WORKER is None:
+        _remove_screenshots_dir_async()
     if (
         testrail_run_id
         and testrail_run_created_by_session
@@ -1363,7 +1930,3 @@ def pytest_sessionfinish(session, exitstatus):
     elif testrail_run_id and not TESTRAIL_CLOSE_RUN_ON_FINISH:
         print(f"[TestRail] testrail_close_run_on_finish=N - Run {testrail_run_id} 자동 종료 생략")
 
-    screenshots_dir = "screenshots"
-    if os.path.exists(screenshots_dir):
-        shutil.rmtree(screenshots_dir)  # 폴더 통째로 삭제
-        print(f"[CLEANUP] '{screenshots_dir}' 폴더 삭제 완료")
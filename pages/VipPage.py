@@ -1,12 +1,57 @@
-import time
 import logging
 from playwright.sync_api import expect
 
 logger = logging.getLogger(__name__)
 
+# BT(함께 본 상품) 캐러셀 셀렉터
+_CAROUSEL_LI = "div.vip-together_carousel > ul > li"
+_NEXT = "span > button.next"
+_PREV = "span > button.prev"
+
+# BT 캐러셀 광고태그 스캔을 브라우저에서 한 번에 수행
+# 그룹마다 새로 붙은 <li>의 광고태그 여부·링크를 모으고, 다음 버튼 클릭 후 MutationObserver로 다음 그룹 로딩을 기다림
+_BT_AD_SCAN_JS = """async (root, { itemSelector, nextSelector, groupSize, totalGroups, timeoutMs }) => {
+    const countItems = () => root.querySelectorAll(itemSelector).length;
+    const waitForItems = (expected) => new Promise(resolve => {
+        if (countItems() >= expected) return resolve();
+        const observer = new MutationObserver(() => { if (countItems() >= expected) finish(); });
+        const timer = setTimeout(finish, timeoutMs);
+        function finish() { observer.disconnect(); clearTimeout(timer); resolve(); }
+        observer.observe(root, { childList: true, subtree: true });
+    });
+    const items = [];
+    for (let g = 0; g < totalGroups; g++) {
+        const end = (g + 1) * groupSize;
+        for (const li of Array.from(root.querySelectorAll(itemSelector)).slice(items.length, end)) {
+            const a = li.querySelector('a');
+            items.push({ hasAd: !!li.querySelector('.box__ad-tag'), href: a ? a.getAttribute('href') : null });
+        }
+        if (g < totalGroups - 1) {
+            const next = root.querySelector(nextSelector);
+            if (!next) break;
+            next.click();
+            await waitForItems(end + groupSize);
+        }
+    }
+    return items;
+}"""
+
 class Vip():
     def __init__(self, page):
         self.page = page
+        # 모듈 타이틀별 (타이틀 로케이터, 모듈 로케이터) — Locator는 지연 평가라 DOM 변경 후에도 재사용 가능
+        self._module_cache = {}
+
+    def _resolve_module(self, module_title):
+        """
+        모듈 타이틀 텍스트로 타이틀 로케이터와 모듈(타이틀의 2단계 상위) 로케이터를 반환
+        :param (str) module_title : 모듈 타이틀
+        :return: (타이틀 로케이터, 모듈 로케이터)
+        """
+        if module_title not in self._module_cache:
+            child = self.page.get_by_text(module_title)
+            self._module_cache[module_title] = (child, child.locator("xpath=../.."))
+        return self._module_cache[module_title]
 
     def select_first_product(self):
         self.page.click("css=ul.search-list > li:first-child a")
@@ -21,11 +66,10 @@ class Vip():
         :return: 해당 모듈 element
         :example:
         """
-        logger.debug(f'VIP 모듈 검색 시작: module_title={module_title}')
-        child = self.page.get_by_text(module_title)
+        logger.debug('VIP 모듈 검색 시작: module_title=%s', module_title)
+        child, parent = self._resolve_module(module_title)
         child.scroll_into_view_if_needed()
-        parent = child.locator("xpath=../..")
-        target = parent.locator("div.vip-together_carousel > ul > li").nth(0)
+        target = parent.locator(_CAROUSEL_LI).first
         expect(parent).to_be_visible()
         logger.info(f'VIP 모듈 노출 확인 완료: module_title={module_title}')
 
@@ -38,13 +82,12 @@ class Vip():
         :return: 해당 모듈 노출 상품 번호, 해당 상품 로케이터
         :example:
         """
-        logger.debug(f'VIP 모듈 내 상품 노출 확인 시작: module_title={module_title}')
-        child = self.page.get_by_text(module_title)
-        parent = child.locator("xpath=../..")
-        target = parent.locator("div.vip-together_carousel > ul > li").nth(0).locator("a")
+        logger.debug('VIP 모듈 내 상품 노출 확인 시작: module_title=%s', module_title)
+        _, parent = self._resolve_module(module_title)
+        target = parent.locator(_CAROUSEL_LI).first.locator("a")
+        # 모듈 내부 상품으로 스크롤이 되면 모듈도 노출된 상태이므로 별도 노출 확인 생략
         target.scroll_into_view_if_needed()
-        expect(parent).to_be_visible()
-        goodscode = target.get_attribute("href").split('=')[-1]
+        goodscode = target.get_attribute("href").rsplit('=', 1)[-1]
         logger.info(f'VIP 모듈 내 상품 노출 확인 완료: module_title={module_title}, goodscode={goodscode}')
 
         return {
@@ -52,10 +95,27 @@ class Vip():
             "target": target
         }
 
-    def check_bt_ad_tag(self, parent):
+    def get_goodscodes(self, list_locator):
+        """
+        상품 목록(<li>) 로케이터의 모든 상품 번호를 한 번의 JS 실행으로 반환
+        :param (Locator) list_locator : 상품 <li> 목록 로케이터
+        :return: 상품 번호 리스트 (링크가 없는 상품은 None)
+        :example: self.get_goodscodes(parent.locator(_CAROUSEL_LI))
+        """
+        # assert_item_in_module과 같은 기준: 해석 전 href 속성값의 마지막 '=' 뒤 (rsplit('=', 1)[-1]과 동일)
+        return list_locator.evaluate_all(
+            """els => els.map(e => {
+                const a = e.querySelector('a');
+                const href = a ? a.getAttribute('href') : null;
+                return href === null ? null : href.slice(href.lastIndexOf('=') + 1);
+            })"""
+        )
+
+    def check_bt_ad_tag(self, parent, reset_carousel=False):
         """
         특정 모듈의 광고 태그 노출 확인
         :param (element) parent : 모듈의 element
+        :param (bool) reset_carousel : True면 확인 후 이전 버튼을 눌러 캐러셀 위치 복원
         :return: 해당 모듈 노출 광고 상품 번호, 해당 상품 로케이터
         :example:
         """
@@ -64,31 +124,35 @@ class Vip():
         ad_count = 0  # 광고태그 카운트
         goodscode = None
         target = None
-
-        for group_index in range(total_groups):
-            # 현재까지 로드된 상품 가져오기
-            products = parent.locator("div.vip-together_carousel > ul > li").all()
-            start = group_index * 5
-            end = start + 5
-
-            logger.debug(f'{group_index + 1}번째 상품 그룹 확인 시작 (상품 {start+1}~{end}번)')
-            for i, product in enumerate(products[start:end], start=start + 1):
-                # 광고태그 존재 여부 확인
-                ad_tag_locator = product.locator(".box__ad-tag")
-                if ad_tag_locator.count() > 0:
-                    ad_count += 1
-                    goodscode = parent.locator("div.vip-together_carousel > ul > li").nth(ad_count-1).locator("a").get_attribute("href").split('=')[-1]
-                    target = parent.locator("div.vip-together_carousel > ul > li").nth(ad_count - 1)
-                    logger.debug(f'{i}번째 상품: 광고 태그 존재 (goodscode={goodscode})')
-                else:
-                    logger.debug(f'{i}번째 상품: 광고 태그 없음')
-
-            # 마지막 그룹이 아니라면 버튼 클릭
-            if group_index < total_groups - 1:
-                parent.locator("span > button.next").click()
-                self.page.wait_for_timeout(2000)  # 로딩 대기
-
-        parent.locator("span > button.prev").click()
+        products_locator = parent.locator(_CAROUSEL_LI)
+
+        # 다음 버튼 클릭·로딩 대기·광고태그 수집을 한 번의 evaluate로 처리
+        products = parent.evaluate(
+            _BT_AD_SCAN_JS,
+            {
+                "itemSelector": _CAROUSEL_LI,
+                "nextSelector": _NEXT,
+                "groupSize": 5,
+                "totalGroups": total_groups,
+                "timeoutMs": 5000,
+            },
+        )
+
+        for i, product in enumerate(products, start=1):
+            # 광고태그 존재 여부 확인
+            if product["hasAd"]:
+                ad_count += 1
+                goodscode = (product["href"] or "").rsplit('=', 1)[-1]
+                logger.debug('%s번째 상품: 광고 태그 존재 (goodscode=%s)', i, goodscode)
+            else:
+                logger.debug('%s번째 상품: 광고 태그 없음', i)
+        if ad_count:
+            # 로케이터는 마지막 광고 상품에 대해서만 한 번 생성
+            last_ad_index = max(i for i, product in enumerate(products) if product["hasAd"])
+            target = products_locator.nth(last_ad_index)
+
+        if reset_carousel:
+            parent.locator(_PREV).click(no_wait_after=True)
 
         logger.info(f'BT 광고상품 광고태그 확인 완료: 총 {ad_count}개 / 15개, goodscode={goodscode}')
 
@@ -105,14 +169,17 @@ class Vip():
         :return (str) url: 클릭한 상품 url
         :example:
         """
-        logger.debug(f'VIP 상품 클릭 시작: goodscode={goodscode}')
-        time.sleep(5)
+        logger.debug('VIP 상품 클릭 시작: goodscode=%s', goodscode)
         target.click()
+        # 고정 sleep 대신 상품 번호가 포함된 URL로 전환될 때까지 대기
+        try:
+            self.page.wait_for_url(lambda u: goodscode in u, timeout=15000)
+        except Exception as e:
+            logger.warning(f'URL 전환 대기 실패: {e}')
         url = self.page.url
-        time.sleep(3)
         logger.info(f'VIP 상품 클릭 완료: goodscode={goodscode}')
 
-        logger.debug(f'VIP 상품 이동 확인 시작: goodscode={goodscode}')
+        logger.debug('VIP 상품 이동 확인 시작: goodscode=%s', goodscode)
         assert goodscode in url, f"상품 번호 {goodscode}가 URL에 포함되어야 합니다"
         logger.info(f'VIP 상품 이동 확인 완료: goodscode={goodscode}, url={url}')
 
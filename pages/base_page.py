@@ -3,18 +3,46 @@ Base Page Object 클래스
 모든 Page Object의 기본이 되는 클래스
 """
 from playwright.sync_api import Page, Locator, expect
-from typing import Any, Optional
-from urllib.parse import unquote, parse_qs, urlparse
+from typing import Any, List, Optional
+from urllib.parse import unquote, parse_qsl, urlparse, urlsplit
 import logging
+import threading
 import time
 import json
 import re
 logger = logging.getLogger(__name__)
 
+# selector의 첫 요소가 없거나 숨겨지면 true, 아니면 MutationObserver로 DOM 변경 시점에 즉시 재확인
+# (offsetParent는 position:fixed 요소에서 null이므로 크기/ClientRects로 표시 여부 판단)
+_WAIT_HIDDEN_JS = """sel => {
+    const hidden = () => {
+        const el = document.querySelector(sel);
+        return !el || !(el.offsetWidth || el.offsetHeight || el.getClientRects().length)
+            || getComputedStyle(el).visibility === 'hidden';
+    };
+    if (hidden()) return true;
+    return new Promise(resolve => {
+        const mo = new MutationObserver(() => { if (hidden()) { mo.disconnect(); resolve(true); } });
+        mo.observe(document.documentElement, { subtree: true, childList: true, attributes: true });
+    });
+}"""
+
+# 상품 요소에서 가장 가까운 상품 카드(container)로 올라가 광고 레이어 존재 여부를 한 번에 확인
+# (XPath ancestor 축 + 하위 Locator count 두 단계를 네이티브 closest/querySelector로 대체)
+_HAS_AD_LAYER_JS = """(el, container) => {
+    const card = el.closest(container);
+    return !!(card && card.querySelector('div.box__ads-layer'));
+}"""
+
 
 class BasePage:
     """모든 Page Object의 기본 클래스"""
     
+    # is_visible 기본 대기 (밀리초)
+    IS_VISIBLE_TIMEOUT_MS = 1000
+    # _poll_backoff 기본 폴링 간격 (밀리초, 마지막 값은 타임아웃까지 반복)
+    POLL_BACKOFF_SCHEDULE_MS = (50, 100, 200, 400, 800, 1500, 3000)
+    
     def __init__(self, page: Page):
         """
         BasePage 초기화
@@ -24,27 +52,107 @@ class BasePage:
         """
         self.page = page
         self.timeout = 30000  # 기본 타임아웃 30초
+        # selector → Locator (Locator는 지연 평가 참조라 같은 page에서 재사용 가능)
+        self._locator_cache: dict = {}
+    
+    def _cached_locator(self, selector: str) -> Locator:
+        """
+        selector의 Locator를 생성해 재사용 (반복 호출되는 래퍼 메서드의 Locator 생성 비용 절감)
+        
+        Args:
+            selector: CSS 선택자 또는 XPath
+        
+        Returns:
+            Locator 객체
+        """
+        locator = self._locator_cache.get(selector)
+        if locator is None:
+            locator = self._locator_cache[selector] = self.page.locator(selector)
+        return locator
     
-    def goto(self, url: str) -> None:
+    def _actionable_click(self, locator: Locator, timeout: Optional[int] = None) -> None:
+        """
+        Playwright의 자동 actionability 검사(attached·visible·stable·enabled, 뷰포트 스크롤 포함)에
+        맡겨 한 번의 click으로 처리
+        wait_for(attached/visible)·scroll_into_view_if_needed를 앞에 따로 호출하지 않도록 이 헬퍼를 사용
+        (가상화 리스트처럼 아직 렌더링되지 않은 요소만 별도 스크롤 필요)
+        
+        Args:
+            locator: 클릭할 Locator
+            timeout: 타임아웃 (기본값: self.timeout)
+        """
+        locator.click(timeout=timeout or self.timeout)
+    
+    def wait_for_hidden_fast(self, selector: str, timeout: Optional[int] = None) -> None:
+        """
+        selector의 첫 요소가 사라지거나 숨겨질 때까지 대기
+        주기적 재시도 대신 브라우저 MutationObserver로 DOM 변경 즉시 감지 (숨김 대기가 잦은 경로용)
+        
+        Args:
+            selector: CSS 선택자
+            timeout: 타임아웃 (기본값: self.timeout)
+        
+        Raises:
+            TimeoutError: 타임아웃 내에 숨겨지지 않은 경우
+        """
+        timeout = timeout or self.timeout
+        self.page.wait_for_function(_WAIT_HIDDEN_JS, arg=selector, timeout=timeout)
+    
+    def _poll_backoff(
+        self,
+        predicate,
+        timeout: Optional[int] = None,
+        schedule_ms: tuple = POLL_BACKOFF_SCHEDULE_MS,
+    ) -> bool:
+        """
+        predicate가 True가 될 때까지 점점 늘어나는 간격(schedule_ms)으로 폴링
+        곧 만족되는 조건은 짧은 간격으로 빨리 감지하고, 오래 걸리는 조건은 호출 횟수를 줄임
+        대기는 page.wait_for_timeout으로 수행해 그동안 Playwright 이벤트(request 등)도 처리됨
+        (요소 상태 대기는 expect(...).to_be_*를 우선 사용하고, 여러 호출을 묶은 조건에만 사용)
+        
+        Args:
+            predicate: 인자 없이 호출되어 bool을 반환하는 함수
+            timeout: 타임아웃 (기본값: self.timeout)
+            schedule_ms: 폴링 간격 목록 (밀리초)
+        
+        Returns:
+            타임아웃 전에 만족하면 True, 아니면 False
+        """
+        timeout = timeout or self.timeout
+        deadline = time.monotonic() + timeout / 1000.0
+        step = 0
+        while True:
+            if predicate():
+                return True
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                return False
+            interval = schedule_ms[min(step, len(schedule_ms) - 1)]
+            self.page.wait_for_timeout(min(interval, remaining_ms))
+            step += 1
+    
+    def goto(self, url: str, wait_until: str = "domcontentloaded") -> None:
         """
         페이지로 이동
         
         Args:
             url: 이동할 URL
+            wait_until: 이동 완료 기준 (기본값: domcontentloaded, URL만 확인하면 되는 경우 "commit")
         """
         logger.info(f"페이지 이동: {url}")
-        self.page.goto(url, wait_until="domcontentloaded")
+        self.page.goto(url, wait_until=wait_until)
 
-    def go_back(self, timeout: Optional[int] = None) -> None:
+    def go_back(self, timeout: Optional[int] = None, wait_until: str = "domcontentloaded") -> None:
         """
         이전 페이지로 이동 (브라우저 뒤로가기)
         
         Args:
             timeout: 타임아웃 (기본값: self.timeout)
+            wait_until: 이동 완료 기준 (기본값: domcontentloaded, URL만 확인하면 되는 경우 "commit")
         """
         timeout = timeout or self.timeout
         logger.info("이전 페이지로 이동")
-        self.page.go_back(timeout=timeout, wait_until="domcontentloaded")
+        self.page.go_back(timeout=timeout, wait_until=wait_until)
         logger.info(f"이전 페이지 이동 완료: {self.page.url}")
     
     def click(self, selector: str, timeout: Optional[int] = None) -> None:
@@ -56,8 +164,8 @@ class BasePage:
             timeout: 타임아웃 (기본값: self.timeout)
         """
         timeout = timeout or self.timeout
-        logger.debug(f"클릭: {selector}")
-        self.page.locator(selector).click(timeout=timeout)
+        logger.debug("클릭: %s", selector)
+        self._cached_locator(selector).click(timeout=timeout)
     
     def fill(self, selector: str, value: str, timeout: Optional[int] = None) -> None:
         """
@@ -69,8 +177,53 @@ class BasePage:
             timeout: 타임아웃 (기본값: self.timeout)
         """
         timeout = timeout or self.timeout
-        logger.debug(f"입력: {selector} = {value}")
-        self.page.locator(selector).fill(value, timeout=timeout)
+        logger.debug("입력: %s = %s", selector, value)
+        self._cached_locator(selector).fill(value, timeout=timeout)
+    
+    def ensure_checked(self, selector: str, timeout: Optional[int] = None) -> None:
+        """
+        체크박스/라디오를 체크 상태로 설정 (이미 체크되어 있으면 아무 동작 안 함)
+        is_checked() 확인 후 check()를 따로 호출하지 않고 set_checked 한 번으로 처리
+        
+        Args:
+            selector: CSS 선택자 또는 XPath
+            timeout: 타임아웃 (기본값: self.timeout)
+        """
+        timeout = timeout or self.timeout
+        logger.debug("체크 상태 설정: %s", selector)
+        self._cached_locator(selector).set_checked(True, timeout=timeout)
+    
+    def wait_for_any_text(
+        self,
+        selector: str,
+        texts: List[str],
+        exact: bool = False,
+        timeout: Optional[int] = None,
+    ) -> Locator:
+        """
+        selector 요소 중 texts 중 하나를 포함(exact=True면 일치)하는 첫 요소가 보일 때까지 대기
+        locator(sel, has_text=...)를 텍스트마다 만들지 않고 :has-text()/:text-is() CSS 목록 하나로 합쳐 한 번에 평가
+        (텍스트만으로 특정 가능한 요소는 get_by_text/get_by_role 사용 권장)
+        
+        Args:
+            selector: 대상 요소 CSS 선택자 (예: "span.text__name")
+            texts: 찾을 텍스트 목록
+            exact: True면 :text-is() 일치, False면 :has-text() 포함 (대소문자 무시)
+            timeout: 타임아웃 (기본값: self.timeout)
+        
+        Returns:
+            매칭된 첫 번째 요소 Locator
+        """
+        timeout = timeout or self.timeout
+        pseudo = "text-is" if exact else "has-text"
+        union = ", ".join(
+            '{}:{}("{}")'.format(selector, pseudo, t.replace("\\", "\\\\").replace('"', '\\"'))
+            for t in texts
+        )
+        logger.debug("텍스트 노출 대기: %s", union)
+        locator = self.page.locator(union).first
+        locator.wait_for(state="visible", timeout=timeout)
+        return locator
     
     def get_text(self, selector: str, timeout: Optional[int] = None) -> str:
         """
@@ -84,8 +237,8 @@ class BasePage:
             요소의 텍스트
         """
         timeout = timeout or self.timeout
-        logger.debug(f"텍스트 가져오기: {selector}")
-        return self.page.locator(selector).inner_text(timeout=timeout)
+        logger.debug("텍스트 가져오기: %s", selector)
+        return self._cached_locator(selector).inner_text(timeout=timeout)
     
     def wait_for_selector(self, selector: str, timeout: Optional[int] = None) -> Locator:
         """
@@ -99,7 +252,7 @@ class BasePage:
             Locator 객체
         """
         timeout = timeout or self.timeout
-        logger.debug(f"요소 대기: {selector}")
+        logger.debug("요소 대기: %s", selector)
         return self.page.wait_for_selector(selector, timeout=timeout)
     
     def wait_for_url(self, url_pattern: str, timeout: Optional[int] = None) -> None:
@@ -111,7 +264,7 @@ class BasePage:
             timeout: 타임아웃 (기본값: self.timeout)
         """
         timeout = timeout or self.timeout
-        logger.debug(f"URL 대기: {url_pattern}")
+        logger.debug("URL 대기: %s", url_pattern)
         self.page.wait_for_url(url_pattern, timeout=timeout)
 
     def wait_for_module_exposure_increase(
@@ -274,20 +427,45 @@ class BasePage:
         )
         return False
 
+    def expect_visible(self, locator: Locator, timeout: Optional[int] = None) -> bool:
+        """
+        expect().to_be_visible()로 요소 노출 여부 확인
+        
+        자동 재시도 단정이라 요소가 나타나는 즉시 반환하며,
+        여러 요소가 매칭되어도 strict 모드 오류 없이 첫 번째 요소로 판단.
+        
+        Args:
+            locator: 확인할 로케이터
+            timeout: 타임아웃 (기본값: IS_VISIBLE_TIMEOUT_MS)
+            
+        Returns:
+            요소가 보이면 True, 타임아웃 내 나타나지 않으면 False
+        """
+        try:
+            expect(locator.first).to_be_visible(timeout=timeout or self.IS_VISIBLE_TIMEOUT_MS)
+            return True
+        except AssertionError:
+            return False
+    
     def is_visible(self, selector: str, timeout: Optional[int] = None) -> bool:
         """
         요소가 보이는지 확인
         
+        없는 요소 확인 시 긴 대기가 생기지 않도록 기본 대기는 짧게 둠.
+        페이지 이동 직후처럼 나타날 때까지 기다려야 하면 timeout을 명시.
+        
         Args:
             selector: CSS 선택자 또는 XPath
-            timeout: 타임아웃 (기본값: self.timeout)
+            timeout: 타임아웃 (기본값: IS_VISIBLE_TIMEOUT_MS, 0이면 대기 없이 현재 상태만 확인)
             
         Returns:
             요소가 보이면 True, 아니면 False
         """
-        timeout = timeout or self.timeout
+        if timeout == 0:
+            return self._cached_locator(selector).first.is_visible()
+        timeout = timeout or self.IS_VISIBLE_TIMEOUT_MS
         try:
-            self.page.locator(selector).wait_for(state="visible", timeout=timeout)
+            self._cached_locator(selector).wait_for(state="visible", timeout=timeout)
             return True
         except Exception:
             return False
@@ -340,7 +518,7 @@ class BasePage:
             self.get_by_role("button", name="검색").click()
             self.get_by_role("textbox", name="이름").fill("홍길동")
         """
-        logger.debug(f"역할 기반 로케이터: role={role}, name={name}")
+        logger.debug("역할 기반 로케이터: role=%s, name=%s", role, name)
         return self.page.get_by_role(role, name=name, **kwargs)
     
     def get_by_text(self, text: str, exact: bool = False) -> Locator:
@@ -358,7 +536,7 @@ class BasePage:
             self.get_by_text("로그인").click()
             self.get_by_text("저장하기", exact=True).click()
         """
-        logger.debug(f"텍스트 기반 로케이터: text={text}, exact={exact}")
+        logger.debug("텍스트 기반 로케이터: text=%s, exact=%s", text, exact)
         return self.page.get_by_text(text, exact=exact)
     
     def get_by_label(self, text: str, exact: bool = False) -> Locator:
@@ -375,7 +553,7 @@ class BasePage:
         Example:
             self.get_by_label("이메일").fill("test@example.com")
         """
-        logger.debug(f"라벨 기반 로케이터: text={text}, exact={exact}")
+        logger.debug("라벨 기반 로케이터: text=%s, exact=%s", text, exact)
         return self.page.get_by_label(text, exact=exact)
     
     def get_by_placeholder(self, text: str, exact: bool = False) -> Locator:
@@ -392,7 +570,7 @@ class BasePage:
         Example:
             self.get_by_placeholder("검색어를 입력하세요").fill("노트북")
         """
-        logger.debug(f"Placeholder 기반 로케이터: text={text}, exact={exact}")
+        logger.debug("Placeholder 기반 로케이터: text=%s, exact=%s", text, exact)
         return self.page.get_by_placeholder(text, exact=exact)
     
     def get_by_alt_text(self, text: str, exact: bool = False) -> Locator:
@@ -409,7 +587,7 @@ class BasePage:
         Example:
             self.get_by_alt_text("로고").click()
         """
-        logger.debug(f"Alt 텍스트 기반 로케이터: text={text}, exact={exact}")
+        logger.debug("Alt 텍스트 기반 로케이터: text=%s, exact=%s", text, exact)
         return self.page.get_by_alt_text(text, exact=exact)
     
     def get_by_title(self, text: str, exact: bool = False) -> Locator:
@@ -426,7 +604,7 @@ class BasePage:
         Example:
             self.get_by_title("도움말").click()
         """
-        logger.debug(f"Title 기반 로케이터: text={text}, exact={exact}")
+        logger.debug("Title 기반 로케이터: text=%s, exact=%s", text, exact)
         return self.page.get_by_title(text, exact=exact)
     
     def get_by_test_id(self, test_id: str) -> Locator:
@@ -442,7 +620,7 @@ class BasePage:
         Example:
             self.get_by_test_id("search-button").click()
         """
-        logger.debug(f"Test ID 기반 로케이터: test_id={test_id}")
+        logger.debug("Test ID 기반 로케이터: test_id=%s", test_id)
         return self.page.get_by_test_id(test_id)
     
     def locator(self, selector: str) -> Locator:
@@ -459,8 +637,8 @@ class BasePage:
             self.locator("button.submit").click()
             self.locator("//div[@class='item']").first.click()
         """
-        logger.debug(f"범용 로케이터: selector={selector}")
-        return self.page.locator(selector)
+        logger.debug("범용 로케이터: selector=%s", selector)
+        return self._cached_locator(selector)
 
     def scroll_module_into_view(self, module_locator: Locator) -> None:
         """
@@ -474,7 +652,7 @@ class BasePage:
             module_locator.scroll_into_view_if_needed()
         except Exception as e:
             logger.warning(f"scroll_into_view_if_needed 실패, 강제 스크롤 시도: {e}")
-            module_locator.evaluate("el => el.scrollIntoView({behavior: 'smooth', block: 'center'})")
+            module_locator.evaluate("el => el.scrollIntoView({behavior: 'auto', block: 'center'})")
 
     def scroll_module_into_view_bottom(self, module_locator: Locator) -> None:
         """
@@ -488,7 +666,7 @@ class BasePage:
             module_locator.evaluate("el => el.scrollIntoView({ block: 'end', inline: 'nearest' })")
         except Exception as e:
             logger.warning(f"scroll_into_view_if_needed 실패, 강제 스크롤 시도: {e}")
-            module_locator.evaluate("el => el.scrollIntoView({behavior: 'smooth', block: 'center'})")
+            module_locator.evaluate("el => el.scrollIntoView({behavior: 'auto', block: 'center'})")
 
     def get_module_parent(self, module_locator: Locator, n: int) -> Locator:
         """
@@ -504,10 +682,23 @@ class BasePage:
         if n < 1:
             raise ValueError("n은 1 이상의 정수여야 합니다.")
 
-        logger.debug(f"모듈 부모 요소 {n}단계 찾기")
+        logger.debug("모듈 부모 요소 %s단계 찾기", n)
+
+        # ancestor 축은 역순이라 [n]이 n단계 위 부모 (../.. 반복과 동일, 한 번의 축 탐색)
+        return module_locator.locator(f"xpath=ancestor::*[{n}]")
 
-        xpath = "xpath=" + "/".join([".."] * n)
-        return module_locator.locator(xpath)
+    def has_ad_layer(self, product_locator: Locator, container_selector: str = "div.box__item-container") -> bool:
+        """
+        상품 요소가 속한 상품 카드 안에 광고 레이어(div.box__ads-layer)가 있는지 확인
+        
+        Args:
+            product_locator: 상품 Locator 객체 (복수 매칭 시 첫 번째 요소 기준)
+            container_selector: 상품 카드 CSS 선택자 (기본값: div.box__item-container)
+            
+        Returns:
+            광고 레이어가 있으면 True, 아니면 False
+        """
+        return product_locator.first.evaluate(_HAS_AD_LAYER_JS, container_selector)
 
     def scroll_product_into_view(self, product_locator: Locator) -> None:
         """
@@ -521,7 +712,7 @@ class BasePage:
             product_locator.scroll_into_view_if_needed()
         except Exception as e:
             logger.warning(f"scroll_into_view_if_needed 실패, 강제 스크롤 시도: {e}")
-            product_locator.evaluate("el => el.scrollIntoView({behavior: 'smooth', block: 'center'})")
+            product_locator.evaluate("el => el.scrollIntoView({behavior: 'auto', block: 'center'})")
 
     def scroll_product_into_view_bottom(self, product_locator: Locator) -> None:
         """
@@ -535,7 +726,7 @@ class BasePage:
             product_locator.scroll_into_view_if_needed()
         except Exception as e:
             logger.warning(f"scroll_into_view_if_needed 실패, 강제 스크롤 시도: {e}")
-            product_locator.evaluate("el => el.scrollIntoView({behavior: 'smooth', block: 'end'})")            
+            product_locator.evaluate("el => el.scrollIntoView({behavior: 'auto', block: 'end'})")            
 
     _SCROLL_LAZY_CONTENT_JS = """
     ({ step, horizontal }) => {
@@ -767,7 +958,7 @@ class BasePage:
                     return
             except Exception as e:
                 # evaluate 실패 시 기본 스크롤 폴백 (성공 확인 전에는 return 하지 않음)
-                logger.debug(f"ensure_locator_in_horizontal_view evaluate 실패: {e}")
+                logger.debug("ensure_locator_in_horizontal_view evaluate 실패: %s", e)
                 try:
                     target.scroll_into_view_if_needed()
                     viewport_ratio = target.evaluate(
@@ -787,7 +978,7 @@ class BasePage:
                     if viewport_ratio and viewport_ratio > 0:
                         return
                 except Exception as fallback_error:
-                    logger.debug(f"ensure_locator_in_horizontal_view fallback 실패: {fallback_error}")
+                    logger.debug("ensure_locator_in_horizontal_view fallback 실패: %s", fallback_error)
 
             time.sleep(pause_ms / 1000.0)
 
@@ -960,8 +1151,8 @@ class BasePage:
         Returns:
             상품 Locator 객체
         """
-        logger.debug(f"상품 번호로 상품 찾기: {goodscode}")
-        return self.page.locator(f'a[data-montelena-goodscode="{goodscode}"]').nth(0)
+        logger.debug("상품 번호로 상품 찾기: %s", goodscode)
+        return self.page.locator(f'a[data-montelena-goodscode="{goodscode}"]').first
 
     def get_by_role_and_click(self, role: str, name: str = None, timeout: Optional[int] = None, **kwargs) -> None:
         """
@@ -974,7 +1165,7 @@ class BasePage:
             **kwargs: 추가 옵션
         """
         timeout = timeout or self.timeout
-        logger.debug(f"역할 기반 클릭: role={role}, name={name}")
+        logger.debug("역할 기반 클릭: role=%s, name=%s", role, name)
         self.get_by_role(role, name=name, **kwargs).click(timeout=timeout)
     
     def get_by_role_and_fill(self, role: str, value: str, name: str = None, timeout: Optional[int] = None, **kwargs) -> None:
@@ -989,7 +1180,7 @@ class BasePage:
             **kwargs: 추가 옵션
         """
         timeout = timeout or self.timeout
-        logger.debug(f"역할 기반 입력: role={role}, name={name}, value={value}")
+        logger.debug("역할 기반 입력: role=%s, name=%s, value=%s", role, name, value)
         self.get_by_role(role, name=name, **kwargs).fill(value, timeout=timeout)
     
     def get_by_text_and_click(self, text: str, exact: bool = False, timeout: Optional[int] = None) -> None:
@@ -1002,7 +1193,7 @@ class BasePage:
             timeout: 타임아웃 (기본값: self.timeout)
         """
         timeout = timeout or self.timeout
-        logger.debug(f"텍스트 기반 클릭: text={text}")
+        logger.debug("텍스트 기반 클릭: text=%s", text)
         self.get_by_text(text, exact=exact).click(timeout=timeout)
     
     def click_and_expect_dialog(self, selector: str = None, locator: Locator = None, timeout: Optional[int] = None, accept: bool = True) -> None:
@@ -1024,30 +1215,30 @@ class BasePage:
         
         timeout = timeout or self.timeout
         action = "수락" if accept else "취소"
-        logger.debug(f"얼럿을 기대하며 클릭 (timeout: {timeout}ms, {action})")
+        logger.debug("얼럿을 기대하며 클릭 (timeout: %sms, %s)", timeout, action)
         
-        # 얼럿 처리용 변수
-        dialog_handled = False
+        # 얼럿 처리용 변수 (처리 완료/오류 모두 done으로 신호)
+        done = threading.Event()
         dialog_message = None
         dialog_error = None
         
         def handle_dialog(dialog):
             """얼럿 핸들러"""
-            nonlocal dialog_handled, dialog_message
+            nonlocal dialog_message, dialog_error
             dialog_message = dialog.message
-            logger.debug(f"얼럿 감지됨: {dialog_message}")
+            logger.debug("얼럿 감지됨: %s", dialog_message)
             try:
                 if accept:
                     dialog.accept()
-                    logger.debug(f"얼럿 확인 버튼 클릭: {dialog_message}")
+                    logger.debug("얼럿 확인 버튼 클릭: %s", dialog_message)
                 else:
                     dialog.dismiss()
-                    logger.debug(f"얼럿 취소 버튼 클릭: {dialog_message}")
-                dialog_handled = True
+                    logger.debug("얼럿 취소 버튼 클릭: %s", dialog_message)
             except Exception as e:
-                nonlocal dialog_error
                 dialog_error = e
                 logger.error(f"얼럿 처리 중 오류: {e}")
+            finally:
+                done.set()
         
         # 얼럿 리스너 등록 (클릭 전에 설정해야 함)
         self.page.on("dialog", handle_dialog)
@@ -1058,24 +1249,23 @@ class BasePage:
                 logger.debug("Locator를 사용하여 클릭")
                 locator.click(timeout=timeout)
             else:
-                logger.debug(f"Selector를 사용하여 클릭: {selector}")
+                logger.debug("Selector를 사용하여 클릭: %s", selector)
                 self.click(selector, timeout=timeout)
             
             logger.debug("클릭 완료, 얼럿 대기 중...")
             
             # 얼럿이 처리될 때까지 대기 (최대 timeout)
+            # sync API는 Playwright 호출 중에만 dialog 이벤트를 처리하므로 짧게 이벤트 루프를 돌리며 done만 확인
             deadline = time.time() + (timeout / 1000.0)
-            while time.time() < deadline:
-                if dialog_handled:
-                    logger.info(f"얼럿 {action} 완료: {dialog_message}")
-                    return
-                if dialog_error:
-                    raise dialog_error
-                time.sleep(0.1)  # 100ms 간격으로 체크
+            while not done.is_set():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    raise TimeoutError(f"얼럿이 나타나지 않았습니다 (timeout: {timeout}ms)")
+                self.page.wait_for_timeout(min(0.05, remaining) * 1000)
             
-            # 타임아웃 발생
-            if not dialog_handled:
-                raise TimeoutError(f"얼럿이 나타나지 않았습니다 (timeout: {timeout}ms)")
+            if dialog_error:
+                raise dialog_error
+            logger.info(f"얼럿 {action} 완료: {dialog_message}")
                 
         except Exception as e:
             logger.error(f"얼럿 처리 중 오류 발생: {e}")
@@ -1111,10 +1301,9 @@ class BasePage:
             url: 파싱할 URL
             
         Returns:
-            쿼리 파라미터 딕셔너리
+            쿼리 파라미터 딕셔너리 ({키: 값}, 같은 키가 여러 번 오면 마지막 값)
         """
-        parsed_url = urlparse(url)
-        return parse_qs(parsed_url.query)
+        return dict(parse_qsl(urlsplit(url).query))
     
     def decode_url(self, encoded_url: str) -> str:
         """
@@ -1135,29 +1324,38 @@ class BasePage:
     @staticmethod
     def wait_until_pdp_pv_collected(tracker, goodscode: str, page: Page, timeout_ms: int = 15000, poll_interval: float = 0.3) -> None:
         """
-        PDP PV 로그 수집이 확인될 때까지 폴링
-        해당 goodscode에 대한 PDP PV 로그 수신 시 logger.info 출력 후 종료
+        PDP PV 로그 수집이 확인될 때까지 대기
+        해당 goodscode에 대한 PDP PV 로그 수신 시 tracker가 Event를 set하면 logger.info 출력 후 종료
+        
+        sync API는 Playwright 호출 중에만 request 이벤트를 처리하므로 Event.wait()로 블로킹하지 않고
+        page.wait_for_timeout으로 짧게 이벤트 루프를 돌리며 Event만 확인함 (로그 목록 재조회 없음)
         
         Args:
             tracker: NetworkTracker 인스턴스
             goodscode: 상품 코드
             page: Playwright Page 객체
             timeout_ms: 타임아웃 (밀리초, 기본값: 15000)
-            poll_interval: 폴링 간격 (초, 기본값: 0.3)
+            poll_interval: 이벤트 처리 단위 최댓값 (초, 기본값: 0.3) — 10ms에서 시작해 1.5배씩 늘림
         """
         try:
             page.wait_for_load_state("domcontentloaded", timeout=3000)
         except Exception:
             pass
-        deadline = time.time() + (timeout_ms / 1000.0)
-        while time.time() < deadline:
-            logs = tracker.get_pdp_pv_logs_by_goodscode(goodscode)
-            if logs:
-                logger.info(f"PDP PV 수집 확인됨: goodscode={goodscode}")
-                return
-            time.sleep(poll_interval)
-        logger.warning(f"PDP PV 수집 대기 타임아웃 ({timeout_ms}ms): goodscode={goodscode}")
-        time.sleep(2)
+        collected = tracker.register_pdp_pv_waiter(goodscode)
+        try:
+            deadline = time.time() + (timeout_ms / 1000.0)
+            # 대부분 DCL 직후 수신되므로 짧게 시작해 점점 간격을 늘림 (지수 백오프)
+            interval = 0.01
+            while not collected.is_set():
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    logger.warning(f"PDP PV 수집 대기 타임아웃 ({timeout_ms}ms): goodscode={goodscode}")
+                    return
+                page.wait_for_timeout(min(interval, remaining) * 1000)
+                interval = min(interval * 1.5, poll_interval)
+            logger.info(f"PDP PV 수집 확인됨: goodscode={goodscode}")
+        finally:
+            tracker.unregister_pdp_pv_waiter(goodscode)
 
     def get_module_by_spmc(self, module_spmc: str) -> Locator:
         """
@@ -1169,7 +1367,7 @@ class BasePage:
         Returns:
             모듈 Locator 객체
         """
-        logger.debug(f"페이지에서 spmc로 모듈 찾기: {module_spmc}")
+        logger.debug("페이지에서 spmc로 모듈 찾기: %s", module_spmc)
         return self.page.locator(f".module-exp-spm-c[data-spm='{module_spmc}']")
 
     def get_module_by_spmc_in_div(self, module_spmc: str) -> Locator:
@@ -1182,7 +1380,7 @@ class BasePage:
         Returns:
             모듈 Locator 객체
         """
-        logger.debug(f"페이지에서 spmc로 모듈 찾기: {module_spmc}")
+        logger.debug("페이지에서 spmc로 모듈 찾기: %s", module_spmc)
         return self.page.locator(f"div[data-spm='{module_spmc}']")
 
     def verify_keyword_in_url(self, page_type: str, timeout: int = 10000) -> None:
@@ -1202,7 +1400,7 @@ class BasePage:
         else:
             # 시나리오에 정의되지 않은 타입이 들어올 경우
             raise ValueError(f"정의되지 않은 페이지 타입입니다: {page_type}")
-        logger.debug(f"URL에 특정 키워드 포함 확인: {keyword}")
+        logger.debug("URL에 특정 키워드 포함 확인: %s", keyword)
         try:
             # re.IGNORECASE를 추가하여 대소문자 구분 없이 더 견고하게 검증합니다.
             expect(self.page).to_have_url(
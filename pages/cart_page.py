@@ -1,15 +1,47 @@
+import os
 import time
 import logging
 import json
 from pages.base_page import BasePage
-from playwright.sync_api import Page, Locator, expect
-from utils.urls import product_url, search_url, cart_url
-from typing import Optional
+from playwright.sync_api import Page, Locator, expect, TimeoutError as PlaywrightTimeoutError
+from utils.urls import product_url, search_url, cart_url, ATC_BEACON_URL_PATTERN
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# 모듈 타이틀별 광고상품 여부 ("Y"/"N", "F"는 상품별 광고 태그 확인 필요)
+_CART_MODULE_AD_CHECK = {
+    "장바구니 최저가": "N",
+    "장바구니 BT": "Y"
+}
+
+# 헤더 장바구니 링크: link__cart(acode=200004339) / btn-cart(acode=200004438) / 장바구니 도메인 링크
+# 하나의 CSS 선택자 목록으로 합쳐 한 번에 평가 (복수 매칭 시 문서 순서상 첫 번째 사용, .or_() 체인과 동일)
+CART_LINK_SELECTORS = "a.link__cart, a.btn-cart, a[href*='cart.gmarket.co.kr']"
+# 모듈 첫 상품(<a>)의 goodscode·광고 레이어 여부를 한 번에 조회 (get_product_code/BasePage.has_ad_layer와 동일 기준)
+_INSPECT_FIRST_PRODUCT_JS = """root => {
+    const a = root.querySelector('a');
+    if (!a) return null;
+    const attr = 'data-montelena-goodscode';
+    const goodscode = a.getAttribute(attr) || (a.parentElement && a.parentElement.getAttribute(attr));
+    const card = a.closest('div.box__item-container');
+    return { goodscode, isAd: !!(card && card.querySelector('div.box__ads-layer')) };
+}"""
+
+# ATC 비콘 대기 상한 (ms) - 기존 고정 sleep(1.5초)과 동일, 비콘이 오면 즉시 반환
+ATC_BEACON_TIMEOUT_MS = 1500
+# 비콘 대기가 타임아웃된 경우 추가 플러시 대기 (ms) - 로컬 0, CI 500 (ATC_FLUSH_MS 환경변수로 변경 가능)
+ATC_FLUSH_MS = int(os.environ.get("ATC_FLUSH_MS", "500" if os.environ.get("CI") else "0"))
+
 
 class CartPage(BasePage):
+    # 선택자 정의 (mweb)
+    BUY_BUTTON_SEL = ".button__buy--normal"
+    CART_BUTTON_SEL = ".button__cart--normal"
+    GROUP_LAYER_SEL = ".button__select.sprite > .box__thumbnail"
+    CART_TITLE_SEL = "h1.box__title"
+    MODULE_CART_BUTTON_SEL = '.button__cart[data-montelena-goodscode="{}"]'
+
     def __init__(self, page: Page):
         """
         CartPage 초기화
@@ -18,21 +50,50 @@ class CartPage(BasePage):
             page: Playwright Page 객체
         """
         super().__init__(page)
+        # 자주 쓰는 버튼 Locator를 인스턴스당 한 번만 생성해 재사용
+        self._buy_btn = page.locator(self.BUY_BUTTON_SEL).first
+        self._cart_btn = page.locator(self.CART_BUTTON_SEL).first
+        # goodscode → 모듈 내 장바구니 버튼 Locator (페이지 이동 시 초기화)
+        self._button_cache: dict = {}
 
-    def go_to_cart_page(self):
+    def _button_locator(self, goodscode: str) -> Locator:
+        """
+        goodscode의 모듈 내 장바구니 버튼 Locator를 생성해 재사용
+        (click_cart_button_in_module / check_cart_added가 같은 선택자를 반복 생성하지 않도록 함)
+        """
+        goodscode = str(goodscode)
+        locator = self._button_cache.get(goodscode)
+        if locator is None:
+            locator = self._button_cache[goodscode] = self.page.locator(
+                self.MODULE_CART_BUTTON_SEL.format(goodscode)
+            )
+        return locator
+
+    def go_to_cart_page(self, fast: bool = True):
         """
         장바구니 페이지로 이동
+        fast=True면 응답 헤더 수신(commit) 즉시 반환하므로, 실제 로드 확인은 wait_for_cart_page_load()로 수행
+
+        Args:
+            fast: True면 wait_until="commit", False면 "domcontentloaded"
         """
         logger.debug("장바구니 페이지로 이동")
-        self.page.goto(cart_url(), wait_until="domcontentloaded", timeout=30000)
+        self._button_cache.clear()
+        self.page.goto(cart_url(), wait_until="commit" if fast else "domcontentloaded", timeout=30000)
         logger.info("장바구니 페이지 이동 완료")
     
-    def go_to_product_page(self, goodscode: str):
+    def go_to_product_page(self, goodscode: str, fast: bool = True):
         """
         상품 페이지로 이동
+        fast=True면 응답 헤더 수신(commit) 즉시 반환하므로, 이후 버튼 클릭의 actionability 대기가 로드 확인 역할을 함
+
+        Args:
+            goodscode: 상품번호
+            fast: True면 wait_until="commit", False면 "domcontentloaded"
         """
         logger.debug("장바구니 페이지로 이동")
-        self.page.goto(product_url(goodscode), wait_until="domcontentloaded", timeout=30000)
+        self._button_cache.clear()
+        self.page.goto(product_url(goodscode), wait_until="commit" if fast else "domcontentloaded", timeout=30000)
         logger.info("장바구니 페이지 이동 완료")
 
 
@@ -41,10 +102,7 @@ class CartPage(BasePage):
         구매하기 버튼 클릭
         """
         logger.debug("구매하기 버튼 클릭")
-        btn = self.page.locator(".button__buy--normal").nth(0)
-        btn.wait_for(state="visible", timeout=timeout)
-        btn.scroll_into_view_if_needed(timeout=timeout)
-        btn.click(timeout=timeout)
+        self._actionable_click(self._buy_btn, timeout=timeout)
         logger.info("구매하기 버튼 클릭 완료")
 
     def click_cart_now_button(self, timeout: int = 10000) -> None:
@@ -52,10 +110,7 @@ class CartPage(BasePage):
         장바구니 버튼 클릭
         """
         logger.debug("장바구니 버튼 클릭")
-        btn = self.page.locator(".button__cart--normal").nth(0)
-        btn.wait_for(state="visible", timeout=timeout)
-        btn.scroll_into_view_if_needed(timeout=timeout)
-        btn.click(timeout=timeout)
+        self._actionable_click(self._cart_btn, timeout=timeout)
         logger.info("장바구니 버튼 클릭 완료")
 
     def select_group_product(self, n: int, timeout: int = 10000) -> None:
@@ -66,26 +121,21 @@ class CartPage(BasePage):
             n: 그룹상품 번호
             timeout: 타임아웃 (기본값: 10000ms)
         """
-        if n < 10:
-            n = f"0{n}"
-        else:
-            n = f"{n}"
+        idx = f"{int(n):02d}"
         
         logger.debug("그룹 옵션레이어 클릭 시도 (.button__select.sprite)")
-        select_btn = self.page.locator(".button__select.sprite > .box__thumbnail").first
+        select_btn = self.page.locator(self.GROUP_LAYER_SEL).first
         select_btn.click()
         logger.debug("그룹 옵션 버튼 클릭 완료")
 
         # span.text__name "상품 선택" 이 나타날 때까지 대기 (옵션 레이어 표시)
-        option_layer = self.page.locator("span.text__name", has_text="상품 선택")
-        option_layer.wait_for(state="visible", timeout=timeout)
+        self.wait_for_any_text("span.text__name", ["상품 선택"], timeout=timeout)
         logger.debug("상품 선택 레이어 표시됨")
 
         # span.text__num "상품 {n}" 인 그룹상품 (클릭은 부모 행에서 수행)
-        group_product = self.page.locator("span.text__num", has_text=f"상품 {n}").first.locator("xpath=..")
-        group_product.scroll_into_view_if_needed(timeout=timeout)
+        group_product = self.page.locator("span.text__num", has_text=f"상품 {idx}").first.locator("xpath=..")
         
-        # n번쨰 그룹상품 강제 클릭 (부모 요소가 실제 클릭 영역)
+        # n번쨰 그룹상품 강제 클릭 (부모 요소가 실제 클릭 영역, force여도 tap이 뷰포트로 스크롤함)
         group_product.tap(timeout=timeout, force=True)
 
         # button, text "선택" 인 요소 클릭
@@ -99,8 +149,7 @@ class CartPage(BasePage):
         <h1 class="box__title"> 내 텍스트 "장바구니"가 보일 때까지 대기
         """
         logger.debug("장바구니 페이지 로드 대기 (h1.box__title + 텍스트 '장바구니')")
-        loc = self.page.locator("h1.box__title", has_text="장바구니")
-        loc.wait_for(state="visible", timeout=self.timeout)
+        self.wait_for_any_text(self.CART_TITLE_SEL, ["장바구니"])
         logger.info("장바구니 페이지 로드 확인됨")
         
     def select_all_and_delete(self, max_rounds: int = 3) -> None:
@@ -116,12 +165,8 @@ class CartPage(BasePage):
             if empty_msg.is_visible():
                 logger.debug("장바구니가 비어 있음, 선택삭제 반복 종료")
                 return
-            loc = self.page.locator("#item_all_select")
-            if not loc.is_checked():
-                loc.check()
-                logger.debug("전체 선택 체크 완료")
-            else:
-                logger.debug("전체 선택 이미 체크됨")
+            self.ensure_checked("#item_all_select")
+            logger.debug("전체 선택 체크 완료")
             self.click_and_expect_dialog(selector="button.btn_del:has-text('선택삭제')")
             logger.debug("선택삭제 버튼 클릭, 확인 얼럿 수락")
             time.sleep(0.5)
@@ -135,18 +180,9 @@ class CartPage(BasePage):
         Args:
             timeout: 타임아웃 (기본값: 10000ms)
         """
-        # link__cart(acode=200004339) / btn-cart(acode=200004438) 등 장바구니 링크 공통 (복수 매칭 시 첫 번째 사용)
-        cart_link = (
-            self.page.locator('a.link__cart[data-montelena-acode="200004339"]')
-            .or_(self.page.locator('a.link__cart[data-montelena-type="core"]'))
-            .or_(self.page.locator("a.link__cart"))
-            .or_(self.page.locator('a.btn-cart[data-montelena-acode="200004438"]'))
-            .or_(self.page.locator("a.btn-cart"))
-            .or_(self.page.locator('a[href*="cart.gmarket.co.kr"]'))
-        ).first
+        cart_link = self.page.locator(CART_LINK_SELECTORS).first
         logger.debug("장바구니 링크 클릭")
-        cart_link.wait_for(state="attached", timeout=timeout)
-        cart_link.click(timeout=timeout)
+        self._actionable_click(cart_link, timeout=timeout)
         logger.info("장바구니 페이지로 이동 완료")
 
     def check_module_in_cart(self, module_title: str, timeout: Optional[int] = None) -> Locator:
@@ -161,7 +197,7 @@ class CartPage(BasePage):
             모듈 Locator 객체
         """
         timeout = timeout or self.timeout
-        logger.debug(f"모듈 찾기: {module_title} (timeout: {timeout}ms)")
+        logger.debug("모듈 찾기: %s (timeout: %sms)", module_title, timeout)
         
         if module_title == "장바구니 최저가":
             locator = self.page.locator(".text__title strong", has_text="최저가")
@@ -171,7 +207,7 @@ class CartPage(BasePage):
             locator = self.page.locator(".text__title", has_text=module_title)
         
         # 모듈이 나타날 때까지 대기
-        logger.debug(f"모듈 노출 대기 중: {module_title}")
+        logger.debug("모듈 노출 대기 중: %s", module_title)
         locator.wait_for(state="visible", timeout=timeout)
         locator.scroll_into_view_if_needed(timeout=timeout)
         logger.info(f"모듈 노출 확인됨: {module_title}")
@@ -191,17 +227,12 @@ class CartPage(BasePage):
         Raises:
             ValueError: 알 수 없는 모듈 타이틀인 경우
         """
-        logger.debug(f"모듈 내 광고상품 노출 확인: {modulel_title}")
+        logger.debug("모듈 내 광고상품 노출 확인: %s", modulel_title)
 
-        MODULE_AD_CHECK = {
-            "장바구니 최저가": "N",
-            "장바구니 BT": "Y"
-        }
-        
-        if modulel_title not in MODULE_AD_CHECK:
+        if modulel_title not in _CART_MODULE_AD_CHECK:
             raise ValueError(f"모듈 타이틀 {modulel_title} 확인 불가")
         
-        return MODULE_AD_CHECK[modulel_title]
+        return _CART_MODULE_AD_CHECK[modulel_title]
 
     def get_product_in_module(self, module_locator: Locator) -> Locator:
         """
@@ -210,76 +241,162 @@ class CartPage(BasePage):
         logger.debug("모듈 내 상품 요소 찾기")
         return module_locator.locator("a").first
 
+    def inspect_first_product_in_module(self, module_locator: Locator) -> Tuple[Locator, Optional[str], str]:
+        """
+        모듈 내 첫 번째 상품의 Locator, 상품 코드, 광고 태그 여부를 한 번의 evaluate로 조회
+        (get_product_in_module + get_product_code + check_ad_tag_in_product 조합 대체)
+
+        Args:
+            module_locator: 모듈 Locator
+
+        Returns:
+            (상품 Locator, 상품 코드, "Y"/"N" 광고 태그 여부)
+
+        Raises:
+            ValueError: 모듈 내 상품(<a>)이 없는 경우
+        """
+        logger.debug("모듈 내 첫 번째 상품 조회")
+        info = module_locator.evaluate(_INSPECT_FIRST_PRODUCT_JS)
+        if info is None:
+            raise ValueError("모듈 내 상품을 찾을 수 없습니다")
+        is_ad = "Y" if info["isAd"] else "N"
+        logger.debug("모듈 내 첫 번째 상품: goodscode=%s, 광고=%s", info["goodscode"], is_ad)
+        return self.get_product_in_module(module_locator), info["goodscode"], is_ad
+
+    def get_module_goodscodes(self, module_locator: Locator) -> List[str]:
+        """
+        모듈 내 장바구니 버튼의 goodscode를 한 번의 evaluate_all로 모두 수집
+        (상품마다 .button__cart[data-montelena-goodscode=...]를 따로 조회하지 않도록 모듈당 한 번 호출)
+
+        Args:
+            module_locator: 모듈 Locator
+
+        Returns:
+            goodscode 리스트 (DOM 순서)
+        """
+        goodscodes = module_locator.locator(".button__cart").evaluate_all(
+            "els => els.map(e => e.getAttribute('data-montelena-goodscode')).filter(Boolean)"
+        )
+        logger.debug("모듈 내 장바구니 버튼 goodscode %d개 수집", len(goodscodes))
+        return goodscodes
+
     def check_ad_tag_in_product(self, product_locator: Locator) -> str:
         """
         상품 내 광고 태그 노출 확인
         """
-        logger.debug(f"상품 내 광고 태그 노출 확인: {product_locator}")
+        logger.debug("상품 내 광고 태그 노출 확인: %s", product_locator)
         
-        try:
-            # 상품 요소의 조상 요소에서 div.box__ads-layer 찾기
-            item_container = product_locator.locator("")
-            ads_layer = item_container.locator("")
-            
-            if ads_layer.count() > 0:
-                logger.debug("광고 태그 발견: Y")
-                return "Y"
-            else:
-                logger.debug("광고 태그 없음: N")
-                return "N"
-        except Exception as e:
-            logger.warning(f"광고 태그 확인 중 오류 발생: {e}")
-            return "N"
+        # 상품 요소의 조상 상품 카드에서 div.box__ads-layer 찾기
+        if self.has_ad_layer(product_locator):
+            logger.debug("광고 태그 발견: Y")
+            return "Y"
+        logger.debug("광고 태그 없음: N")
+        return "N"
 
     def click_product_and_wait_pdp_pv(self, product_locator: Locator) -> None:
         """
         상품 탭 (모바일: 터치 이벤트로 product.click.event 트래킹 인식)
         """
-        logger.debug(f"상품 탭: {product_locator}")
+        logger.debug("상품 탭: %s", product_locator)
         product_locator.tap(timeout=5000)
         logger.info("상품 탭 완료")
 
-    def click_cart_button_in_module(self, goodscode: str) -> None:
+    def click_cart_button_in_module(
+        self,
+        goodscode: str,
+        wait_atc_beacon: bool = False,
+        atc_url_pattern=ATC_BEACON_URL_PATTERN,
+    ) -> Locator:
         """
         모듈 내 장바구니 버튼 탭 (모바일: 터치 이벤트로 product.atc.click 트래킹 인식)
+
+        Args:
+            goodscode: 상품 번호
+            wait_atc_beacon: True면 탭 전에 ATC 비콘 요청 대기를 걸어 탭이 발생시킨 비콘을 기다림
+                (NetworkTracker가 없을 때 사용, 비콘이 오면 즉시 반환)
+            atc_url_pattern: ATC 비콘 URL 패턴 (기본값: utils.urls.ATC_BEACON_URL_PATTERN)
+
+        Returns:
+            탭한 장바구니 버튼 Locator (check_cart_added에 그대로 전달해 재사용)
         """
-        logger.debug(f"모듈 내 장바구니 버튼 탭: {goodscode}")
-        self.page.locator(f'.button__cart[data-montelena-goodscode="{goodscode}"]').nth(0).tap(timeout=5000)
+        logger.debug("모듈 내 장바구니 버튼 탭: %s", goodscode)
+        btn = self._button_locator(goodscode).first
+        if not wait_atc_beacon:
+            btn.tap(timeout=5000)
+        else:
+            # 탭 이전에 리스너를 걸어야 탭 직후 전송되는 비콘을 놓치지 않음
+            try:
+                with self.page.expect_request(atc_url_pattern, timeout=ATC_BEACON_TIMEOUT_MS):
+                    btn.tap(timeout=5000)
+                logger.debug("ATC 비콘 수신: %s", goodscode)
+            except PlaywrightTimeoutError:
+                self._wait_atc_beacon_timeout()
         logger.info("모듈 내 장바구니 버튼 탭 완료")
+        return btn
+
+    def _wait_atc_beacon_timeout(self) -> None:
+        """ATC 비콘을 받지 못한 경우(이미 전송됨 등) 설정된 플러시 시간만큼만 추가 대기"""
+        logger.debug("ATC 비콘 대기 타임아웃, %dms 추가 대기", ATC_FLUSH_MS)
+        if ATC_FLUSH_MS > 0:
+            self.page.wait_for_timeout(ATC_FLUSH_MS)
 
-    def check_cart_added(self, goodscode: str, timeout: int = 10000) -> None:
+    def check_cart_added(
+        self,
+        goodscode: str,
+        timeout: int = 10000,
+        button_locator: Optional[Locator] = None,
+        tracker=None,
+        atc_log_baseline: int = 0,
+    ) -> None:
         """
         장바구니 담기 완료 확인
         해당 goodscode의 장바구니 버튼이 보이지 않으면 장바구니 담기가 완료된 것으로 확인
+        tracker가 있으면 고정 sleep 대신 ATC 트래킹 로그 수신을 기다리며, 수신되면 즉시 반환
+        (tracker가 없으면 비콘 대기는 click_cart_button_in_module(wait_atc_beacon=True)에서 탭과 함께 수행)
         
         Args:
             goodscode: 상품 번호
             timeout: 타임아웃 (기본값: 10000ms)
+            button_locator: click_cart_button_in_module이 반환한 버튼 Locator (없으면 goodscode로 생성)
+            tracker: NetworkTracker (지정 시 해당 goodscode의 Product ATC Click 로그 수신을 대기,
+                atc_log_baseline보다 로그가 이미 많으면 즉시 반환)
+            atc_log_baseline: 탭 이전에 수집된 해당 goodscode의 Product ATC Click 로그 수
+                (같은 상품을 다시 담을 때 이전 담기 로그로 통과하지 않도록 이후 로그만 인정)
         
         Raises:
             AssertionError: 장바구니 버튼이 여전히 보이는 경우 (담기 미완료)
         """
-        logger.debug(f"장바구니 담기 완료 확인: {goodscode}")
-        button_locator = self.page.locator(f'.button__cart[data-montelena-goodscode="{goodscode}"]')
+        logger.debug("장바구니 담기 완료 확인: %s", goodscode)
+        selector = self.MODULE_CART_BUTTON_SEL.format(goodscode)
+        if button_locator is None:
+            button_locator = self._button_locator(goodscode)
+        btn = button_locator.first
         
-        # 버튼이 존재하지 않으면 성공
-        if button_locator.count() == 0:
-            logger.info(f"장바구니 담기 완료 확인됨: {goodscode} (버튼 없음)")
-            # ATC 이벤트 수집을 위한 대기 시간
-            time.sleep(1.5)
+        if tracker is not None:
+            # 트래커가 수집한 ATC 로그 기준으로 대기 (탭 이후 이미 수신된 비콘도 확인, 탭 이전 로그는 제외)
+            atc_event = tracker.register_atc_click_waiter(goodscode, baseline_count=atc_log_baseline)
+            try:
+                self._wait_cart_button_hidden(selector, btn, goodscode, timeout)
+                if not self._poll_backoff(atc_event.is_set, timeout=ATC_BEACON_TIMEOUT_MS):
+                    logger.warning("Product ATC Click 로그 미수신: %s (%dms)", goodscode, ATC_BEACON_TIMEOUT_MS)
+            finally:
+                tracker.unregister_atc_click_waiter(goodscode)
             return
         
-        # 버튼이 보이지 않을 때까지 대기 (또는 이미 숨겨져 있으면 성공)
+        # 버튼이 보이지 않을 때까지 대기 (버튼이 없거나 이미 숨겨져 있으면 즉시 성공)
+        self._wait_cart_button_hidden(selector, btn, goodscode, timeout)
+
+    def _wait_cart_button_hidden(self, selector: str, btn: Locator, goodscode: str, timeout: int) -> None:
+        """
+        장바구니 버튼이 사라지거나 숨겨질 때까지 대기
+
+        Raises:
+            AssertionError: 타임아웃 후에도 버튼이 보이는 경우
+        """
         try:
-            button_locator.first.wait_for(state="hidden", timeout=timeout)
-            logger.info(f"장바구니 담기 완료 확인됨: {goodscode} (버튼 숨김)")
-            # ATC 이벤트 수집을 위한 대기 시간
-            time.sleep(1.5)
-        except Exception:
+            self.wait_for_hidden_fast(selector, timeout=timeout)
+        except PlaywrightTimeoutError:
             # 타임아웃 후에도 버튼이 보이면 실패
-            if button_locator.first.is_visible():
+            if btn.is_visible():
                 raise AssertionError(f"장바구니 버튼이 여전히 보입니다: {goodscode}")
-            # 보이지 않으면 성공
-            logger.info(f"장바구니 담기 완료 확인됨: {goodscode}")
-            # ATC 이벤트 수집을 위한 대기 시간
-            time.sleep(1.5)
\ No newline at end of file
+        logger.info(f"장바구니 담기 완료 확인됨: {goodscode} (버튼 숨김)")
@@ -5,7 +5,7 @@ import re
 import logging
 
 from pages.base_page import BasePage
-from playwright.sync_api import Page, expect, Locator
+from playwright.sync_api import Page, expect, Locator, TimeoutError as PlaywrightTimeoutError
 from utils.urls import base_url
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,9 @@ class HomePage(BasePage):
     SEARCH_BUTTON = "button[type='submit']"
     LOGIN_BUTTON = "로그인"
     LOGOUT_BUTTON = "text=로그아웃"
+    # 검색 결과(SRP) 로드 완료 신호: 상품 카드 또는 (결과가 없어도 노출되는) SRP 검색어 필드
+    SEARCH_RESULTS_READY_SELECTOR = "div.box__item-container"
+    SRP_KEYWORD_FIELD_SELECTOR = ".box__text-field button.form__input"
     
     def __init__(self, page: Page):
         """
@@ -42,7 +45,7 @@ class HomePage(BasePage):
         Args:
             keyword: 검색할 상품명
         """
-        logger.debug(f"검색어 입력: {keyword}")
+        logger.debug("검색어 입력: %s", keyword)
         self.page.fill("input[name='keyword']", keyword)
     
     def click_search_button(self) -> None:
@@ -77,13 +80,17 @@ class HomePage(BasePage):
     def wait_for_search_results(self, keyword: str | None = None, timeout: int = 30000) -> None:
         """검색 결과 페이지 로드 대기.
 
-        networkidle은 트래킹·폴링 등으로 M웹에서 거의 만족되지 않아 타임아웃이 잦음.
-        load 이벤트 후 SearchPage.verify_keyword_element_exists와 동일한 SRP UI를 기준으로 대기.
+        networkidle은 트래킹·폴링 등으로 M웹에서 거의 만족되지 않아 타임아웃이 잦고,
+        load도 이미지·광고 리소스까지 기다리므로 SRP DOM(상품 카드 또는 검색어 필드)이 보이는 즉시 반환.
+        트래킹 비콘 수집이 필요한 경우 load 상태 대신 expect_request로 해당 요청을 기다릴 것.
         """
         logger.debug("검색 결과 로드 대기")
-        self.page.wait_for_load_state("load", timeout=timeout)
+        ready = self.page.locator(
+            f"{self.SEARCH_RESULTS_READY_SELECTOR}, {self.SRP_KEYWORD_FIELD_SELECTOR}"
+        ).first
+        ready.wait_for(state="visible", timeout=timeout)
         if keyword:
-            locator = self.page.locator(".box__text-field button.form__input").first
+            locator = self.page.locator(self.SRP_KEYWORD_FIELD_SELECTOR).first
             locator.wait_for(state="visible", timeout=timeout)
             expect(locator).to_contain_text(
                 re.compile(re.escape(keyword), re.IGNORECASE), timeout=timeout
@@ -98,32 +105,15 @@ class HomePage(BasePage):
         count = login_button.count()
         if count == 0:
             raise Exception("로그인 버튼을 찾을 수 없습니다")
-        logger.debug(f"로그인 버튼 {count}개 발견")
-        
-        # 요소가 클릭 가능한 상태가 될 때까지 대기
-        login_button.wait_for(state="visible", timeout=10000)
-        login_button.scroll_into_view_if_needed()
-        
-        # 요소가 실제로 클릭 가능한지 확인
-        is_visible = login_button.is_visible()
-        is_enabled = login_button.is_enabled() if hasattr(login_button, 'is_enabled') else True
-        logger.debug(f"로그인 버튼 상태 - visible: {is_visible}, enabled: {is_enabled}")
-        
-        if not is_visible:
-            raise Exception("로그인 버튼이 보이지 않습니다")
+        logger.debug("로그인 버튼 %s개 발견", count)
         
         # 현재 URL 저장 (클릭 전)
         current_url = self.page.url
-        logger.debug(f"클릭 전 URL: {current_url}")
+        logger.debug("클릭 전 URL: %s", current_url)
         
-        # 클릭 시도
-        try:
-            login_button.click(timeout=5000)
-            logger.debug("일반 클릭 성공")
-        except Exception as e:
-            logger.warning(f"일반 클릭 실패, force 클릭 시도: {e}")
-            login_button.click(force=True)
-            logger.debug("force 클릭 완료")
+        # click이 visible·enabled·스크롤 등 actionability를 직접 대기 (force 재시도 없음)
+        login_button.click(timeout=10000)
+        logger.debug("로그인 버튼 클릭 성공")
         
         # 클릭 후 로그인 페이지로 이동했는지 확인
         try:
@@ -252,12 +242,14 @@ class HomePage(BasePage):
         timeout = timeout or self.timeout
         logger.debug("RVH 페이지 로드 대기 (span.desc-txt '쇼핑 히스토리예요.')")
         try:
-            loc = self.page.locator("span.desc-txt", has_text="쇼핑 히스토리예요.")
+            loc = self.page.locator('span.desc-txt:has-text("쇼핑 히스토리예요.")').first
+            # 브라우저 측 대기라 요소가 보이는 즉시 반환 (Python 폴링 왕복 없음)
             loc.wait_for(state="visible", timeout=timeout)
-            visible = loc.is_visible()
-            if visible:
-                logger.info("RVH 페이지 로드 확인됨")
-            return visible
+            logger.info("RVH 페이지 로드 확인됨")
+            return True
+        except PlaywrightTimeoutError:
+            logger.warning("RVH 페이지 로드 대기 실패: %sms 타임아웃", timeout)
+            return False
         except Exception as e:
             logger.warning("RVH 페이지 로드 대기 실패: %s", e)
             return False
@@ -306,7 +298,7 @@ class HomePage(BasePage):
         2) `[data-spm='spmc']` — 속성만으로 DOM에 이미 충분히 있을 때(스크롤 없음)
         3) 위로 부족하면 `scroll_until_selector_appears`로 스크롤하며 탐색
         """
-        logger.debug(f"spmc 로 모듈 찾기: {spmc} (0-based index={target_index})")
+        logger.debug("spmc 로 모듈 찾기: %s (0-based index=%s)", spmc, target_index)
         nth_index = max(int(target_index), 0)
 
         by_text = self.page.locator("[data-spm]", has_text=spmc)
@@ -437,7 +429,7 @@ class HomePage(BasePage):
         """
         모듈 내 General 버튼/링크를 찾아 뷰포트로 스크롤한 뒤 Locator를 반환한다.
         """
-        logger.debug(f"모듈 내 General 요소 찾기: {module_title}")
+        logger.debug("모듈 내 General 요소 찾기: %s", module_title)
         if module_title == "today_itemcarousel":
             button = module.locator(".gds-heading__side-action").first
         elif module_title == "today_newlowest":
@@ -26,17 +26,22 @@ class ListPage(BasePage):
         Args:
             category_id: 카테고리 ID
         """
-        logger.debug(f"LP 페이지 이동: category_id={category_id}")
+        logger.debug("LP 페이지 이동: category_id=%s", category_id)
         list_page_url = list_url(category_id)
         self.page.goto(list_page_url, wait_until="domcontentloaded", timeout=30000)
         logger.info(f"LP 페이지 이동 완료: category_id={category_id}")
 
-    def wait_for_list_page_load(self):
+    def wait_for_list_page_load(self, timeout: int = 15000):
         """
         리스트 페이지 로드 대기
+        go_to_list_page의 goto가 이미 domcontentloaded까지 대기하므로 로드 상태 대신
+        리스트 상품 카드(SRP와 동일한 div.box__item-container)가 DOM에 붙을 때까지 대기
+
+        Args:
+            timeout: 타임아웃 (기본값: 15000ms)
         """
         logger.debug("리스트 페이지 로드 대기")
-        self.page.wait_for_load_state("domcontentloaded", timeout=30000)
+        self.page.locator("div.box__item-container").first.wait_for(state="attached", timeout=timeout)
 
     def verify_category_id_in_url(self, url: str, category_id: str) -> None:
         """
@@ -46,5 +51,5 @@ class ListPage(BasePage):
             url: 확인할 URL
             category_id: 카테고리 ID
         """
-        logger.debug(f"URL에 카테고리 ID 포함 확인: {category_id}")
+        logger.debug("URL에 카테고리 ID 포함 확인: %s", category_id)
         assert f'category={category_id}' in url, f"카테고리 ID {category_id}가 URL에 포함되어야 합니다"
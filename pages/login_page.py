@@ -8,11 +8,31 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 아이디/비밀번호 입력과 로그인 버튼 클릭을 한 번의 evaluate로 수행
+# (네이티브 value setter + input/change 이벤트로 프레임워크 바인딩 값도 갱신, 요소가 없으면 false)
+_SUBMIT_LOGIN_JS = """([idSel, pwSel, btnSel, username, password]) => {
+    const idEl = document.querySelector(idSel);
+    const pwEl = document.querySelector(pwSel);
+    const btn = document.querySelector(btnSel);
+    if (!idEl || !pwEl || !btn) return false;
+    const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    for (const [el, value] of [[idEl, username], [pwEl, password]]) {
+        setter.call(el, value);
+        el.dispatchEvent(new Event('input', { bubbles: true }));
+        el.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    btn.click();
+    return true;
+}"""
+
 
 class LoginPage(BasePage):
     """G마켓 로그인 페이지"""
     
     # 선택자 정의
+    USERNAME_INPUT = "#typeMemberInputId"
+    PASSWORD_INPUT = "#typeMemberInputPassword"
+    LOGIN_BUTTON = "#btn_memberLogin"
     
     def __init__(self, page: Page):
         """
@@ -30,8 +50,8 @@ class LoginPage(BasePage):
         Args:
             username: 사용자 ID
         """
-        logger.debug(f"사용자명 입력: {username}")
-        self.fill("#typeMemberInputId", username)
+        logger.debug("사용자명 입력: %s", username)
+        self.fill(self.USERNAME_INPUT, username)
     
     def fill_password(self, password: str) -> None:
         """
@@ -41,7 +61,7 @@ class LoginPage(BasePage):
             password: 비밀번호
         """
         logger.debug("비밀번호 입력")
-        self.fill("#typeMemberInputPassword", password)
+        self.fill(self.PASSWORD_INPUT, password)
     
     def login_as(self, member_type: str) -> None:
         """
@@ -52,14 +72,33 @@ class LoginPage(BasePage):
         """
         credentials = get_credentials(member_type)
         logger.info(f"{member_type} 회원으로 로그인 시도")
-        self.fill_username(credentials["username"])
-        self.fill_password(credentials["password"])
+        self._submit_login(credentials["username"], credentials["password"])
+    
+    def _submit_login(self, username: str, password: str) -> None:
+        """
+        아이디/비밀번호 입력과 로그인 버튼 클릭을 한 번의 evaluate로 수행
+        로그인 폼이 아직 렌더링되지 않았으면 자동 대기하는 단계별 입력/클릭으로 폴백
+        
+        Args:
+            username: 사용자 ID
+            password: 비밀번호
+        """
+        submitted = self.page.evaluate(
+            _SUBMIT_LOGIN_JS,
+            [self.USERNAME_INPUT, self.PASSWORD_INPUT, self.LOGIN_BUTTON, username, password],
+        )
+        if submitted:
+            logger.debug("로그인 폼 일괄 입력/제출 완료")
+            return
+        logger.debug("로그인 폼 미표시, 단계별 입력으로 진행")
+        self.fill_username(username)
+        self.fill_password(password)
         self.click_login_button()
     
     def click_login_button(self) -> None:
         """로그인 버튼 클릭"""
         logger.debug("로그인 버튼 클릭")
-        self.click("#btn_memberLogin")
+        self.click(self.LOGIN_BUTTON)
     
     def wait_for_login_complete(self, timeout: int = 15000) -> None:
         """
@@ -78,7 +117,7 @@ class LoginPage(BasePage):
         Returns:
             로그인 성공하면 True, 아니면 False
         """
-        return self.is_visible("text='로그아웃'", timeout=5000)
+        return self.expect_visible(self.page.get_by_text("로그아웃", exact=True), timeout=5000)
 
     def click_nonmember_button(self) -> None:
         """비회원 버튼 클릭"""
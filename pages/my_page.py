@@ -1,13 +1,28 @@
-import time
 import logging
 import json
 from pages.base_page import BasePage
 from playwright.sync_api import Page, Locator, expect
 from utils.urls import my_url
-from typing import Optional
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# 모듈 타이틀별 광고상품 여부 ("Y"/"N", "F"는 상품별 광고 태그 확인 필요)
+_ORDER_HISTORY_MODULE_AD_CHECK = {
+    "주문내역": "N",
+}
+
+# 주문내역 상품(box__order-item)별 goodscode → 광고 레이어 여부를 한 번에 수집
+_BULK_ORDER_HISTORY_ADS_JS = """itemSel => {
+    const out = {};
+    document.querySelectorAll('div.box__order-item').forEach(item => {
+        const a = item.querySelector(itemSel + '[data-montelena-goodscode]');
+        if (!a) return;
+        out[a.getAttribute('data-montelena-goodscode')] = item.querySelector('div.box__ads-layer') ? 'Y' : 'N';
+    });
+    return out;
+}"""
+
 
 class MyPage(BasePage):
     def __init__(self, page: Page):
@@ -18,6 +33,8 @@ class MyPage(BasePage):
             page: Playwright Page 객체
         """
         super().__init__(page)
+        # goodscode → 주문내역 상품 Locator (Locator는 지연 평가라 페이지 갱신 후에도 재사용 가능)
+        self._product_locator_cache: dict = {}
 
     def go_to_my_page_by_url(self):
         """
@@ -32,7 +49,7 @@ class MyPage(BasePage):
         마이페이지가 표시되었는지 확인
         """
         logger.debug("마이페이지 표시 확인")
-        return self.is_visible(".text__title:has-text('주문내역')")
+        return self.expect_visible(self.page.locator(".text__title:has-text('주문내역')"), timeout=self.timeout)
 
     def click_order_history(self):
         """
@@ -48,11 +65,21 @@ class MyPage(BasePage):
         주문내역 페이지가 표시되었는지 확인
         """
         logger.debug("주문내역 페이지 표시 확인")
-        return self.is_visible(".box__title:has-text('주문내역')")
+        return self.expect_visible(self.page.locator(".box__title:has-text('주문내역')"), timeout=self.timeout)
 
     # 주문내역 상품 썸네일 img 공통 셀렉터 (box__thumbnail은 클래스이므로 앞에 . 필요)
     _ORDER_ITEM_IMG = ".link__item-information a"
 
+    def _product_loc(self, goodscode: str) -> Locator:
+        """goodscode에 해당하는 주문내역 상품 Locator를 한 번만 생성해 재사용"""
+        goodscode = str(goodscode)
+        loc = self._product_locator_cache.get(goodscode)
+        if loc is None:
+            loc = self._product_locator_cache[goodscode] = self.page.locator(
+                f"{self._ORDER_ITEM_IMG}[data-montelena-goodscode='{goodscode}']"
+            )
+        return loc
+
     def get_goods_code_from_order_history(self):
         """
         주문내역에서 상품코드 가져오기. 요소가 보이도록 스크롤 후 속성 조회.
@@ -69,13 +96,13 @@ class MyPage(BasePage):
             locator.scroll_into_view_if_needed(timeout=10000)
         except Exception as e:
             logger.warning(f"scroll_into_view_if_needed 실패, evaluate 스크롤 시도: {e}")
-            locator.evaluate("el => el.scrollIntoView({behavior: 'smooth', block: 'center'})")
+            locator.evaluate("el => el.scrollIntoView({behavior: 'auto', block: 'center'})")
 
     def click_atc_in_order_history_by_goodscode(self, goodscode: str):
         """
         주문내역에서 상품코드로 담기버튼 클릭
         """
-        logger.debug(f"주문내역에서 상품코드로 담기버튼 탭: {goodscode}")
+        logger.debug("주문내역에서 상품코드로 담기버튼 탭: %s", goodscode)
         self.page.locator(f".button__cart[data-montelena-goodscode='{goodscode}']").tap(timeout=5000)
 
     def atc_alert_close(self):
@@ -89,8 +116,8 @@ class MyPage(BasePage):
         """
         주문내역에서 상품코드로 상품 클릭
         """
-        logger.debug(f"주문내역에서 상품코드로 상품 탭: {goodscode}")
-        loc = self.page.locator(f"{self._ORDER_ITEM_IMG}[data-montelena-goodscode='{goodscode}']").first
+        logger.debug("주문내역에서 상품코드로 상품 탭: %s", goodscode)
+        loc = self._product_loc(goodscode).first
         self._scroll_order_item_into_view(loc)
         loc.tap(timeout=5000)
 
@@ -105,19 +132,17 @@ class MyPage(BasePage):
             새 탭의 Page 객체
         """
         logger.debug("주문내역 상품 클릭 및 새 탭 대기")
-        product_locator = self.page.locator(
-            f"{self._ORDER_ITEM_IMG}[data-montelena-goodscode='{goodscode}']"
-        ).first
+        product_locator = self._product_loc(goodscode).first
         self._scroll_order_item_into_view(product_locator)
-
-        time.sleep(3)
+        # 고정 3초 대기 대신 탭 대상이 보이는 상태가 될 때까지만 대기
+        product_locator.wait_for(state="visible", timeout=5000)
 
         try:
             with self.page.context.expect_page(timeout=5000) as new_page_info:
                 product_locator.tap(timeout=3000)
 
             new_page = new_page_info.value
-            logger.debug(f"새 탭 생성됨: {new_page.url}")
+            logger.debug("새 탭 생성됨: %s", new_page.url)
         except Exception as e:
             logger.warning(f"일반 클릭 실패, 팝업 닫기 후 재시도: {e}")
             try:
@@ -128,13 +153,16 @@ class MyPage(BasePage):
                     except Exception as e:
                         logger.warning(f"팝업 닫기 버튼 클릭 실패: {e}")
                     logger.debug("팝업 닫기 버튼 클릭 완료")
-                    time.sleep(2)
+                    try:
+                        popup_close_button.first.wait_for(state="hidden", timeout=2000)
+                    except Exception as e:
+                        logger.warning(f"팝업 닫힘 대기 실패: {e}")
 
                 with self.page.context.expect_page(timeout=10000) as new_page_info:
                     product_locator.tap(timeout=3000)
 
                 new_page = new_page_info.value
-                logger.debug(f"팝업 닫기 후 새 탭 생성됨: {new_page.url}")
+                logger.debug("팝업 닫기 후 새 탭 생성됨: %s", new_page.url)
             except Exception as e2:
                 logger.error(f"팝업 닫기 후 클릭도 실패: {e2}")
                 raise Exception(f"클릭 실패 (일반 클릭: {e}, 팝업 닫기 후 재시도: {e2})")
@@ -153,7 +181,7 @@ class MyPage(BasePage):
         for i in range(max_retries):
             current_url = new_page.url
             if current_url and current_url != "about:blank":
-                logger.debug(f"새 탭 URL 확인됨: {current_url}")
+                logger.debug("새 탭 URL 확인됨: %s", current_url)
                 break
             if i < max_retries - 1:
                 new_page.wait_for_timeout(500)
@@ -166,9 +194,7 @@ class MyPage(BasePage):
         """
         주문내역에서 상품코드에 해당하는 상품 Locator 반환 (ad 태그 확인 등에 사용)
         """
-        return self.page.locator(
-            f"{self._ORDER_ITEM_IMG}[data-montelena-goodscode='{goodscode}']"
-        )
+        return self._product_loc(goodscode)
 
     def check_ad_item_in_order_history_module(self, module_title: str) -> str:
         """
@@ -181,13 +207,10 @@ class MyPage(BasePage):
         Returns:
             "Y", "N", 또는 "F" (F인 경우 상품별 check_ad_tag 필요)
         """
-        logger.debug(f"주문내역 모듈 내 광고상품 노출 확인: {module_title}")
-        MODULE_AD_CHECK = {
-            "주문내역": "N",
-        }
-        if module_title not in MODULE_AD_CHECK:
+        logger.debug("주문내역 모듈 내 광고상품 노출 확인: %s", module_title)
+        if module_title not in _ORDER_HISTORY_MODULE_AD_CHECK:
             raise ValueError(f"모듈 타이틀 {module_title} 확인 불가")
-        return MODULE_AD_CHECK[module_title]
+        return _ORDER_HISTORY_MODULE_AD_CHECK[module_title]
 
     def check_ad_tag_in_order_history_product(self, product_locator: Locator) -> str:
         """
@@ -202,15 +225,21 @@ class MyPage(BasePage):
         """
         logger.debug("주문내역 상품 내 광고 태그 노출 확인")
         try:
-            # 주문내역 상품 컨테이너에서 광고 레이어 등 확인 (DOM 구조에 맞게 추후 구현)
-            item_container = product_locator.locator(
-                "xpath=ancestor::div[contains(@class, 'box__order-item')]"
-            )
-            ads_layer = item_container.locator("div.box__ads-layer")
-            if ads_layer.count() > 0:
+            # 주문내역 상품 컨테이너(box__order-item)에서 광고 레이어 확인
+            if self.has_ad_layer(product_locator, "div.box__order-item"):
                 return "Y"
             return "N"
         except Exception as e:
             logger.warning(f"주문내역 광고 태그 확인 중 오류: {e}")
             return "N"
 
+    def bulk_check_ads_in_order_history(self) -> Dict[str, str]:
+        """
+        주문내역 전체 상품의 광고 태그 여부를 한 번의 evaluate로 조회
+        (상품마다 check_ad_tag_in_order_history_product를 호출하는 대신 goodscode로 조회)
+
+        Returns:
+            {goodscode: "Y" 또는 "N"}
+        """
+        logger.debug("주문내역 상품 광고 태그 일괄 확인")
+        return self.page.evaluate(_BULK_ORDER_HISTORY_ADS_JS, self._ORDER_ITEM_IMG)
@@ -4,10 +4,26 @@ import json
 from pages.base_page import BasePage
 from playwright.sync_api import Page, Locator, expect
 from utils.urls import product_url, cart_url, order_complete_url
-from typing import Optional
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# 모듈 타이틀별 광고상품 여부 ("Y"/"N", "F"는 상품별 광고 태그 확인 필요)
+_ORDER_COMPLETE_MODULE_AD_CHECK = {
+    "주문완료 BT": "F",
+}
+
+# 모듈 내 상품 카드(box__item-container)별 goodscode → 광고 레이어 여부를 한 번에 수집
+_BULK_ITEM_ADS_JS = """root => {
+    const out = {};
+    root.querySelectorAll('div.box__item-container').forEach(item => {
+        const el = item.querySelector('[data-montelena-goodscode]');
+        if (!el) return;
+        out[el.getAttribute('data-montelena-goodscode')] = item.querySelector('div.box__ads-layer') ? 'Y' : 'N';
+    });
+    return out;
+}"""
+
 
 class OrderPage(BasePage):
     def __init__(self, page: Page):
@@ -39,7 +55,7 @@ class OrderPage(BasePage):
             False: 주문완료 페이지가 표시되지 않았음
         """
         logger.debug("주문완료 페이지 표시 확인")
-        return self.is_visible(".box__title:has-text('주문완료')")
+        return self.expect_visible(self.page.locator(".box__title:has-text('주문완료')"), timeout=self.timeout)
     
     def get_spmc_by_module_title(self, module_title: str) -> str:
         """
@@ -51,7 +67,7 @@ class OrderPage(BasePage):
         Returns:
             SPM 코드
         """
-        logger.debug(f"모듈 타이틀로 SPM 코드 가져오기: {module_title}")
+        logger.debug("모듈 타이틀로 SPM 코드 가져오기: %s", module_title)
         if module_title == "주문완료 BT":
             return "ordercompletebt"
         else:
@@ -67,7 +83,7 @@ class OrderPage(BasePage):
         Returns:
             옵션선택 버튼 Locator 객체
         """
-        logger.debug(f"모듈 내 옵션선택 버튼 찾기: {module}")
+        logger.debug("모듈 내 옵션선택 버튼 찾기: %s", module)
         return module.get_by_text("옵션선택", exact=True).nth(0)
 
     def get_goodscode_in_product(self, product: Locator) -> str:
@@ -80,7 +96,7 @@ class OrderPage(BasePage):
         Returns:
             상품 코드
         """
-        logger.debug(f"모듈 내 상품 코드 가져오기")
+        logger.debug("모듈 내 상품 코드 가져오기")
         return product.get_attribute("data-montelena-goodscode")
 
     def check_ad_item_in_order_complete_module(self, modulel_title: str) -> str:
@@ -96,16 +112,12 @@ class OrderPage(BasePage):
         Raises:
             ValueError: 알 수 없는 모듈 타이틀인 경우
         """
-        logger.debug(f"모듈 내 광고상품 노출 확인: {modulel_title}")
+        logger.debug("모듈 내 광고상품 노출 확인: %s", modulel_title)
 
-        MODULE_AD_CHECK = {
-            "주문완료 BT": "F",
-        }
-        
-        if modulel_title not in MODULE_AD_CHECK:
+        if modulel_title not in _ORDER_COMPLETE_MODULE_AD_CHECK:
             raise ValueError(f"모듈 타이틀 {modulel_title} 확인 불가")
         
-        return MODULE_AD_CHECK[modulel_title]
+        return _ORDER_COMPLETE_MODULE_AD_CHECK[modulel_title]
 
     def check_ad_tag_in_order_complete_product(self, product_locator: Locator) -> str:
         """
@@ -117,14 +129,11 @@ class OrderPage(BasePage):
         Returns:
             "Y", "N"(광고 상품 여부)
         """
-        logger.debug(f"상품 내 광고 태그 노출 확인: {product_locator}")
+        logger.debug("상품 내 광고 태그 노출 확인: %s", product_locator)
         
         try:
-            # 상품 요소의 조상 요소에서 div.box__ads-layer 찾기
-            item_container = product_locator.locator("xpath=ancestor::div[contains(@class, 'box__item-container')]")
-            ads_layer = item_container.locator("div.box__ads-layer")
-            
-            if ads_layer.count() > 0:
+            # 상품 요소의 조상 상품 카드에서 div.box__ads-layer 찾기
+            if self.has_ad_layer(product_locator):
                 logger.debug("광고 태그 발견: Y")
                 return "Y"
             else:
@@ -134,6 +143,20 @@ class OrderPage(BasePage):
             logger.warning(f"광고 태그 확인 중 오류 발생: {e}")
             return "N"
 
+    def bulk_check_ads_in_order_complete_module(self, module: Locator) -> Dict[str, str]:
+        """
+        모듈 내 전체 상품의 광고 태그 여부를 한 번의 evaluate로 조회
+        (상품마다 check_ad_tag_in_order_complete_product를 호출하는 대신 goodscode로 조회)
+
+        Args:
+            module: 모듈 Locator 객체
+
+        Returns:
+            {goodscode: "Y" 또는 "N"}
+        """
+        logger.debug("모듈 내 상품 광고 태그 일괄 확인")
+        return module.evaluate(_BULK_ITEM_ADS_JS)
+
     def get_atc_button_in_order_complete_module(self, module: Locator, n: Optional[int] = None) -> Locator:
         """
         모듈 내 담기버튼 요소 찾기
@@ -146,7 +169,7 @@ class OrderPage(BasePage):
             상품 Locator 객체
         """
         if n is not None:
-            logger.debug(f"모듈 내 {n}번째 담기버튼 요소 찾기")
+            logger.debug("모듈 내 %s번째 담기버튼 요소 찾기", n)
             return module.locator(".button__cart", has_text="담기").nth(n - 1)  # 1부터 시작하는 인덱스를 0부터 시작하는 인덱스로 변환
         else:
             logger.debug("모듈 내 첫 번째 담기버튼 요소 찾기")
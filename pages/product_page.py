@@ -2,13 +2,30 @@
 상품 상세 페이지 객체
 """
 from pages.base_page import BasePage
-from playwright.sync_api import Page, Locator, TimeoutError, expect
+from playwright.sync_api import Page, Locator, Error as PlaywrightError, expect
 from utils.urls import product_url
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 모듈 타이틀별 광고상품 여부 ("Y"/"N", "F"는 상품별 광고 태그 확인 필요)
+_PDP_MODULE_AD_CHECK = {
+    "함께 보면 좋은 상품이에요": "Y",
+    "이 판매자의 인기상품이에요": "N",
+    "함께 구매하면 좋은 상품이에요": "F",
+    "이마트몰VT": "N",
+    "이마트몰BT": "N",
+    "이 브랜드의 인기상품": "N",
+    "점포 행사 상품이에요": "N",
+    "연관상품": "N",
+    "연관상품 상세보기": "N",
+    "연관상품 더보기": "N",
+    "BuyBox": "N",
+    "낮은가격순": "N",
+    "pdpjfy": "F"
+}
+
 
 class ProductPage(BasePage):
     """상품 상세 페이지"""
@@ -22,6 +39,8 @@ class ProductPage(BasePage):
             page: Playwright Page 객체
         """
         super().__init__(page)
+        # 구매하기 버튼 Locator (로드 확인·클릭에서 공통 사용)
+        self._buy_btn = page.locator("#coreInsOrderBtn").first
     
     def go_to_product_page(self, goodscode: str) -> None:
         """
@@ -30,7 +49,7 @@ class ProductPage(BasePage):
         Args:
             goodscode: 상품번호
         """
-        logger.debug(f'페이지 이동 시작: goodscode={goodscode}')
+        logger.debug('페이지 이동 시작: goodscode=%s', goodscode)
         self.page.goto(product_url(goodscode), wait_until="domcontentloaded")
         logger.info(f'페이지 이동 완료: goodscode={goodscode}')
 
@@ -44,20 +63,25 @@ class ProductPage(BasePage):
             self.page.wait_for_load_state("domcontentloaded", timeout=10000)
             
             # 상품 상세 페이지의 핵심 요소 확인 (구매하기 버튼)
-            # 이 요소가 나타나면 상품 상세 페이지가 로드된 것으로 간주
-            buy_button = self.page.locator("#coreInsOrderBtn")
-            buy_button.wait_for(state="attached", timeout=15000)
+            # 이 요소가 나타나면 상품 상세 페이지가 로드된 것으로 간주 (자동 재시도 단정이라 부착 즉시 반환)
+            expect(self._buy_btn).to_be_attached(timeout=15000)
             
             logger.debug("상품 상세 페이지 확인됨 (구매하기 버튼 발견)")
             return True
-        except Exception as e:
+        except (AssertionError, PlaywrightError) as e:
+            # TimeoutError 외에 페이지 닫힘·프레임 분리 등 Playwright 오류도 False로 처리 (bool 반환 보장)
             logger.warning(f"상품 상세 페이지 확인 실패: {e}")
             return False
        
     def wait_for_page_load(self) -> None:
-        """페이지 로드 대기"""
+        """
+        페이지 로드 대기
+        networkidle은 광고·트래킹 요청으로 M웹에서 거의 만족되지 않으므로
+        domcontentloaded 후 상품 상세 핵심 요소(구매하기 버튼) 부착 여부로 판단
+        """
         logger.debug("페이지 로드 대기")
-        self.page.wait_for_load_state("networkidle")
+        self.page.wait_for_load_state("domcontentloaded", timeout=30000)
+        self._buy_btn.wait_for(state="attached", timeout=15000)
     
     def click_buy_now_button(self, timeout: int = 10000) -> None:
         """
@@ -67,19 +91,8 @@ class ProductPage(BasePage):
             timeout: 타임아웃 (기본값: 10000ms)
         """
         logger.debug("구매하기 버튼 클릭")
-        # nth(0)으로 첫 번째 요소 명시적 선택
-        buy_button = self.page.locator("#coreInsOrderBtn").nth(0)
-        
-        # 요소가 나타날 때까지 먼저 대기
-        buy_button.wait_for(state="attached", timeout=timeout)
-        logger.debug("구매하기 버튼이 DOM에 나타남")
-        
-        # 버튼이 화면에 보이도록 스크롤
-        buy_button.scroll_into_view_if_needed(timeout=timeout)
-        logger.debug("구매하기 버튼이 화면에 보이도록 스크롤 완료")
-        
-        # 버튼 클릭
-        buy_button.tap(timeout=timeout)
+        # 부착·노출·스크롤 대기는 tap의 actionability 검사에 맡김 (터치 이벤트로 Buynow 클릭 트래킹 인식)
+        self._buy_btn.tap(timeout=timeout)
         logger.debug("구매하기 버튼 클릭 완료")
 
     def select_group_product(self, n: int, timeout: int = 10000) -> None:
@@ -90,39 +103,15 @@ class ProductPage(BasePage):
             n: 그룹상품 번호
             timeout: 타임아웃 (기본값: 10000ms)
         """
-        if n < 10:
-            n = f"0{n}"
-        else:
-            n = f"{n}"
+        # 스텝 파라미터(str)로 넘어와도 CartPage.select_group_product와 동일하게 정규화
+        anchor = f"coreAnchor{int(n):02d}"
         logger.debug("그룹 옵션레이어 클릭")
-        # nth(0)으로 첫 번째 요소 명시적 선택
-        group_product_layer = self.page.locator(".select-item_option").nth(0)
-        
-        # 요소가 나타날 때까지 먼저 대기
-        group_product_layer.wait_for(state="attached", timeout=timeout)
-        logger.debug("그룹 옵션레이어 DOM에 나타남")
-        
-        # 그룹 옵션레이어 화면에 보이도록 스크롤
-        group_product_layer.scroll_into_view_if_needed(timeout=timeout)
-        logger.debug("그룹 옵션레이어 화면에 보이도록 스크롤 완료")
-        
-        # 그룹 옵션레이어 클릭
-        group_product_layer.tap(timeout=timeout)
+        # nth(0)으로 첫 번째 요소 명시적 선택 (tap이 부착·노출 대기와 스크롤을 함께 처리)
+        self.page.locator(".select-item_option").nth(0).tap(timeout=timeout)
         logger.debug("그룹 옵션레이어 클릭 완료")
 
         #n번쨰 그룹상품 선택
-        group_product = self.page.locator(f"#coreAnchor{n}")
-        
-        # 요소가 나타날 때까지 먼저 대기
-        group_product.wait_for(state="attached", timeout=timeout)
-        logger.debug("n번쨰 그룹상품 DOM에 나타남")
-        
-        # n번쨰 그룹상품 화면에 보이도록 스크롤
-        group_product.scroll_into_view_if_needed(timeout=timeout)
-        logger.debug("n번쨰 그룹상품 화면에 보이도록 스크롤 완료")
-        
-        # n번쨰 그룹상품 클릭
-        group_product.tap(timeout=timeout)
+        self.page.locator(f"#{anchor}").tap(timeout=timeout)
 
         # 선택 버튼 클릭
         self.page.get_by_text("선택", exact=True).nth(0).tap()
@@ -142,7 +131,7 @@ class ProductPage(BasePage):
         Returns:
             Locator 객체
         """
-        logger.debug(f"모듈 찾기: {module_title}")
+        logger.debug("모듈 찾기: %s", module_title)
         if module_title == "이 판매자의 인기상품이에요":
             return self.page.locator("#minishop")
         elif module_title == "BuyBox":
@@ -262,7 +251,7 @@ class ProductPage(BasePage):
             product_locator.tap()
         
         new_page = new_page_info.value
-        logger.debug(f"새 탭 생성됨: {new_page.url}")
+        logger.debug("새 탭 생성됨: %s", new_page.url)
         
         # 새 탭을 포커스로 가져오기 (제어 가능하도록)
         new_page.bring_to_front()
@@ -282,7 +271,7 @@ class ProductPage(BasePage):
         for i in range(max_retries):
             current_url = new_page.url
             if current_url and current_url != "about:blank":
-                logger.debug(f"새 탭 URL 확인됨: {current_url}")
+                logger.debug("새 탭 URL 확인됨: %s", current_url)
                 break
             if i < max_retries - 1:
                 new_page.wait_for_timeout(500)  # 0.5초 대기
@@ -300,7 +289,7 @@ class ProductPage(BasePage):
             goodscode: 상품 번호 (str 또는 int, 앞뒤 공백 제거 후 비교)
         """
         code = str(goodscode).strip()
-        logger.debug(f"URL에 상품 번호 포함 확인: {code}")
+        logger.debug("URL에 상품 번호 포함 확인: %s", code)
         assert code in (url or ""), f"상품 번호 {code}가 URL에 포함되어야 합니다"
 
     def check_ad_item_in_module(self, modulel_title: str) -> str:
@@ -316,28 +305,12 @@ class ProductPage(BasePage):
         Raises:
             ValueError: 알 수 없는 모듈 타이틀인 경우
         """
-        logger.debug(f"모듈 내 광고상품 노출 확인: {modulel_title}")
+        logger.debug("모듈 내 광고상품 노출 확인: %s", modulel_title)
 
-        MODULE_AD_CHECK = {
-            "함께 보면 좋은 상품이에요": "Y",
-            "이 판매자의 인기상품이에요": "N",
-            "함께 구매하면 좋은 상품이에요": "F",
-            "이마트몰VT": "N",
-            "이마트몰BT": "N",
-            "이 브랜드의 인기상품": "N",
-            "점포 행사 상품이에요": "N",
-            "연관상품": "N",
-            "연관상품 상세보기": "N",
-            "연관상품 더보기": "N",
-            "BuyBox": "N",
-            "낮은가격순": "N",
-            "pdpjfy": "F"
-        }
-        
-        if modulel_title not in MODULE_AD_CHECK:
+        if modulel_title not in _PDP_MODULE_AD_CHECK:
             raise ValueError(f"모듈 타이틀 {modulel_title} 확인 불가")
         
-        return MODULE_AD_CHECK[modulel_title]
+        return _PDP_MODULE_AD_CHECK[modulel_title]
 
     def check_ad_tag_in_product(self, product_locator: Locator) -> str:
         """
@@ -349,7 +322,7 @@ class ProductPage(BasePage):
         Returns:
             "Y", "N"(광고 상품 여부)
         """
-        logger.debug(f"상품 내 광고 태그 노출 확인: {product_locator}")
+        logger.debug("상품 내 광고 태그 노출 확인: %s", product_locator)
         
         product_locator = product_locator.locator("xpath=..")
         
@@ -381,7 +354,7 @@ class ProductPage(BasePage):
         """
         레이어가 출력되었는지 확인
         """
-        logger.debug(f"레이어 출력 여부 확인: {module_title}")
+        logger.debug("레이어 출력 여부 확인: %s", module_title)
         if module_title == "장바구니":
             layer = self.page.locator("#layer_mycart")
         else:
@@ -402,7 +375,7 @@ class ProductPage(BasePage):
             cnt: 옵션 번호 (1부터 시작)
             option_text: 입력할 옵션 텍스트
         """
-        logger.debug(f"옵션 입력: {cnt} - {option_text}")
+        logger.debug("옵션 입력: %s - %s", cnt, option_text)
         option_selector = locator.locator(".box__form-control.box__form-motion").nth(cnt).locator("input")
         option_selector.fill(option_text)
         logger.info("옵션 입력 완료")
@@ -418,7 +391,7 @@ class ProductPage(BasePage):
             True: 텍스트 입력 옵션 있음
             False: 텍스트 입력 옵션 없음
         """
-        logger.debug(f"텍스트 입력 옵션 있는지 확인: {cnt}")
+        logger.debug("텍스트 입력 옵션 있는지 확인: %s", cnt)
         option_box = locator.locator(".box__form-control.box__form-motion").nth(cnt)
         if option_box.count() > 0:
             logger.info(f"{cnt}번 텍스트 입력 옵션 있음")
@@ -436,7 +409,7 @@ class ProductPage(BasePage):
             option_value: 선택할 옵션 값
         """
 
-        logger.debug(f"셀렉트 박스 옵션 선택: {cnt}")
+        logger.debug("셀렉트 박스 옵션 선택: %s", cnt)
         
         button = locator.locator(".button__select.sprite").nth(cnt)
         is_expanded = button.get_attribute("aria-expanded")
@@ -461,7 +434,7 @@ class ProductPage(BasePage):
             True: 셀렉트 박스 옵션 있음
             False: 셀렉트 박스 옵션 없음
         """
-        logger.debug(f"셀렉트 박스 옵션 있는지 확인: {cnt}")
+        logger.debug("셀렉트 박스 옵션 있는지 확인: %s", cnt)
         option_box = locator.locator(".button__select.sprite").nth(cnt)
         if option_box.count() > 0:
             logger.info(f"{cnt}번 셀렉트 박스 옵션 있음")
@@ -495,10 +468,10 @@ class ProductPage(BasePage):
             cnt: 몇 번째 요소인지 (기본값: 0)
         """
         timeout = timeout or self.timeout
-        logger.debug(f"텍스트 기반 클릭: text={text}")
+        logger.debug("텍스트 기반 클릭: text=%s", text)
         try:
             self.get_by_text(text, exact=exact).nth(cnt).tap(timeout=timeout)
-            logger.debug(f"텍스트 기반 클릭 성공: text={text}")
+            logger.debug("텍스트 기반 클릭 성공: text=%s", text)
         except Exception as e:
             logger.warning(f"텍스트 기반 클릭 실패하였으나 계속 진행: text={text}, error={e}")
 
@@ -9,6 +9,39 @@ from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# 모듈 타이틀별 광고상품 여부 ("Y"/"N", "F"는 상품별 광고 태그 확인 필요)
+_SRP_LP_MODULE_AD_CHECK = {
+    "0번 구좌": "Y",
+    "장바구니 모듈": "F",
+    "카탈로그 모듈": "N",
+    "오늘의 슈퍼딜": "N",
+    "오늘의 프라임상품": "Y",
+    "인기 상품이에요": "N",
+    "일반상품": "F",
+    "스타배송": "N",
+    "4.5 이상": "N",
+    "백화점 브랜드": "N",
+    "브랜드 인기상품": "N",
+    "대체검색어": "N",
+    "MD's Pick": "N",
+    "먼저 둘러보세요": "Y",
+    "오늘의 상품이에요": "Y",
+    "최상단 클릭아이템": "N",
+    "주문내역": "N",
+    "G마켓 인기 상품": "N",
+    "백화점픽": "N",
+    "연관키워드": "Y",
+    "최하단캐러셀": "Y",
+    "카탈로그 그룹형" : "N",
+    "카탈로그 일반형" : "N",
+    "카탈로그 속성형" : "N",
+    "판매 인기순" : "N",
+    "상품평 많은순" : "N",
+    "신규 상품순" : "N",
+    "장바구니VT" : "F",
+    "반복구매" : "N"
+}
+
 
 class SearchPage(BasePage):
     def __init__(self, page: Page):
@@ -26,7 +59,7 @@ class SearchPage(BasePage):
         :param (str) keyword : 검색어
         :example:
         """
-        logger.debug(f'검색 시작: keyword={keyword}')
+        logger.debug('검색 시작: keyword=%s', keyword)
         self.page.fill("input[name='keyword']", keyword)
         self.page.press("input[name='keyword']", "Enter")
         logger.info(f'검색 완료: keyword={keyword}')
@@ -38,7 +71,7 @@ class SearchPage(BasePage):
         :return: 해당 모듈 element
         :example:
         """
-        logger.debug(f'모듈 검색 시작: module_title={module_title}')
+        logger.debug('모듈 검색 시작: module_title=%s', module_title)
         child = self.page.get_by_text(module_title, exact=True)
         child.scroll_into_view_if_needed()
         parent = child.locator("xpath=../../..")
@@ -56,7 +89,7 @@ class SearchPage(BasePage):
         :return: 해당 모듈 노출 상품 번호
         :example:
         """
-        logger.debug(f'모듈 내 상품 노출 확인 시작: module_title={module_title}')
+        logger.debug('모듈 내 상품 노출 확인 시작: module_title=%s', module_title)
         child = self.page.get_by_text(module_title, exact=True)
         parent = child.locator("xpath=../..")
         target = parent.locator("div.box__item-container > div.box__image > a")
@@ -81,7 +114,7 @@ class SearchPage(BasePage):
                 "coupon_price": "13290"    # 쿠폰적용가 (URL에서 추출)
             }
         """
-        logger.debug(f'가격 정보 추출 시작: goodscode={goodscode}')
+        logger.debug('가격 정보 추출 시작: goodscode=%s', goodscode)
         price_info = {}
         
         try:
@@ -100,7 +133,7 @@ class SearchPage(BasePage):
                     original_price_text = original_price_elem.inner_text().strip()
                     # 쉼표 제거
                     price_info['origin_price'] = original_price_text.replace(',', '').replace('원', '').strip()
-                    logger.debug(f'원가 추출: {price_info["origin_price"]}')
+                    logger.debug('원가 추출: %s', price_info["origin_price"])
             except Exception as e:
                 logger.warning(f'원가 추출 실패: {e}')
             
@@ -111,7 +144,7 @@ class SearchPage(BasePage):
                     seller_price_text = seller_price_elem.inner_text().strip()
                     # 쉼표 제거
                     price_info['seller_price'] = seller_price_text.replace(',', '').replace('원', '').strip()
-                    logger.debug(f'판매가 추출: {price_info["seller_price"]}')
+                    logger.debug('판매가 추출: %s', price_info["seller_price"])
             except Exception as e:
                 logger.warning(f'판매가 추출 실패: {e}')
             
@@ -122,7 +155,7 @@ class SearchPage(BasePage):
                     discount_rate_text = discount_rate_elem.inner_text().strip()
                     # % 제거
                     price_info['discount_rate'] = discount_rate_text.replace('%', '').strip()
-                    logger.debug(f'할인률 추출: {price_info["discount_rate"]}')
+                    logger.debug('할인률 추출: %s', price_info["discount_rate"])
             except Exception as e:
                 logger.warning(f'할인률 추출 실패: {e}')
             
@@ -139,7 +172,7 @@ class SearchPage(BasePage):
                     
                     # utparam-url 파라미터 추출
                     if 'utparam-url' in query_params:
-                        utparam_url = query_params['utparam-url'][0]
+                        utparam_url = query_params['utparam-url']
                         # URL 디코딩 (BasePage의 헬퍼 메서드 사용)
                         decoded_utparam = self.decode_url(utparam_url)
                         
@@ -150,15 +183,15 @@ class SearchPage(BasePage):
                             # 가격 정보 추출
                             if 'origin_price' in utparam_data:
                                 price_info['origin_price_url'] = str(utparam_data['origin_price'])
-                                logger.debug(f'URL에서 원가 추출: {price_info["origin_price_url"]}')
+                                logger.debug('URL에서 원가 추출: %s', price_info["origin_price_url"])
                             
                             if 'promotion_price' in utparam_data:
                                 price_info['promotion_price'] = str(utparam_data['promotion_price'])
-                                logger.debug(f'프로모션가 추출: {price_info["promotion_price"]}')
+                                logger.debug('프로모션가 추출: %s', price_info["promotion_price"])
                             
                             if 'coupon_price' in utparam_data:
                                 price_info['coupon_price'] = str(utparam_data['coupon_price'])
-                                logger.debug(f'쿠폰적용가 추출: {price_info["coupon_price"]}')
+                                logger.debug('쿠폰적용가 추출: %s', price_info["coupon_price"])
                                 
                         except json.JSONDecodeError as e:
                             logger.warning(f'utparam-url JSON 파싱 실패: {e}')
@@ -169,7 +202,7 @@ class SearchPage(BasePage):
             # origin_price가 HTML에서 추출되지 않았고 URL에서 추출된 경우, origin_price_url을 origin_price로 사용
             if 'origin_price' not in price_info and 'origin_price_url' in price_info:
                 price_info['origin_price'] = price_info.pop('origin_price_url')
-                logger.debug(f'URL에서 추출한 원가를 origin_price로 사용: {price_info["origin_price"]}')
+                logger.debug('URL에서 추출한 원가를 origin_price로 사용: %s', price_info["origin_price"])
             
             logger.info(f'가격 정보 추출 완료: goodscode={goodscode}, price_info={price_info}')
             
@@ -185,8 +218,8 @@ class SearchPage(BasePage):
         :return (str) url: 클릭한 상품 url
         :example:
         """
-        logger.debug(f'상품 클릭 시작: goodscode={goodscode}')
-        element = self.page.locator(f'a[data-montelena-goodscode="{goodscode}"]').nth(0)
+        logger.debug('상품 클릭 시작: goodscode=%s', goodscode)
+        element = self.page.locator(f'a[data-montelena-goodscode="{goodscode}"]').first
         # 새 페이지 대기
         time.sleep(5)
         with self.page.context.expect_page() as new_page_info:
@@ -196,17 +229,17 @@ class SearchPage(BasePage):
         # 새 페이지가 완전히 로드될 때까지 대기 (네트워크 요청이 완료될 때까지)
         try:
             new_page.wait_for_load_state('networkidle', timeout=5000)
-            logger.debug(f'새 페이지 네트워크 로딩 완료: {goodscode}')
+            logger.debug('새 페이지 네트워크 로딩 완료: %s', goodscode)
         except Exception as e:
             # networkidle이 타임아웃되면 load 상태만 확인
-            logger.debug(f'networkidle 대기 실패, load 상태로 대기: {e}')
+            logger.debug('networkidle 대기 실패, load 상태로 대기: %s', e)
             new_page.wait_for_load_state('load', timeout=30000)
-            logger.debug(f'새 페이지 로딩 완료: {goodscode}')
+            logger.debug('새 페이지 로딩 완료: %s', goodscode)
         
         url = new_page.url
         logger.info(f'상품 클릭 완료: goodscode={goodscode}')
 
-        logger.debug(f'상품 이동 확인 시작: goodscode={goodscode}')
+        logger.debug('상품 이동 확인 시작: goodscode=%s', goodscode)
         assert goodscode in url, f"상품 번호 {goodscode}가 URL에 포함되어야 합니다"
         logger.info(f'상품 이동 확인 완료: goodscode={goodscode}, url={url}')
 
@@ -222,7 +255,7 @@ class SearchPage(BasePage):
             div.scroll_into_view_if_needed()
             if idx % 2 == 0:  # 짝수 번째
                 if has_ads:
-                    logger.debug(f"{idx}번째 div: 광고 레이어 존재 (정상)")
+                    logger.debug("%s번째 div: 광고 레이어 존재 (정상)", idx)
                 else:
                     logger.error(f"{idx}번째 div: 광고 레이어 없음 (오류)")
                     raise AssertionError(f"{idx}번째 div에 광고 레이어가 없습니다")
@@ -231,7 +264,7 @@ class SearchPage(BasePage):
                     logger.error(f"{idx}번째 div: 광고 레이어가 있으면 안 됨 (오류)")
                     raise AssertionError(f"{idx}번째 div에 광고 레이어가 있어서는 안 됩니다")
                 else:
-                    logger.debug(f"{idx}번째 div: 광고 레이어 없음 (정상)")
+                    logger.debug("%s번째 div: 광고 레이어 없음 (정상)", idx)
         logger.info('일반상품 광고상품 비율 확인 완료 (10개 검증)')
 
 
@@ -250,7 +283,7 @@ class SearchPage(BasePage):
         for idx, div in enumerate(container_divs[:10], start=1):
             if div.locator("div.box__ads-layer").count() > 0:
                 first_div_with_ads = div
-                logger.debug(f"{idx}번째 div에 box__ads-layer 발견")
+                logger.debug("%s번째 div에 box__ads-layer 발견", idx)
                 break  # 첫 번째 div만 찾고 루프 종료
 
         if first_div_with_ads:
@@ -274,7 +307,7 @@ class SearchPage(BasePage):
 
     def verify_keyword_element_exists(self, keyword: str) -> None:
         """span.box__text-field 내 검색어 열기 버튼이 보이고, 그 텍스트에 keyword가 포함되는지 검증 (대소문자 무시)"""
-        logger.debug(f"검색어 입력 영역에 '{keyword}' 포함 여부 검증")
+        logger.debug("검색어 입력 영역에 '%s' 포함 여부 검증", keyword)
         locator = self.page.locator('.box__text-field button.form__input').first
         expect(locator).to_be_visible()
         expect(locator).to_contain_text(re.compile(re.escape(keyword), re.IGNORECASE))
@@ -298,7 +331,7 @@ class SearchPage(BasePage):
             
             new_page = new_page_info.value
             if new_page:
-                logger.debug(f"새 탭 생성됨: {new_page.url}")
+                logger.debug("새 탭 생성됨: %s", new_page.url)
                 
                 # 새 탭을 포커스로 가져오기 (제어 가능하도록)
                 new_page.bring_to_front()
@@ -317,7 +350,7 @@ class SearchPage(BasePage):
                 for i in range(max_retries):
                     current_url = new_page.url
                     if current_url and current_url != "about:blank":
-                        logger.debug(f"새 탭 URL 확인됨: {current_url}")
+                        logger.debug("새 탭 URL 확인됨: %s", current_url)
                         break
                     if i < max_retries - 1:
                         new_page.wait_for_timeout(500)  # 0.5초 대기
@@ -349,7 +382,7 @@ class SearchPage(BasePage):
             Locator 객체
         """
         timeout = timeout or self.timeout
-        logger.debug(f"모듈 찾기 (표시 대기): {module_title}")
+        logger.debug("모듈 찾기 (표시 대기): %s", module_title)
         
         def wait_and_return(loc: Locator) -> Locator:
             loc.wait_for(state="visible", timeout=3000)
@@ -484,9 +517,9 @@ class SearchPage(BasePage):
             }
         """)
         overlap = self._viewport_intersection_ratio(locator)
-        logger.debug(f"{name} bounding_box={box}")
-        logger.debug(f"{name} client_rect={rect}")
-        logger.debug(f"{name} viewport_intersection_ratio={overlap}")
+        logger.debug("%s bounding_box=%s", name, box)
+        logger.debug("%s client_rect=%s", name, rect)
+        logger.debug("%s viewport_intersection_ratio=%s", name, overlap)
 
     def click_add_to_cart_button(self, module_locator: Locator, goodscode: str):
         target = module_locator.locator(
@@ -498,7 +531,7 @@ class SearchPage(BasePage):
             expect(target).to_be_in_viewport(timeout=3000)
             target.tap(trial=True, timeout=2000)
             target.tap(timeout=5000)
-            logger.debug(f"장바구니 버튼 1차 탭 성공: goodscode={goodscode}")
+            logger.debug("장바구니 버튼 1차 탭 성공: goodscode=%s", goodscode)
             return
         except Exception as e:
             # Playwright call log가 수백 줄로 붙음 — 필요 시에만 전체 예외 로그
@@ -543,10 +576,10 @@ class SearchPage(BasePage):
         Returns:
             장바구니 담기 버튼이 존재하고 클릭 가능하면 True
         """
-        logger.debug(f"장바구니 담기 버튼 클릭 가능 여부 확인: {goodscode}")
+        logger.debug("장바구니 담기 버튼 클릭 가능 여부 확인: %s", goodscode)
         button = module_locator.locator(f'.button__cart[data-montelena-goodscode="{goodscode}"]')
         if button.count() == 0:
-            logger.debug(f"장바구니 담기 버튼 없음: {goodscode}")
+            logger.debug("장바구니 담기 버튼 없음: %s", goodscode)
             return False
         try:
             target = module_locator.locator(f'.button__cart[data-montelena-goodscode="{goodscode}"]').first
@@ -554,7 +587,7 @@ class SearchPage(BasePage):
                 target.scroll_into_view_if_needed()
             return target.is_visible() and target.is_enabled()
         except Exception as e:
-            logger.debug(f"장바구니 담기 버튼 클릭 가능 여부 확인 실패: {goodscode}, {e}")
+            logger.debug("장바구니 담기 버튼 클릭 가능 여부 확인 실패: %s, %s", goodscode, e)
             return False
     
     
@@ -583,7 +616,7 @@ class SearchPage(BasePage):
             raise
 
         current_url = self.page.url
-        logger.debug(f"이동 완료 URL: {current_url}")
+        logger.debug("이동 완료 URL: %s", current_url)
         return self.page
     
     def verify_product_code_in_url(self, url: str, goodscode: str) -> None:
@@ -595,7 +628,7 @@ class SearchPage(BasePage):
             goodscode: 상품 번호 (str 또는 int, 앞뒤 공백 제거 후 비교)
         """
         code = str(goodscode).strip()
-        logger.debug(f"URL에 상품 번호 포함 확인: {code}")
+        logger.debug("URL에 상품 번호 포함 확인: %s", code)
         assert code in url, f"상품 번호 {code}가 URL에 포함되어야 합니다"
 
     def go_to_top_search_module_page(self, keyword: str, goodscode: str):
@@ -621,44 +654,12 @@ class SearchPage(BasePage):
         Raises:
             ValueError: 알 수 없는 모듈 타이틀인 경우
         """
-        logger.debug(f"SRP/LP 모듈 내 광고상품 노출 확인: {modulel_title}")
-
-        MODULE_AD_CHECK = {
-            "0번 구좌": "Y",
-            "장바구니 모듈": "F",
-            "카탈로그 모듈": "N",
-            "오늘의 슈퍼딜": "N",
-            "오늘의 프라임상품": "Y",
-            "인기 상품이에요": "N",
-            "일반상품": "F",
-            "스타배송": "N",
-            "4.5 이상": "N",
-            "백화점 브랜드": "N",
-            "브랜드 인기상품": "N",
-            "대체검색어": "N",
-            "MD's Pick": "N",
-            "먼저 둘러보세요": "Y",
-            "오늘의 상품이에요": "Y",
-            "최상단 클릭아이템": "N",
-            "주문내역": "N",
-            "G마켓 인기 상품": "N",
-            "백화점픽": "N",
-            "연관키워드": "Y",
-            "최하단캐러셀": "Y",
-            "카탈로그 그룹형" : "N",
-            "카탈로그 일반형" : "N",
-            "카탈로그 속성형" : "N",
-            "판매 인기순" : "N",
-            "상품평 많은순" : "N",
-            "신규 상품순" : "N",
-            "장바구니VT" : "F",
-            "반복구매" : "N"
-        }
-        
-        if modulel_title not in MODULE_AD_CHECK:
+        logger.debug("SRP/LP 모듈 내 광고상품 노출 확인: %s", modulel_title)
+
+        if modulel_title not in _SRP_LP_MODULE_AD_CHECK:
             raise ValueError(f"모듈 타이틀 {modulel_title} 확인 불가")
         
-        return MODULE_AD_CHECK[modulel_title]
+        return _SRP_LP_MODULE_AD_CHECK[modulel_title]
 
     def check_ad_tag_in_srp_lp_product(self, product_locator: Locator) -> str:
         """
@@ -670,15 +671,11 @@ class SearchPage(BasePage):
         Returns:
             "Y", "N"(광고 상품 여부)
         """
-        logger.debug(f"SRP/LP 상품 내 광고 태그 노출 확인: {product_locator}")
+        logger.debug("SRP/LP 상품 내 광고 태그 노출 확인: %s", product_locator)
         
         try:
-            # 상품 요소의 조상 요소에서 div.box__ads-layer 찾기
-            item_container = product_locator.locator("xpath=ancestor::div[contains(@class, 'box__item-container')]")
-            ads_layer = item_container.locator("div.box__ads-layer")
-            ads_icon_ad = product_locator.locator("span.icon__ad")
-
-            if ads_layer.count() > 0 or ads_icon_ad.count() > 0:
+            # 상품 요소의 조상 상품 카드에서 div.box__ads-layer, 없으면 상품 내 광고 아이콘 확인
+            if self.has_ad_layer(product_locator) or product_locator.locator("span.icon__ad").count() > 0:
                 logger.debug("광고 태그 발견: Y")
                 return "Y"
             logger.debug("광고 태그 없음: N")
@@ -705,7 +702,7 @@ class SearchPage(BasePage):
         Args:
             sort_option: 선택할 정렬 옵션 텍스트 (예: 판매 인기순)
         """
-        logger.debug(f"정렬 선택: {sort_option}")
+        logger.debug("정렬 선택: %s", sort_option)
         sort_button = self.page.locator("button#sorting, button.button__sorting").first
         sort_button.wait_for(state="visible", timeout=10000)
         sort_button.scroll_into_view_if_needed()
@@ -738,7 +735,7 @@ class SearchPage(BasePage):
             ValueError: 알 수 없는 filter_name인 경우
         """
         idx = max(int(nth) - 1, 0)
-        logger.debug(f"필터 선택: {filter_name}, nth={nth} (index={idx})")
+        logger.debug("필터 선택: %s, nth=%s (index=%s)", filter_name, nth, idx)
         if filter_name == "미니 필터":
             filter_button = self.page.locator(".list__mini-filter button.button__filter").nth(idx)
         elif filter_name == "다이나믹 필터":
@@ -764,7 +761,7 @@ class SearchPage(BasePage):
         Raises:
             ValueError: 카드가 없거나 특정 카드에서 숫자를 파싱할 수 없을 때
         """
-        logger.debug(f"검색 결과 상품평 수 수집 시작 (max_items={max_items})")
+        logger.debug("검색 결과 상품평 수 수집 시작 (max_items=%s)", max_items)
         # DOM 변형 대응:
         # 1) 카드 컨테이너 기반 수집 시도
         # 2) 실패 시 .box__score-awards.sprite .text__num 직접 수집으로 폴백
@@ -820,7 +817,7 @@ class SearchPage(BasePage):
         Raises:
             ValueError: 카드/상품코드 요소가 없거나 파싱 실패 시
         """
-        logger.debug(f"검색 결과 goodscode 수집 시작 (max_items={max_items})")
+        logger.debug("검색 결과 goodscode 수집 시작 (max_items=%s)", max_items)
 
         cards = self.page.locator("div.box__itemcard")
         total_cards = cards.count()
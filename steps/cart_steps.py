@@ -164,14 +164,12 @@ def clicks_product_in_cart_module(browser_session, module_title, bdd_context):
         
         # 모듈 내 상품 찾기
         parent = cart_page.get_module_parent(module, 2)
-        product = cart_page.get_product_in_module(parent)
+        # 상품 Locator·상품 코드·광고 태그 여부를 한 번에 조회
+        product, goodscode, product_is_ad = cart_page.inspect_first_product_in_module(parent)
         cart_page.scroll_product_into_view(product)
-        
-        # 상품 코드 가져오기
-        goodscode = cart_page.get_product_code(product)
 
         if ad_check == "F":
-            is_ad = cart_page.check_ad_tag_in_product(product)
+            is_ad = product_is_ad
         else:
             is_ad =ad_check
         
@@ -230,7 +228,15 @@ def clicks_cart_button_in_module(browser_session, bdd_context):
     try:
         cart_page = CartPage(browser_session.page)
         goodscode = bdd_context.store['goodscode']
-        cart_page.click_cart_button_in_module(goodscode)
+        tracker = bdd_context.get('tracker')
+        if tracker is not None:
+            # 탭 이전 ATC 로그 수 (장바구니 담기 확인 스텝에서 이후 수신된 로그만 인정)
+            bdd_context.store['atc_log_baseline'] = len(tracker.get_product_atc_click_logs_by_goodscode(goodscode))
+        # 트래커가 없으면 탭과 함께 ATC 비콘 요청을 대기 (트래커가 있으면 장바구니 담기 확인 스텝에서 로그로 대기)
+        bdd_context.store['cart_button_locator'] = cart_page.click_cart_button_in_module(
+            goodscode,
+            wait_atc_beacon=tracker is None,
+        )
     except Exception as e:
         logger.error("모듈 내 장바구니 버튼 클릭 실패: %s", e, exc_info=True)
         record_frontend_failure(browser_session, bdd_context, f"모듈 내 장바구니 버튼 클릭 실패: {e}", "모듈 내 장바구니 버튼 클릭")
@@ -245,7 +251,12 @@ def cart_added_successfully(browser_session, bdd_context):
     try:
         cart_page = CartPage(browser_session.page)
         goodscode = bdd_context.store['goodscode']
-        cart_page.check_cart_added(goodscode)
+        cart_page.check_cart_added(
+            goodscode,
+            button_locator=bdd_context.store.get('cart_button_locator'),
+            tracker=bdd_context.get('tracker'),
+            atc_log_baseline=bdd_context.store.get('atc_log_baseline', 0),
+        )
     except Exception as e:
         logger.error("장바구니 담기 완료 확인 실패: %s", e, exc_info=True)
         record_frontend_failure(browser_session, bdd_context, f"장바구니 담기 완료 확인 실패: {e}", "장바구니 담기 완료되었다")
\ No newline at end of file
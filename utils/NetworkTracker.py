@@ -3,6 +3,7 @@ import json
 import time
 import logging
 import copy
+import threading
 from urllib.parse import unquote, urlparse, parse_qs
 from typing import Dict, List, Optional, Any, Tuple
 from playwright.sync_api import Page, Request, BrowserContext
@@ -46,6 +47,10 @@ class NetworkTracker:
         self.tracked_pages: List[Page] = [page]  # 추적 중인 페이지 목록
         self.logs: List[Dict[str, Any]] = []
         self.is_tracking = False
+        # goodscode별 PDP PV 수신 신호 (wait_until_pdp_pv_collected 대기 중에만 등록)
+        self._pdp_pv_waiters: Dict[str, threading.Event] = {}
+        # goodscode별 (Product ATC Click 수신 신호, 탭 이전 로그 수) (CartPage.check_cart_added 대기 중에만 등록)
+        self._atc_click_waiters: Dict[str, Tuple[threading.Event, int]] = {}
         
         # 타겟 도메인 패턴
         self.domain_pattern = re.compile(r'aplus\.gmarket\.co(\.kr|m)')
@@ -562,6 +567,11 @@ class NetworkTracker:
             self.logs.append(log_entry)
             logger.info(f'{request_type} 요청 감지: {url}')
             
+            if request_type == 'PDP PV' and self._pdp_pv_waiters:
+                self._notify_pdp_pv_waiters()
+            elif request_type == 'Product ATC Click' and self._atc_click_waiters:
+                self._notify_atc_click_waiters()
+            
         except Exception as e:
             # 에러 발생 시에도 트래킹은 계속 진행
             logger.error(f'요청 처리 중 오류 발생: {e}', exc_info=True)
@@ -947,6 +957,69 @@ class NetworkTracker:
         """
         return self.get_logs_by_goodscode(goodscode, 'PDP PV')
     
+    def register_pdp_pv_waiter(self, goodscode: str) -> threading.Event:
+        """
+        goodscode의 PDP PV 로그 수신 시 set되는 Event 등록 (이미 수신된 경우 즉시 set)
+        
+        Args:
+            goodscode: 상품 번호
+        
+        Returns:
+            PDP PV 수신 여부 Event
+        """
+        event = self._pdp_pv_waiters.setdefault(str(goodscode), threading.Event())
+        if self.get_pdp_pv_logs_by_goodscode(goodscode):
+            event.set()
+        return event
+    
+    def unregister_pdp_pv_waiter(self, goodscode: str) -> None:
+        """
+        register_pdp_pv_waiter로 등록한 Event 해제
+        
+        Args:
+            goodscode: 상품 번호
+        """
+        self._pdp_pv_waiters.pop(str(goodscode), None)
+    
+    def _notify_pdp_pv_waiters(self) -> None:
+        """새 PDP PV 로그가 들어오면 대기 중인 goodscode의 Event를 set"""
+        for goodscode, event in self._pdp_pv_waiters.items():
+            if not event.is_set() and self.get_pdp_pv_logs_by_goodscode(goodscode):
+                event.set()
+    
+    def register_atc_click_waiter(self, goodscode: str, baseline_count: int = 0) -> threading.Event:
+        """
+        goodscode의 Product ATC Click 로그가 baseline_count개보다 많아지면 set되는 Event 등록
+        (이미 많은 경우 즉시 set, 같은 상품을 여러 번 담을 때 이전 담기 로그로 통과하지 않도록 탭 이전 로그 수를 지정)
+        
+        Args:
+            goodscode: 상품 번호
+            baseline_count: 탭 이전에 수집된 해당 goodscode의 Product ATC Click 로그 수
+        
+        Returns:
+            Product ATC Click 수신 여부 Event
+        """
+        event = threading.Event()
+        self._atc_click_waiters[str(goodscode)] = (event, baseline_count)
+        if len(self.get_product_atc_click_logs_by_goodscode(goodscode)) > baseline_count:
+            event.set()
+        return event
+    
+    def unregister_atc_click_waiter(self, goodscode: str) -> None:
+        """
+        register_atc_click_waiter로 등록한 Event 해제
+        
+        Args:
+            goodscode: 상품 번호
+        """
+        self._atc_click_waiters.pop(str(goodscode), None)
+    
+    def _notify_atc_click_waiters(self) -> None:
+        """새 Product ATC Click 로그가 들어오면 대기 중인 goodscode의 Event를 set"""
+        for goodscode, (event, baseline_count) in self._atc_click_waiters.items():
+            if not event.is_set() and len(self.get_product_atc_click_logs_by_goodscode(goodscode)) > baseline_count:
+                event.set()
+    
     def get_exposure_logs_by_goodscode(self, goodscode: str) -> List[Dict[str, Any]]:
         """
         goodscode 기준으로 Exposure 로그만 반환
@@ -14,6 +14,16 @@ logger = logging.getLogger(__name__)
 # 페이지 부하·폰트 로딩 시 짧은 타임아웃으로 스크린샷이 자주 실패하므로 여유 있게 둠
 PAGE_SCREENSHOT_TIMEOUT_MS = 10_000
 
+# 실패 스크린샷은 TestRail 업로드용이므로 뷰포트만 JPEG로 저장 (PNG 압축 비용·용량 절감)
+# TESTRAIL_FORCE_PNG=1 이면 기존처럼 PNG로 저장
+if os.getenv("TESTRAIL_FORCE_PNG", "").strip().lower() in ("1", "true", "y", "yes"):
+    SCREENSHOT_EXT = "png"
+    SCREENSHOT_OPTIONS = {"type": "png"}
+else:
+    SCREENSHOT_EXT = "jpg"
+    SCREENSHOT_OPTIONS = {"type": "jpeg", "quality": 60}
+SCREENSHOT_OPTIONS.update(full_page=False, animations="disabled")
+
 
 def capture_frontend_failure_screenshot(browser_session, bdd_context, error_message=None, step_name=None):
     """
@@ -38,9 +48,9 @@ def capture_frontend_failure_screenshot(browser_session, bdd_context, error_mess
                     step_name = bdd_context.get('failed_step_name', 'unknown_step') if hasattr(bdd_context, 'get') else 'unknown_step'
                 safe_step_name = _WIN_FILENAME_FORBIDDEN.sub("_", step_name)
                 safe_step_name = safe_step_name.replace(" ", "_")[:80]
-                screenshot_path = f"screenshots/frontend_fail_{safe_step_name}_{timestamp}.png"
+                screenshot_path = f"screenshots/frontend_fail_{safe_step_name}_{timestamp}.{SCREENSHOT_EXT}"
                 os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
-                page.screenshot(path=screenshot_path, timeout=PAGE_SCREENSHOT_TIMEOUT_MS)
+                page.screenshot(path=screenshot_path, timeout=PAGE_SCREENSHOT_TIMEOUT_MS, **SCREENSHOT_OPTIONS)
                 print(f"[TestRail] 프론트 실패 시점 스크린샷 저장: {screenshot_path}")
                 
                 # bdd_context에 스크린샷 경로 저장
@@ -2,8 +2,10 @@
 G마켓 URL 관리
 환경별 URL 설정을 직접 관리
 """
+import functools
 import json
 import os
+import re
 from typing import Dict
 from pathlib import Path
 
@@ -103,6 +105,7 @@ def _get_my_url() -> str:
     return _env_urls['my']
 
 
+@functools.lru_cache(maxsize=None)
 def base_url() -> str:
     """기본 URL 반환"""
     return _get_base_url()
@@ -138,6 +141,7 @@ def my_url(spm: str = None) -> str:
     return base
 
 
+@functools.lru_cache(maxsize=1024)
 def search_url(keyword: str, spm: str = None) -> str:
     """검색 결과 페이지 URL
     
@@ -158,6 +162,7 @@ def search_url(keyword: str, spm: str = None) -> str:
     return f"{base}?{'&'.join(params)}"
 
 
+@functools.lru_cache(maxsize=1024)
 def product_url(goodscode: str, spm: str = None) -> str:
     """상품 상세 페이지 URL (mweb: base/vi/product/{goodscode})
     
@@ -174,6 +179,7 @@ def product_url(goodscode: str, spm: str = None) -> str:
     return base
 
 
+@functools.lru_cache(maxsize=None)
 def cart_url(spm: str = None) -> str:
     """장바구니 URL 반환 (mweb: 전체 URL)
     
@@ -229,6 +235,19 @@ def order_complete_url(pno: str, spm: str = None) -> str:
     return f"{base}?{'&'.join(params)}#/"
 
 
+def cache_clear() -> None:
+    """환경 URL 및 URL 생성 함수 캐시 초기화 (실행 중 config.json의 environment를 바꾼 경우 호출)"""
+    global _env_urls
+    _env_urls = None
+    for func in (base_url, search_url, product_url, cart_url):
+        func.cache_clear()
+
+
+# 장바구니 담기(ATC) 트래킹 비콘 URL 패턴 (리스트: product.atc.click, PDP: pdp.atc.click)
+# page.expect_request / wait_for_request에 그대로 전달 가능
+ATC_BEACON_URL_PATTERN = re.compile(r"aplus\.gmarket\.co(?:\.kr|m)/.*(?:product|pdp)\.atc\.click", re.IGNORECASE)
+
+
 # 기본 URL 상수 (하위 호환성, 함수 호출)
 BASE_URL = base_url()
 CART_URL = cart_url()